@@ -5,6 +5,7 @@ Provides async chat() and async stream_chat() methods.
 """
 from __future__ import annotations
 
+import re
 from collections.abc import AsyncGenerator
 from typing import TYPE_CHECKING, Any
 
@@ -31,6 +32,11 @@ if TYPE_CHECKING:
     from forge_llm.application.session import ChatSession
     from forge_llm.application.tools import ToolRegistry
 
+# Provider errors that mean the API key was rejected (401, invalid key)
+_AUTH_ERROR_RE = re.compile(
+    r"401|invalid.*key|key.*invalid", re.IGNORECASE | re.DOTALL
+)
+
 
 class AsyncChatAgent:
     """
@@ -104,24 +110,21 @@ class AsyncChatAgent:
         Returns:
             List of tool results
         """
-        results = []
-        for call in tool_calls:
-            if self._tools is None:
-                result = ToolResult(
-                    tool_call_id=call.id,
-                    content="No tools registered",
-                    is_error=True,
-                )
-            elif isinstance(self._tools, list):
-                result = ToolResult(
-                    tool_call_id=call.id,
-                    content="Cannot execute: tools is a list of definitions only",
-                    is_error=True,
-                )
-            else:
-                result = self._tools.execute(call)
-            results.append(result)
-        return results
+        tools = self._tools
+        if tools is None or isinstance(tools, list):
+            error = (
+                "No tools registered"
+                if tools is None
+                else "Cannot execute: tools is a list of definitions only"
+            )
+            return [
+                ToolResult(tool_call_id=call.id, content=error, is_error=True)
+                for call in tool_calls
+            ]
+
+        # Registry dispatch is a dict lookup by tool name
+        execute = tools.execute
+        return [execute(call) for call in tool_calls]
 
     async def chat(
         self,
@@ -142,22 +145,20 @@ class AsyncChatAgent:
         Returns:
             ChatResponse with message, metadata, and token usage
         """
+        # Reject bad input before resolving the provider or touching the session
+        if messages is not None:
+            self._validate_messages(messages)
+        elif session is None:
+            raise InvalidMessageError("No messages to send")
+
         provider = self._get_provider()
 
         # Get messages from session or normalize input
+        msg_list = [] if messages is None else self._normalize_messages(messages)
         if session is not None:
-            if messages is not None:
-                self._validate_messages(messages)
-                msg_list = self._normalize_messages(messages)
-                for msg in msg_list:
-                    session.add_message(msg)
+            for msg in msg_list:
+                session.add_message(msg)
             msg_list = session.messages
-        else:
-            if messages is None:
-                msg_list = []
-            else:
-                self._validate_messages(messages)
-                msg_list = self._normalize_messages(messages)
 
         if not msg_list:
             raise InvalidMessageError("No messages to send")
@@ -191,7 +192,7 @@ class AsyncChatAgent:
             ]
             tool_results = self.execute_tool_calls(tool_calls)
 
-            msg_list.append(response.message)
+            new_msgs = [response.message]
 
             for tr in tool_results:
                 tool_msg = ChatMessage(
@@ -199,9 +200,18 @@ class AsyncChatAgent:
                     content=tr.content,
                     tool_call_id=tr.tool_call_id,
                 )
-                msg_list.append(tool_msg)
-
-            messages_dict = [m.to_dict() for m in msg_list]
+                new_msgs.append(tool_msg)
+
+            # Only the new messages need converting; a fresh list keeps the
+            # payload of the first call intact
+            msg_list.extend(new_msgs)
+            messages_dict = [*messages_dict, *(m.to_dict() for m in new_msgs)]
+            if "idempotency_key" in config_dict:
+                # A different request: it must not be deduplicated to the first
+                config_dict = {
+                    **config_dict,
+                    "idempotency_key": f"{config_dict['idempotency_key']}-tool-results",
+                }
             result = await self._call_provider(provider, messages_dict, config_dict)
             response = self._build_response(result)
 
@@ -213,7 +223,12 @@ class AsyncChatAgent:
     def _validate_messages(self, messages: str | list[ChatMessage]) -> None:
         """Validate messages before sending."""
         if isinstance(messages, str):
-            if not messages or not messages.strip():
+            # Length first (O(1)); isspace() scans without building a
+            # stripped copy, and the text is sent exactly as given
+            limit = self._config.max_message_chars
+            if limit is not None and len(messages) > limit:
+                raise InvalidMessageError(f"Message exceeds {limit} characters")
+            if not messages or messages.isspace():
                 raise InvalidMessageError("Message cannot be empty")
         elif isinstance(messages, list) and not messages:
             raise InvalidMessageError("Message list cannot be empty")
@@ -233,8 +248,7 @@ class AsyncChatAgent:
                 self._config.timeout or 30.0,
             ) from e
         except Exception as e:
-            error_str = str(e).lower()
-            if "401" in error_str or "invalid" in error_str and "key" in error_str:
+            if _AUTH_ERROR_RE.search(str(e)):
                 raise AuthenticationError(
                     self._provider_name,
                     "Invalid or expired API key",
@@ -416,15 +430,7 @@ class AsyncChatAgent:
         )
 
         usage_data = result.get("usage", {})
-        token_usage = (
-            TokenUsage(
-                prompt_tokens=usage_data.get("prompt_tokens", 0),
-                completion_tokens=usage_data.get("completion_tokens", 0),
-                total_tokens=usage_data.get("total_tokens", 0),
-            )
-            if usage_data
-            else None
-        )
+        token_usage = TokenUsage.from_dict(usage_data) if usage_data else None
 
         metadata = ResponseMetadata(
             model=result.get("model", self._model or "unknown"),
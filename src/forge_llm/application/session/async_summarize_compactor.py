@@ -7,9 +7,17 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from forge_llm.application.session.token_estimate import (
+    CHARS_PER_TOKEN,
+    estimate_message_tokens,
+    estimate_tokens,
+)
 from forge_llm.domain.entities import ChatMessage
 
 if TYPE_CHECKING:
@@ -17,6 +25,26 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# First fenced code block in a markdown prompt file
+_CODE_BLOCK_RE = re.compile(r"```(?:\w*)\n(.*?)```", re.DOTALL)
+
+
+@lru_cache(maxsize=32)
+def _read_prompt_file(path: Path, mtime_ns: int) -> str:
+    """
+    Read a prompt file, extracting its first code block if present.
+
+    Cached per (path, mtime_ns), so an edited file is re-read.
+    """
+    content = path.read_text(encoding="utf-8")
+
+    match = _CODE_BLOCK_RE.search(content)
+
+    if match:
+        return match.group(1).strip()
+
+    return content
+
 
 class AsyncSummarizeCompactor:
     """
@@ -46,7 +74,7 @@ class AsyncSummarizeCompactor:
         )
     """
 
-    CHARS_PER_TOKEN = 4
+    CHARS_PER_TOKEN = CHARS_PER_TOKEN  # Same estimate as ChatSession
     DEFAULT_SUMMARY_PROMPT = """Summarize the following conversation concisely.
 Focus on key information, decisions made, and important context.
 Keep the summary brief but preserve essential details.
@@ -109,23 +137,12 @@ Summary:"""
 
     def _load_prompt_from_file(self, file_path: str | Path) -> str:
         """Load prompt from markdown file."""
-        import re
-
         path = Path(file_path)
 
         if not path.exists():
             raise FileNotFoundError(f"Prompt file not found: {path}")
 
-        content = path.read_text(encoding="utf-8")
-
-        # Extract first code block
-        pattern = r"```(?:\w*)\n(.*?)```"
-        match = re.search(pattern, content, re.DOTALL)
-
-        if match:
-            return match.group(1).strip()
-
-        return content
+        return _read_prompt_file(path, path.stat().st_mtime_ns)
 
     async def compact(
         self,
@@ -183,18 +200,7 @@ Summary:"""
         result = list(system_msgs) + [summary_msg] + to_keep
 
         # If still too large, truncate oldest kept messages (not system/summary)
-        while (
-            self._estimate_tokens(result) > target_tokens
-            and len([m for m in result if m.role != "system"]) > 1
-        ):
-            # Find first non-system message (user/assistant) and remove it
-            for i, msg in enumerate(result):
-                if msg.role == "system":
-                    continue
-                result.pop(i)
-                break
-
-        return result
+        return self._drop_oldest(result, target_tokens, min_kept=1)
 
     async def _generate_summary_with_retry(
         self, messages: list[ChatMessage]
@@ -250,20 +256,34 @@ Summary:"""
         self, messages: list[ChatMessage], target_tokens: int
     ) -> list[ChatMessage]:
         """Fallback to simple truncation when summarization fails."""
-        result = list(messages)
+        # Remove oldest non-system messages until under limit; with no
+        # system message the last remaining message is kept
+        has_system = any(m.role == "system" for m in messages)
+        return self._drop_oldest(
+            messages, target_tokens, min_kept=0 if has_system else 1
+        )
+
+    def _drop_oldest(
+        self, messages: list[ChatMessage], target_tokens: int, min_kept: int
+    ) -> list[ChatMessage]:
+        """
+        Drop oldest non-system messages until under target_tokens.
+
+        Stops once only min_kept non-system messages remain. Estimates
+        each message once and evicts from a FIFO queue, keeping a running
+        total instead of re-estimating the list after every removal.
+        """
+        estimates = [self._estimate_message_tokens(m) for m in messages]
+        total = sum(estimates)
 
-        # Remove oldest non-system messages until under limit
-        while self._estimate_tokens(result) > target_tokens and len(result) > 1:
-            # Find first non-system message and remove it
-            for i, msg in enumerate(result):
-                if msg.role != "system":
-                    result.pop(i)
-                    break
-            else:
-                # Only system messages left, can't truncate further
-                break
+        # Eviction queue: indexes of non-system messages, oldest first
+        queue = deque(i for i, m in enumerate(messages) if m.role != "system")
+        cutoff = -1
+        while total > target_tokens and len(queue) > min_kept:
+            cutoff = queue.popleft()
+            total -= estimates[cutoff]
 
-        return result
+        return [m for i, m in enumerate(messages) if i > cutoff or m.role == "system"]
 
     def _format_messages_for_summary(self, messages: list[ChatMessage]) -> str:
         """Format messages as readable conversation."""
@@ -276,10 +296,8 @@ Summary:"""
 
     def _estimate_tokens(self, messages: list[ChatMessage]) -> int:
         """Estimate total tokens."""
-        return sum(self._estimate_message_tokens(m) for m in messages)
+        return estimate_tokens(messages)
 
     def _estimate_message_tokens(self, message: ChatMessage) -> int:
         """Estimate tokens for a message."""
-        base = 4
-        content = len(message.content or "") // self.CHARS_PER_TOKEN
-        return base + content
+        return estimate_message_tokens(message)
@@ -6,8 +6,14 @@ Manages message history, token limits, and context compaction.
 from __future__ import annotations
 
 import uuid
+from array import array
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
+from forge_llm.application.session.token_estimate import (
+    CHARS_PER_TOKEN,
+    estimate_message_tokens,
+)
 from forge_llm.domain import ContextOverflowError
 from forge_llm.domain.entities import ChatMessage
 from forge_llm.infrastructure.logging import LogService
@@ -41,8 +47,8 @@ class ChatSession:
         session.add_response(response)
     """
 
-    # Rough estimate: ~4 characters per token (conservative)
-    CHARS_PER_TOKEN = 4
+    # Rough estimate: ~4 characters per token (see token_estimate)
+    CHARS_PER_TOKEN = CHARS_PER_TOKEN
 
     def __init__(
         self,
@@ -64,14 +70,23 @@ class ChatSession:
         """
         self._session_id = session_id or str(uuid.uuid4())
         self._messages: list[ChatMessage] = []
+        # Per-message token estimates (parallel to _messages, stored as
+        # contiguous C ints rather than boxed objects) and their total
+        self._token_counts = array("q")
+        self._token_count = 0
         self._max_tokens = max_tokens
         self._system_prompt = system_prompt
         self._compactor = compactor
         self._safety_margin = safety_margin
-        self._logger = LogService(__name__)
 
         if system_prompt:
-            self._messages.append(ChatMessage.system(system_prompt))
+            system = ChatMessage.system(system_prompt)
+            self._append(system, self._estimate_message_tokens(system))
+
+    @cached_property
+    def _logger(self) -> LogService:
+        """Session logger, created on first use; empty sessions never log."""
+        return LogService(__name__)
 
     @property
     def session_id(self) -> str:
@@ -111,11 +126,12 @@ class ChatSession:
             ContextOverflowError: If adding message exceeds effective max_tokens
                                   (max_tokens * safety_margin) and no compactor is configured
         """
+        # Estimate once; reused for the overflow check and the running total
+        new_tokens = self._estimate_message_tokens(message)
         effective_max = self.effective_max_tokens
         if effective_max:
             # Check if adding this message would exceed effective limit
-            new_tokens = self._estimate_message_tokens(message)
-            current_tokens = self.estimate_tokens()
+            current_tokens = self._token_count
 
             if current_tokens + new_tokens > effective_max:
                 if self._compactor:
@@ -127,10 +143,10 @@ class ChatSession:
                         max_tokens=effective_max,
                     )
 
-        self._messages.append(message)
+        self._append(message, new_tokens)
 
         # Check again after adding (in case message itself is large)
-        if effective_max and self._compactor and self.estimate_tokens() > effective_max:
+        if effective_max and self._compactor and self._token_count > effective_max:
             self._auto_compact(0)
 
         self._logger.debug(
@@ -145,7 +161,7 @@ class ChatSession:
         assert self._compactor is not None  # Called only when compactor exists
         effective_max = self.effective_max_tokens
         target = effective_max - reserved_tokens if effective_max else 1000
-        self._messages = self._compactor.compact(self._messages, target)
+        self._set_messages(self._compactor.compact(self._messages, target))
         self._logger.debug(
             "Session auto-compacted",
             session_id=self._session_id,
@@ -164,7 +180,7 @@ class ChatSession:
             return
 
         target = target_tokens or self._max_tokens or 1000
-        self._messages = self._compactor.compact(self._messages, target)
+        self._set_messages(self._compactor.compact(self._messages, target))
         self._logger.debug(
             "Session compacted",
             session_id=self._session_id,
@@ -189,9 +205,9 @@ class ChatSession:
             preserve_system: Keep system prompt if True
         """
         if preserve_system and self._system_prompt:
-            self._messages = [ChatMessage.system(self._system_prompt)]
+            self._set_messages([ChatMessage.system(self._system_prompt)])
         else:
-            self._messages = []
+            self._set_messages([])
 
         self._logger.debug(
             "Session cleared",
@@ -199,32 +215,47 @@ class ChatSession:
             preserved_system=preserve_system,
         )
 
+    def _append(self, message: ChatMessage, tokens: int) -> None:
+        """Append a message whose token estimate is already known."""
+        self._messages.append(message)
+        self._token_counts.append(tokens)
+        self._token_count += tokens
+
+    def _set_messages(self, messages: list[ChatMessage]) -> None:
+        """
+        Replace all messages, updating the running token estimate.
+
+        Messages carried over from the current history (e.g. the ones a
+        compactor kept) reuse their cached estimate; only new ones are
+        measured. ids are stable here since the old list is still alive.
+        """
+        known = dict(zip(map(id, self._messages), self._token_counts, strict=True))
+        counts = array(
+            "q",
+            (
+                known[id(m)] if id(m) in known else self._estimate_message_tokens(m)
+                for m in messages
+            ),
+        )
+        self._messages = messages
+        self._token_counts = counts
+        self._token_count = sum(counts)
+
     def estimate_tokens(self) -> int:
         """
         Estimate total token count for all messages.
 
+        Maintained incrementally as messages are added, compacted or
+        cleared, so this does not re-scan the history.
+
         Returns:
             Estimated token count
         """
-        total = 0
-        for msg in self._messages:
-            total += self._estimate_message_tokens(msg)
-        return total
+        return self._token_count
 
     def _estimate_message_tokens(self, message: ChatMessage) -> int:
         """Estimate tokens for a single message."""
-        # Base overhead per message (role, formatting)
-        base_tokens = 4
-
-        content_tokens = 0
-        if message.content:
-            content_tokens = len(message.content) // self.CHARS_PER_TOKEN
-
-        # Add overhead for tool calls
-        if message.tool_calls:
-            content_tokens += 50 * len(message.tool_calls)  # Rough estimate
-
-        return base_tokens + content_tokens
+        return estimate_message_tokens(message)
 
     def to_dict_list(self) -> list[dict[str, Any]]:
         """Convert messages to list of dicts for API calls."""
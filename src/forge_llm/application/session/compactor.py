@@ -5,6 +5,11 @@ Compacts message history to fit within token limits.
 """
 from abc import ABC, abstractmethod
 
+from forge_llm.application.session.token_estimate import (
+    CHARS_PER_TOKEN,
+    estimate_message_tokens,
+    estimate_tokens,
+)
 from forge_llm.domain.entities import ChatMessage
 
 
@@ -38,7 +43,7 @@ class TruncateCompactor(SessionCompactor):
     of the conversation, preserving the system prompt.
     """
 
-    CHARS_PER_TOKEN = 4  # Same estimate as ChatSession
+    CHARS_PER_TOKEN = CHARS_PER_TOKEN  # Same estimate as ChatSession
 
     def compact(
         self,
@@ -59,30 +64,28 @@ class TruncateCompactor(SessionCompactor):
         other_msgs = [m for m in messages if m.role != "system"]
 
         # Start with system messages
-        result = list(system_msgs)
-        current_tokens = self._estimate_tokens(result)
-
-        # Add messages from newest to oldest until we hit limit
-        for msg in reversed(other_msgs):
-            msg_tokens = self._estimate_message_tokens(msg)
-            if current_tokens + msg_tokens <= target_tokens:
-                result.insert(len(system_msgs), msg)
-                current_tokens += msg_tokens
-            else:
+        current_tokens = self._estimate_tokens(system_msgs)
+
+        # Walk from newest to oldest until we hit the limit; only the
+        # cut index is tracked, and the kept tail is taken as one slice
+        cut = len(other_msgs)
+        while cut > 0:
+            msg_tokens = self._estimate_message_tokens(other_msgs[cut - 1])
+            if current_tokens + msg_tokens > target_tokens:
                 break
+            current_tokens += msg_tokens
+            cut -= 1
 
         # Ensure we keep at least the last message
-        if len(result) == len(system_msgs) and other_msgs:
-            result.append(other_msgs[-1])
+        if other_msgs and cut == len(other_msgs):
+            cut -= 1
 
-        return result
+        return [*system_msgs, *other_msgs[cut:]]
 
     def _estimate_tokens(self, messages: list[ChatMessage]) -> int:
         """Estimate total tokens."""
-        return sum(self._estimate_message_tokens(m) for m in messages)
+        return estimate_tokens(messages)
 
     def _estimate_message_tokens(self, message: ChatMessage) -> int:
         """Estimate tokens for a message."""
-        base = 4
-        content = len(message.content or "") // self.CHARS_PER_TOKEN
-        return base + content
+        return estimate_message_tokens(message)
@@ -7,9 +7,15 @@ from __future__ import annotations
 
 import logging
 import time
+from collections import deque
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from forge_llm.application.session.token_estimate import (
+    CHARS_PER_TOKEN,
+    estimate_message_tokens,
+    estimate_tokens,
+)
 from forge_llm.domain.entities import ChatMessage
 
 from .compactor import SessionCompactor
@@ -46,7 +52,7 @@ class SummarizeCompactor(SessionCompactor):
         )
     """
 
-    CHARS_PER_TOKEN = 4
+    CHARS_PER_TOKEN = CHARS_PER_TOKEN  # Same estimate as ChatSession
     DEFAULT_SUMMARY_PROMPT = """Summarize the following conversation concisely.
 Focus on key information, decisions made, and important context.
 Keep the summary brief but preserve essential details.
@@ -181,18 +187,7 @@ Summary:"""
         result = list(system_msgs) + [summary_msg] + to_keep
 
         # If still too large, truncate oldest kept messages (not system/summary)
-        while (
-            self._estimate_tokens(result) > target_tokens
-            and len([m for m in result if m.role != "system"]) > 1
-        ):
-            # Find first non-system message (user/assistant) and remove it
-            for i, msg in enumerate(result):
-                if msg.role == "system":
-                    continue
-                result.pop(i)
-                break
-
-        return result
+        return self._drop_oldest(result, target_tokens, min_kept=1)
 
     def _generate_summary_with_retry(
         self, messages: list[ChatMessage]
@@ -248,20 +243,34 @@ Summary:"""
         self, messages: list[ChatMessage], target_tokens: int
     ) -> list[ChatMessage]:
         """Fallback to simple truncation when summarization fails."""
-        result = list(messages)
+        # Remove oldest non-system messages until under limit; with no
+        # system message the last remaining message is kept
+        has_system = any(m.role == "system" for m in messages)
+        return self._drop_oldest(
+            messages, target_tokens, min_kept=0 if has_system else 1
+        )
+
+    def _drop_oldest(
+        self, messages: list[ChatMessage], target_tokens: int, min_kept: int
+    ) -> list[ChatMessage]:
+        """
+        Drop oldest non-system messages until under target_tokens.
+
+        Stops once only min_kept non-system messages remain. Estimates
+        each message once and evicts from a FIFO queue, keeping a running
+        total instead of re-estimating the list after every removal.
+        """
+        estimates = [self._estimate_message_tokens(m) for m in messages]
+        total = sum(estimates)
 
-        # Remove oldest non-system messages until under limit
-        while self._estimate_tokens(result) > target_tokens and len(result) > 1:
-            # Find first non-system message and remove it
-            for i, msg in enumerate(result):
-                if msg.role != "system":
-                    result.pop(i)
-                    break
-            else:
-                # Only system messages left, can't truncate further
-                break
+        # Eviction queue: indexes of non-system messages, oldest first
+        queue = deque(i for i, m in enumerate(messages) if m.role != "system")
+        cutoff = -1
+        while total > target_tokens and len(queue) > min_kept:
+            cutoff = queue.popleft()
+            total -= estimates[cutoff]
 
-        return result
+        return [m for i, m in enumerate(messages) if i > cutoff or m.role == "system"]
 
     def _format_messages_for_summary(self, messages: list[ChatMessage]) -> str:
         """Format messages as readable conversation."""
@@ -274,10 +283,8 @@ Summary:"""
 
     def _estimate_tokens(self, messages: list[ChatMessage]) -> int:
         """Estimate total tokens."""
-        return sum(self._estimate_message_tokens(m) for m in messages)
+        return estimate_tokens(messages)
 
     def _estimate_message_tokens(self, message: ChatMessage) -> int:
         """Estimate tokens for a message."""
-        base = 4
-        content = len(message.content or "") // self.CHARS_PER_TOKEN
-        return base + content
+        return estimate_message_tokens(message)
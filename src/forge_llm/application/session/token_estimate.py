@@ -0,0 +1,39 @@
+"""
+Token estimation shared by ChatSession and the compactors.
+
+Compactors must measure messages exactly as the session does, or
+compaction cannot bring a session under its own limit.
+"""
+from collections.abc import Iterable
+
+from forge_llm.domain.entities import ChatMessage
+
+# Rough estimate: ~4 characters per token (conservative)
+CHARS_PER_TOKEN = 4
+# Overhead per message (role, formatting)
+MESSAGE_BASE_TOKENS = 4
+# Rough overhead per tool call carried by an assistant message
+TOOL_CALL_TOKENS = 50
+
+
+def estimate_message_tokens(message: ChatMessage) -> int:
+    """Estimate tokens for a single message."""
+    content = message.content
+    content_tokens = 0
+    if content:
+        content_tokens = len(content) // CHARS_PER_TOKEN
+        # Non-ASCII text tokenizes less densely: add a token per 2 extra
+        # UTF-8 bytes. isascii()/encode() run in C, so no per-char loop.
+        if isinstance(content, str) and not content.isascii():
+            extra_bytes = len(content.encode("utf-8")) - len(content)
+            content_tokens += extra_bytes // 2
+
+    if message.tool_calls:
+        content_tokens += TOOL_CALL_TOKENS * len(message.tool_calls)
+
+    return MESSAGE_BASE_TOKENS + content_tokens
+
+
+def estimate_tokens(messages: Iterable[ChatMessage]) -> int:
+    """Estimate total tokens for messages."""
+    return sum(map(estimate_message_tokens, messages))
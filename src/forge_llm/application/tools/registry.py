@@ -6,7 +6,9 @@ Manages tool registration and execution.
 from __future__ import annotations
 
 import inspect
+import weakref
 from collections.abc import Callable
+from types import FunctionType
 from typing import TYPE_CHECKING, Any, Union, get_args, get_origin
 
 from forge_llm.domain.entities import ToolCall, ToolDefinition, ToolResult
@@ -16,6 +18,59 @@ if TYPE_CHECKING:
     from forge_llm.application.ports import IToolPort
 
 
+# Introspection results are cached on plain functions under this
+# attribute; other callables use the weak-keyed table below. Neither
+# keeps a registered callable alive.
+_CACHE_ATTR = "__forge_tool_def__"
+_inspected: weakref.WeakKeyDictionary[
+    Callable[..., Any], tuple[ToolDefinition, inspect.Signature]
+] = weakref.WeakKeyDictionary()
+
+
+def _inspect_callable(
+    func: Callable[..., Any],
+) -> tuple[ToolDefinition, inspect.Signature]:
+    """
+    Build the tool definition and signature for a callable.
+
+    Cached per function object, so registering the same function again
+    (e.g. in every new agent's registry) skips signature introspection.
+    Callers must copy the definition before exposing it.
+    """
+    if isinstance(func, FunctionType):
+        # Keyed by __code__: functools.wraps copies the attribute onto
+        # wrappers, which must not reuse the wrapped function's entry
+        cached = func.__dict__.get(_CACHE_ATTR)
+        if cached is not None and cached[0] is func.__code__:
+            return cached[1], cached[2]
+        definition, signature = _build(func)
+        setattr(func, _CACHE_ATTR, (func.__code__, definition, signature))
+        return definition, signature
+
+    try:
+        return _inspected[func]
+    except KeyError:
+        result = _inspected[func] = _build(func)
+        return result
+    except TypeError:
+        # Unhashable or not weak-referenceable: introspect every time
+        return _build(func)
+
+
+def _build(func: Callable[..., Any]) -> tuple[ToolDefinition, inspect.Signature]:
+    """Introspect func without caching."""
+    return ToolDefinition.from_callable(func), inspect.signature(func)
+
+
+def _copy_schema(value: Any) -> Any:
+    """Copy a JSON schema's dicts and lists; leaves are immutable."""
+    if type(value) is dict:
+        return {key: _copy_schema(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_copy_schema(item) for item in value]
+    return value
+
+
 class CallableTool:
     """
     Wrapper that makes a function implement IToolPort.
@@ -34,8 +89,15 @@ class CallableTool:
 
     def __init__(self, func: Callable[..., Any]) -> None:
         self._func = func
-        self._definition = ToolDefinition.from_callable(func)
-        self._signature = inspect.signature(func)
+        definition, self._signature = _inspect_callable(func)
+        # Own copy: the cached definition is shared by every registration.
+        # Only the parameters schema is mutable (dicts and lists), so it is
+        # rebuilt directly instead of through copy.deepcopy.
+        self._definition = ToolDefinition(
+            name=definition.name,
+            description=definition.description,
+            parameters=_copy_schema(definition.parameters),
+        )
 
     @property
     def definition(self) -> ToolDefinition:
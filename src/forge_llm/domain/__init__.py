@@ -9,6 +9,7 @@ This layer contains:
 from forge_llm.domain.exceptions import (
     AuthenticationError,
     ChatError,
+    CircuitOpenError,
     ContextOverflowError,
     ForgeLLMError,
     InvalidMessageError,
@@ -31,6 +32,7 @@ __all__ = [
     "UnsupportedProviderError",
     "UnsupportedFeatureError",
     "AuthenticationError",
+    "CircuitOpenError",
     "ChatError",
     "InvalidMessageError",
     "RequestTimeoutError",
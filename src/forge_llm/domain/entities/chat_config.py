@@ -19,6 +19,9 @@ class ChatConfig:
         top_p: Nucleus sampling parameter
         stop: Stop sequences
         stream: Whether to stream response
+        idempotency_key: Sent as the Idempotency-Key header so the provider
+            can deduplicate a retried request; reuse the same config for
+            every retry of one logical request
     """
 
     model: str | None = None
@@ -27,6 +30,7 @@ class ChatConfig:
     top_p: float | None = None
     stop: list[str] | None = None
     stream: bool = False
+    idempotency_key: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dict, omitting None values."""
@@ -44,6 +48,8 @@ class ChatConfig:
             result["stop"] = self.stop
         if self.stream:
             result["stream"] = self.stream
+        if self.idempotency_key is not None:
+            result["idempotency_key"] = self.idempotency_key
 
         return result
 
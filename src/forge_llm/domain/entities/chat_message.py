@@ -6,7 +6,8 @@ Per ADR-005, this is a domain entity used for input, history, and output.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
@@ -18,11 +19,14 @@ if TYPE_CHECKING:
     )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChatMessage:
     """
     A message in a conversation.
 
+    Immutable and slotted: messages are accumulated in sessions, so
+    instances carry no per-instance ``__dict__``.
+
     Attributes:
         role: Message role (system, user, assistant, tool)
         content: Message content - string for text-only, list for multimodal
@@ -36,6 +40,24 @@ class ChatMessage:
     name: str | None = None
     tool_calls: list[dict[str, Any]] | None = None
     tool_call_id: str | None = None
+    # Memoized to_dict() form of multimodal content (see to_dict)
+    _content_dicts: list[dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Roles parsed from dicts/JSON are fresh strings; intern them so
+        # every message shares one object per role. Literal comparisons
+        # such as ``role == "system"`` then succeed on the identity check
+        # before any character compare, so no separate role tag is kept.
+        # str subclasses (e.g. a StrEnum role) cannot be interned and are
+        # stored as their plain value; other values are kept as given.
+        role = self.role
+        if type(role) is not str:
+            if not isinstance(role, str):
+                return
+            role = str(role)
+        object.__setattr__(self, "role", sys.intern(role))
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -46,33 +68,45 @@ class ChatMessage:
         Returns:
             Dict with non-None fields only
         """
-        result: dict[str, Any] = {
-            "role": self.role,
-        }
+        content = self.content
+
+        # Fast path: plain text message with no optional fields (the common case)
+        if (
+            type(content) is str
+            and self.name is None
+            and self.tool_calls is None
+            and self.tool_call_id is None
+        ):
+            return {"role": self.role, "content": content}
 
-        if self.content is not None:
-            if isinstance(self.content, str):
-                # Simple string content (backward compatible)
-                result["content"] = self.content
-            elif isinstance(self.content, list):
-                # Multimodal content - convert each block
-                result["content"] = [
+        if isinstance(content, list):
+            # Multimodal content - convert each block once; the message is
+            # immutable, so later calls (one per chat turn) reuse the result.
+            # Callers get copies of the (flat) block dicts, so mutating a
+            # payload never reaches the memo.
+            converted = self._content_dicts
+            if converted is None:
+                converted = [
                     block.to_dict() if hasattr(block, "to_dict") else block
-                    for block in self.content
+                    for block in content
                 ]
-            else:
-                result["content"] = self.content
-
-        if self.name is not None:
-            result["name"] = self.name
-
-        if self.tool_calls is not None:
-            result["tool_calls"] = self.tool_calls
-
-        if self.tool_call_id is not None:
-            result["tool_call_id"] = self.tool_call_id
+                object.__setattr__(self, "_content_dicts", converted)
+            content = [
+                block.copy() if isinstance(block, dict) else block
+                for block in converted
+            ]
 
-        return result
+        return {
+            key: value
+            for key, value in (
+                ("role", self.role),
+                ("content", content),
+                ("name", self.name),
+                ("tool_calls", self.tool_calls),
+                ("tool_call_id", self.tool_call_id),
+            )
+            if value is not None
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ChatMessage:
@@ -137,10 +171,34 @@ class ChatMessage:
             tool_call_id=data.get("tool_call_id"),
         )
 
+    @classmethod
+    def _unchecked(
+        cls,
+        role: Literal["system", "user", "assistant", "tool"],
+        content: str | list[ContentBlock] | None,
+        name: str | None = None,
+        tool_calls: list[dict[str, Any]] | None = None,
+        tool_call_id: str | None = None,
+    ) -> ChatMessage:
+        """
+        Build a message without running __init__/__post_init__.
+
+        Only for the role factories below: their roles are string
+        literals, which are already interned.
+        """
+        self = object.__new__(cls)
+        object.__setattr__(self, "role", role)
+        object.__setattr__(self, "content", content)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "tool_calls", tool_calls)
+        object.__setattr__(self, "tool_call_id", tool_call_id)
+        object.__setattr__(self, "_content_dicts", None)
+        return self
+
     @classmethod
     def user(cls, content: str, name: str | None = None) -> ChatMessage:
         """Create a user message."""
-        return cls(role="user", content=content, name=name)
+        return cls._unchecked("user", content, name=name)
 
     @classmethod
     def assistant(
@@ -149,17 +207,17 @@ class ChatMessage:
         tool_calls: list[dict[str, Any]] | None = None,
     ) -> ChatMessage:
         """Create an assistant message."""
-        return cls(role="assistant", content=content, tool_calls=tool_calls)
+        return cls._unchecked("assistant", content, tool_calls=tool_calls)
 
     @classmethod
     def system(cls, content: str) -> ChatMessage:
         """Create a system message."""
-        return cls(role="system", content=content)
+        return cls._unchecked("system", content)
 
     @classmethod
     def tool(cls, content: str, tool_call_id: str) -> ChatMessage:
         """Create a tool result message."""
-        return cls(role="tool", content=content, tool_call_id=tool_call_id)
+        return cls._unchecked("tool", content, tool_call_id=tool_call_id)
 
     @classmethod
     def user_with_image(
@@ -19,6 +19,8 @@ class ProviderConfig:
         base_url: Base URL for API endpoint (optional, for self-hosted)
         timeout: Request timeout in seconds (default: 60.0)
         max_retries: Maximum retry attempts (default: 3)
+        max_message_chars: Reject string messages longer than this before
+            sending (default: None, no limit); ~4 chars per context token
     """
 
     provider: str
@@ -27,6 +29,7 @@ class ProviderConfig:
     base_url: str | None = None
     timeout: float = 60.0
     max_retries: int = 3
+    max_message_chars: int | None = None
 
     # Providers that don't require API keys
     LOCAL_PROVIDERS = frozenset({"ollama"})
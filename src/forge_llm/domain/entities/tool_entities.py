@@ -11,6 +11,13 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
+try:
+    import orjson
+
+    _loads: Callable[[str | bytes], Any] = orjson.loads
+except ImportError:  # orjson is optional (forge-llm[fast])
+    _loads = json.loads
+
 
 @dataclass
 class ToolDefinition:
@@ -157,9 +164,9 @@ class ToolCall:
         function = tool_call.get("function", {})
         arguments_str = function.get("arguments", "{}")
 
-        # Parse JSON arguments
+        # Parse JSON arguments (orjson.JSONDecodeError subclasses json's)
         try:
-            arguments = json.loads(arguments_str)
+            arguments = _loads(arguments_str)
         except json.JSONDecodeError:
             arguments = {}
 
@@ -4,6 +4,11 @@ Domain Exceptions - Business rule violations and domain errors.
 All domain exceptions inherit from ForgeLLMError for consistent
 error handling across the application.
 """
+import re
+
+# Credentials that may appear in provider error text: OpenAI/Anthropic
+# style secret keys (sk-..., sk-proj-..., sk-ant-...) and bearer tokens
+_API_KEY_RE = re.compile(r"sk-[A-Za-z0-9_-]{10,}|Bearer\s+[A-Za-z0-9._~+/=-]{10,}")
 
 
 class ForgeLLMError(Exception):
@@ -50,12 +55,21 @@ class UnsupportedProviderError(ProviderError):
 
 
 class AuthenticationError(ProviderError):
-    """Authentication failed with provider."""
+    """
+    Authentication failed with provider.
+
+    Credentials in details are redacted here, once, so the stored message
+    is already safe to log or render in tracebacks.
+    """
 
-    def __init__(self, provider: str, details: str | None = None) -> None:
+    def __init__(
+        self, provider: str, details: str | None = None, api_key: str | None = None
+    ) -> None:
         msg = f"Authentication failed for provider '{provider}'"
         if details:
-            msg += f": {details}"
+            if api_key:
+                details = details.replace(api_key, "[REDACTED]")
+            msg += f": {_API_KEY_RE.sub('[REDACTED]', details)}"
         super().__init__(msg, code="AUTHENTICATION_ERROR")
         self.provider = provider
 
@@ -72,6 +86,23 @@ class UnsupportedFeatureError(ProviderError):
         self.provider = provider
 
 
+class CircuitOpenError(ProviderError):
+    """
+    Call rejected because the circuit breaker is open.
+
+    ``retry_after`` is None when the circuit is half-open and its trial
+    calls are still running, so no resume time is known yet.
+    """
+
+    def __init__(self, retry_after: float | None) -> None:
+        if retry_after is None:
+            message = "Circuit breaker is half-open; waiting on a trial call"
+        else:
+            message = f"Circuit breaker is open; calls resume in {retry_after:.1f}s"
+        super().__init__(message, code="CIRCUIT_OPEN")
+        self.retry_after = retry_after
+
+
 # ============================================
 # Chat Errors (VT-01)
 # ============================================
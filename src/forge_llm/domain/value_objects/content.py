@@ -8,12 +8,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Literal
 
+# Audio formats accepted by AudioContent (OpenAI input_audio)
+_AUDIO_FORMATS = frozenset({"wav", "mp3"})
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TextContent:
     """
     Text content block.
 
+    Content blocks are immutable and slotted, like ChatMessage, so
+    histories holding many of them carry no per-instance ``__dict__``.
+
     Usage:
         text = TextContent(text="Hello, world!")
         text.to_openai_format()  # {"type": "text", "text": "Hello, world!"}
@@ -44,7 +50,7 @@ class TextContent:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImageContent:
     """
     Image content block supporting URL and Base64 formats.
@@ -83,6 +89,28 @@ class ImageContent:
             if not self.media_type:
                 raise ValueError("media_type is required when source_type is 'base64'")
 
+    @classmethod
+    def _unchecked(
+        cls,
+        source_type: Literal["url", "base64"],
+        url: str | None = None,
+        data: str | None = None,
+        media_type: str | None = None,
+        detail: Literal["auto", "low", "high"] = "auto",
+    ) -> ImageContent:
+        """
+        Build an instance without running __init__/__post_init__.
+
+        Only for factories that have already validated their arguments.
+        """
+        self = object.__new__(cls)
+        object.__setattr__(self, "source_type", source_type)
+        object.__setattr__(self, "url", url)
+        object.__setattr__(self, "data", data)
+        object.__setattr__(self, "media_type", media_type)
+        object.__setattr__(self, "detail", detail)
+        return self
+
     @classmethod
     def from_url(
         cls,
@@ -90,7 +118,9 @@ class ImageContent:
         detail: Literal["auto", "low", "high"] = "auto",
     ) -> ImageContent:
         """Create ImageContent from URL."""
-        return cls(source_type="url", url=url, detail=detail)
+        if not url:
+            raise ValueError("url is required when source_type is 'url'")
+        return cls._unchecked("url", url=url, detail=detail)
 
     @classmethod
     def from_base64(
@@ -107,11 +137,12 @@ class ImageContent:
             media_type: MIME type (e.g., "image/jpeg", "image/png", "image/gif", "image/webp")
             detail: OpenAI detail level
         """
-        return cls(
-            source_type="base64",
-            data=data,
-            media_type=media_type,
-            detail=detail,
+        if not data:
+            raise ValueError("data is required when source_type is 'base64'")
+        if not media_type:
+            raise ValueError("media_type is required when source_type is 'base64'")
+        return cls._unchecked(
+            "base64", data=data, media_type=media_type, detail=detail
         )
 
     def to_openai_format(self) -> dict[str, Any]:
@@ -180,7 +211,7 @@ class ImageContent:
         return result
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AudioContent:
     """
     Audio content block (Base64 only, OpenAI supported).
@@ -210,9 +241,21 @@ class AudioContent:
         """Validate audio content."""
         if not self.data:
             raise ValueError("data is required for AudioContent")
-        if self.format not in ("wav", "mp3"):
+        if self.format not in _AUDIO_FORMATS:
             raise ValueError("format must be 'wav' or 'mp3'")
 
+    @classmethod
+    def _unchecked(cls, data: str, format: Literal["wav", "mp3"]) -> AudioContent:
+        """
+        Build an instance without running __init__/__post_init__.
+
+        Only for factories that have already validated their arguments.
+        """
+        self = object.__new__(cls)
+        object.__setattr__(self, "data", data)
+        object.__setattr__(self, "format", format)
+        return self
+
     @classmethod
     def from_base64(
         cls,
@@ -226,7 +269,11 @@ class AudioContent:
             data: Base64 encoded audio data
             format: Audio format ("wav" or "mp3")
         """
-        return cls(data=data, format=format)
+        if not data:
+            raise ValueError("data is required for AudioContent")
+        if format not in _AUDIO_FORMATS:
+            raise ValueError("format must be 'wav' or 'mp3'")
+        return cls._unchecked(data, format)
 
     @classmethod
     def from_file(cls, path: str) -> AudioContent:
@@ -240,6 +287,8 @@ class AudioContent:
             AudioContent with Base64 encoded data
         """
         import base64
+        import mmap
+        import os
 
         # Determine format from extension
         if path.lower().endswith(".wav"):
@@ -250,9 +299,14 @@ class AudioContent:
             raise ValueError("Audio file must be .wav or .mp3")
 
         with open(path, "rb") as f:
-            data = base64.b64encode(f.read()).decode()
-
-        return cls(data=data, format=audio_format)
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError("data is required for AudioContent")
+            # Encode straight from a read-only mapping so the raw file is
+            # never copied into a bytes object alongside its encoding
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                data = base64.b64encode(mapped).decode("ascii")
+
+        return cls._unchecked(data, audio_format)
 
     def to_openai_format(self) -> dict[str, Any]:
         """
@@ -42,6 +42,16 @@ class TokenUsage:
             total_tokens=input_tokens + output_tokens,
         )
 
+    @classmethod
+    def from_dict(cls, usage: dict[str, Any]) -> "TokenUsage":
+        """Create from a provider usage dict (missing counts default to 0)."""
+        get = usage.get
+        return cls(
+            get("prompt_tokens", 0),
+            get("completion_tokens", 0),
+            get("total_tokens", 0),
+        )
+
     @classmethod
     def zero(cls) -> "TokenUsage":
         """Create zero usage."""
@@ -105,6 +105,9 @@ class AsyncOpenAIAdapter:
         }
         if tools:
             request_params["tools"] = tools
+        idempotency_key = (config or {}).get("idempotency_key")
+        if idempotency_key:
+            request_params["extra_headers"] = {"Idempotency-Key": idempotency_key}
 
         response = await client.chat.completions.create(**request_params)
 
@@ -9,6 +9,10 @@ from typing import Any
 from forge_llm.domain import ProviderNotConfiguredError
 from forge_llm.domain.entities import ProviderConfig
 
+# Resolved keys by environment variable name. Only found keys are cached,
+# so a key exported after the first lookup is still picked up.
+_key_cache: dict[str, str] = {}
+
 
 def get_api_key(provider: str, env_override: str | None = None) -> str | None:
     """
@@ -21,11 +25,19 @@ def get_api_key(provider: str, env_override: str | None = None) -> str | None:
     Returns:
         API key string or None if not found
     """
-    if env_override:
-        return os.environ.get(env_override)
+    env_key = env_override or f"{provider.upper()}_API_KEY"
+
+    key = _key_cache.get(env_key)
+    if key is None:
+        key = os.environ.get(env_key)
+        if key is not None:
+            _key_cache[env_key] = key
+    return key
+
 
-    env_key = f"{provider.upper()}_API_KEY"
-    return os.environ.get(env_key)
+def reset_auth_cache() -> None:
+    """Clear cached API keys (for testing or after rotating keys)."""
+    _key_cache.clear()
 
 
 def create_config(
@@ -9,8 +9,6 @@ import json
 from collections.abc import Generator
 from typing import Any
 
-import httpx
-
 from forge_llm.domain import ProviderNotConfiguredError
 from forge_llm.domain.entities import ProviderConfig
 from forge_llm.infrastructure.logging import LogService
@@ -81,6 +79,8 @@ class OllamaAdapter:
         Raises:
             ProviderNotConfiguredError: If server is not reachable
         """
+        import httpx
+
         try:
             with httpx.Client(timeout=5.0) as client:
                 response = client.get(f"{self._base_url}/api/tags")
@@ -108,6 +108,8 @@ class OllamaAdapter:
         Returns:
             List of model names available locally
         """
+        import httpx
+
         try:
             with httpx.Client(timeout=10.0) as client:
                 response = client.get(f"{self._base_url}/api/tags")
@@ -148,6 +150,8 @@ class OllamaAdapter:
             "stream": False,
         }
 
+        import httpx
+
         with httpx.Client(timeout=timeout) as client:
             response = client.post(
                 f"{self._base_url}/api/chat",
@@ -201,6 +205,8 @@ class OllamaAdapter:
             "stream": True,
         }
 
+        import httpx
+
         with (
             httpx.Client(timeout=timeout) as client,
             client.stream(
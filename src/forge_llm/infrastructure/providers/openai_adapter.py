@@ -110,6 +110,9 @@ class OpenAIAdapter:
         }
         if tools:
             request_params["tools"] = tools
+        idempotency_key = (config or {}).get("idempotency_key")
+        if idempotency_key:
+            request_params["extra_headers"] = {"Idempotency-Key": idempotency_key}
 
         response = client.chat.completions.create(**request_params)
 
@@ -9,14 +9,12 @@ from __future__ import annotations
 from collections.abc import Generator
 from typing import TYPE_CHECKING, Any
 
-import httpx
-
 from forge_llm.domain import ProviderNotConfiguredError
 from forge_llm.domain.entities import ProviderConfig
 from forge_llm.infrastructure.logging import LogService
 
 if TYPE_CHECKING:
-    pass
+    import httpx
 
 
 class OpenRouterAdapter:
@@ -351,6 +349,8 @@ class OpenRouterAdapter:
     def _get_client(self) -> httpx.Client:
         """Get or create HTTP client."""
         if self._client is None:
+            import httpx
+
             self._client = httpx.Client()
         return self._client
 
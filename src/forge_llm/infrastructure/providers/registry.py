@@ -4,7 +4,8 @@ ProviderRegistry - Specialized registry for LLM provider adapters.
 This registry manages provider adapter factories and instances,
 allowing dynamic registration and resolution of providers.
 """
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any, TypeVar
 
 from forge_llm.application.ports import ILLMProviderPort
@@ -35,6 +36,8 @@ class ProviderRegistry:
     def __init__(self) -> None:
         self._factories: dict[str, ProviderFactory] = {}
         self._instances: dict[str, ILLMProviderPort] = {}
+        # list_providers_with_models() view; rebuilt after registrations change
+        self._models_view: Mapping[str, Mapping[str, Any]] | None = None
         self._logger = LogService(__name__)
 
     def register(self, name: str, factory: ProviderFactory) -> None:
@@ -46,6 +49,7 @@ class ProviderRegistry:
             factory: Factory function or class that creates provider instances
         """
         self._factories[name] = factory
+        self._models_view = None
         self._logger.info("Provider registered", provider=name)
 
     def resolve(self, name: str, config: ProviderConfig) -> ILLMProviderPort:
@@ -96,35 +100,49 @@ class ProviderRegistry:
         Raises:
             UnsupportedProviderError: If provider not registered
         """
-        if name not in self._factories:
+        info = self.list_providers_with_models().get(name)
+        if info is None:
             raise UnsupportedProviderError(name)
 
-        factory = self._factories[name]
-
-        # Get models from adapter class
-        models = getattr(factory, "SUPPORTED_MODELS", [])
-
+        # Mutable copy at the API edge; the cached model tuple stays shared
         return {
             "name": name,
-            "models": list(models),
+            "models": list(info["models"]),
         }
 
-    def list_providers_with_models(self) -> dict[str, dict[str, Any]]:
+    def list_providers_with_models(self) -> Mapping[str, Mapping[str, Any]]:
         """
         List all providers with their supported models.
 
+        Built once and reused until a provider is registered or the
+        registry is cleared, so the result is read-only (models are tuples
+        snapshotted from each adapter's SUPPORTED_MODELS). Use
+        get_provider_info() for a mutable copy of one provider's info.
+
         Returns:
-            Dict mapping provider name to provider info
+            Mapping of provider name to provider info
         """
-        result = {}
-        for name in self._factories:
-            result[name] = self.get_provider_info(name)
-        return result
+        view = self._models_view
+        if view is None:
+            view = MappingProxyType(
+                {
+                    name: MappingProxyType(
+                        {
+                            "name": name,
+                            "models": tuple(getattr(factory, "SUPPORTED_MODELS", ())),
+                        }
+                    )
+                    for name, factory in self._factories.items()
+                }
+            )
+            self._models_view = view
+        return view
 
     def clear(self) -> None:
         """Clear all registrations and instances."""
         self._factories.clear()
         self._instances.clear()
+        self._models_view = None
 
 
 # Singleton instance
@@ -5,12 +5,22 @@ Provides retry decorators with exponential backoff for API calls.
 """
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
-from collections.abc import Callable
+import random
+import re
+import threading
+import time
+from collections.abc import Awaitable, Callable, Coroutine
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from functools import wraps
-from typing import ParamSpec, TypeVar
+from typing import Any, ParamSpec, TypeVar
 
 from tenacity import (
+    RetryCallState,
+    Retrying,
     before_sleep_log,
     retry,
     retry_if_exception_type,
@@ -18,6 +28,8 @@ from tenacity import (
     wait_exponential,
 )
 
+from forge_llm.domain.exceptions import CircuitOpenError
+
 P = ParamSpec("P")
 R = TypeVar("R")
 
@@ -29,6 +41,228 @@ RETRYABLE_EXCEPTIONS = (
     OSError,
 )
 
+# Rate limit wording in provider error messages ("Rate limit exceeded",
+# "rate_limit_exceeded", "Error 429", "Too Many Requests", "Rate exceeded")
+_RATE_LIMIT_RE = re.compile(
+    r"rate[ _-]?(?:limit|exceeded)|\b429\b|too many requests", re.IGNORECASE
+)
+
+
+def _is_rate_limit_error(exc: BaseException) -> bool:
+    """Check if exception is a rate limit error."""
+    # SDK status errors carry the HTTP status; only fall back to the message
+    if getattr(exc, "status_code", None) == 429:
+        return True
+    return _RATE_LIMIT_RE.search(str(exc)) is not None
+
+
+class CircuitBreaker:
+    """
+    Fail fast while a dependency keeps failing.
+
+    - closed: calls pass through; consecutive failures are counted
+    - open: after ``failure_threshold`` consecutive failures, calls raise
+      CircuitOpenError without running for ``reset_timeout`` seconds
+    - half_open: then up to ``half_open_max_calls`` trial calls run; a
+      success closes the circuit, a failure opens it again
+
+    One breaker is meant to be shared by every call to the same
+    dependency; state changes are guarded by a lock.
+
+    Usage:
+        breaker = CircuitBreaker(failure_threshold=5, reset_timeout=10.0)
+
+        @with_retry(circuit_breaker=breaker)
+        def call_api():
+            ...
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 10.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize CircuitBreaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before allowing trial calls
+            half_open_max_calls: Trial calls allowed while half-open
+            clock: Monotonic time source in seconds (injectable for tests)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failure_count = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            if self._state == self.OPEN and self._remaining_open() <= 0:
+                return self.HALF_OPEN
+            return self._state
+
+    @property
+    def failure_count(self) -> int:
+        """Consecutive failures recorded since the last success."""
+        return self._failure_count
+
+    def call(self, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """
+        Run func through the breaker.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (func is not called)
+        """
+        self._before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self._record_failure()
+            raise
+        except BaseException:
+            self._release_trial()
+            raise
+        self._record_success()
+        return result
+
+    def reset(self) -> None:
+        """Close the circuit and clear the failure count."""
+        with self._lock:
+            self._close()
+
+    def _remaining_open(self) -> float:
+        """Seconds left before an open circuit allows trial calls."""
+        return self._opened_at + self.reset_timeout - self._clock()
+
+    def _before_call(self) -> None:
+        """Admit a call or raise CircuitOpenError."""
+        with self._lock:
+            if self._state == self.OPEN:
+                remaining = self._remaining_open()
+                if remaining > 0:
+                    raise CircuitOpenError(remaining)
+                self._state = self.HALF_OPEN
+                self._half_open_calls = 0
+            if self._state == self.HALF_OPEN:
+                if self._half_open_calls >= self.half_open_max_calls:
+                    # Trial slots taken; when calls resume depends on them
+                    raise CircuitOpenError(None)
+                self._half_open_calls += 1
+
+    def _record_success(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _record_failure(self) -> None:
+        with self._lock:
+            self._failure_count += 1
+            if (
+                self._state == self.HALF_OPEN
+                or self._failure_count >= self.failure_threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+
+    def _release_trial(self) -> None:
+        """
+        Give back a half-open trial slot whose call never finished.
+
+        A cancelled or interrupted call says nothing about the dependency,
+        so it counts as neither success nor failure; without this the
+        slot would stay taken and the breaker would stay half-open.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    def _close(self) -> None:
+        self._state = self.CLOSED
+        self._failure_count = 0
+        self._half_open_calls = 0
+
+
+def _guard(func: Callable[P, R], breaker: CircuitBreaker) -> Callable[P, R]:
+    """Route every call of func (sync or async) through breaker."""
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_guarded(*args: Any, **kwargs: Any) -> Any:
+            breaker._before_call()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception:
+                breaker._record_failure()
+                raise
+            except BaseException:
+                breaker._release_trial()
+                raise
+            breaker._record_success()
+            return result
+
+        return async_guarded  # type: ignore[return-value]
+
+    @wraps(func)
+    def guarded(*args: P.args, **kwargs: P.kwargs) -> R:
+        return breaker.call(func, *args, **kwargs)
+
+    return guarded
+
+
+def _jittered_exponential(
+    multiplier: float, min_wait: float, max_wait: float
+) -> Callable[[RetryCallState], float]:
+    """
+    Exponential backoff with jitter, as a tenacity wait.
+
+    Each delay is drawn uniformly from [min_wait, exponential step], so
+    callers that failed together don't all retry at the same moment.
+    (tenacity's wait_random_exponential draws from 0, ignoring min_wait.)
+    """
+    step = wait_exponential(multiplier=multiplier, min=min_wait, max=max_wait)
+
+    def wait(retry_state: RetryCallState) -> float:
+        return random.uniform(min_wait, step(retry_state))
+
+    return wait
+
+
+def _retry_options(
+    max_attempts: int,
+    min_wait: float,
+    max_wait: float,
+    multiplier: float,
+    retryable_exceptions: tuple[type[Exception], ...] | None,
+    logger: logging.Logger | None,
+    sleeper: Callable[[float], Any] | None = None,
+) -> dict[str, Any]:
+    """Build the tenacity arguments shared by the retry decorators."""
+    options: dict[str, Any] = {
+        "stop": stop_after_attempt(max_attempts),
+        "wait": _jittered_exponential(multiplier, min_wait, max_wait),
+        "retry": retry_if_exception_type(retryable_exceptions or RETRYABLE_EXCEPTIONS),
+        "before_sleep": (
+            before_sleep_log(logger, logging.WARNING) if logger else None
+        ),
+        "reraise": True,
+    }
+    if sleeper is not None:
+        options["sleep"] = sleeper
+    return options
+
 
 def with_retry(
     max_attempts: int = 3,
@@ -37,9 +271,11 @@ def with_retry(
     multiplier: float = 2.0,
     retryable_exceptions: tuple[type[Exception], ...] | None = None,
     logger: logging.Logger | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    sleeper: Callable[[float], None] | None = None,
 ) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """
-    Decorator that adds retry with exponential backoff.
+    Decorator that adds retry with jittered exponential backoff.
 
     Args:
         max_attempts: Maximum number of retry attempts (default: 3)
@@ -48,6 +284,11 @@ def with_retry(
         multiplier: Exponential backoff multiplier (default: 2.0)
         retryable_exceptions: Tuple of exception types to retry on
         logger: Optional logger for retry attempts
+        circuit_breaker: Optional breaker checked before every attempt;
+                         once open, calls fail fast with CircuitOpenError
+                         instead of retrying
+        sleeper: Called with each backoff delay in seconds (default:
+                 time.sleep, or asyncio.sleep for coroutine functions)
 
     Returns:
         Decorated function with retry logic
@@ -62,70 +303,172 @@ def with_retry(
         def rate_limited_call():
             ...
     """
-    exceptions = retryable_exceptions or RETRYABLE_EXCEPTIONS
 
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
         retry_decorator = retry(
-            stop=stop_after_attempt(max_attempts),
-            wait=wait_exponential(
-                multiplier=multiplier,
-                min=min_wait,
-                max=max_wait,
-            ),
-            retry=retry_if_exception_type(exceptions),
-            before_sleep=(
-                before_sleep_log(logger, logging.WARNING) if logger else None
-            ),
-            reraise=True,
+            **_retry_options(
+                max_attempts,
+                min_wait,
+                max_wait,
+                multiplier,
+                retryable_exceptions,
+                logger,
+                sleeper,
+            )
         )
-        return retry_decorator(func)
+        if circuit_breaker is not None:
+            func = _guard(func, circuit_breaker)
+        return retry_decorator(func)  # type: ignore[no-any-return]
 
     return decorator
 
 
+def with_retry_async(
+    max_attempts: int = 3,
+    min_wait: float = 1.0,
+    max_wait: float = 60.0,
+    multiplier: float = 2.0,
+    retryable_exceptions: tuple[type[Exception], ...] | None = None,
+    logger: logging.Logger | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    sleeper: Callable[[float], Awaitable[None]] = asyncio.sleep,
+) -> Callable[
+    [Callable[P, Coroutine[Any, Any, R]]], Callable[P, Coroutine[Any, Any, R]]
+]:
+    """
+    Async twin of with_retry for coroutine functions.
+
+    Backoff delays are awaited, so other tasks keep running on the
+    event loop while a call waits to be retried.
+
+    Args:
+        sleeper: Awaited with each backoff delay in seconds
+                 (default: asyncio.sleep)
+
+    The other arguments are the same as for with_retry.
+
+    Raises:
+        TypeError: If the decorated function is not a coroutine function
+
+    Usage:
+        @with_retry_async(max_attempts=5)
+        async def call_api():
+            ...
+    """
+
+    def decorator(
+        func: Callable[P, Coroutine[Any, Any, R]],
+    ) -> Callable[P, Coroutine[Any, Any, R]]:
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(
+                f"with_retry_async requires a coroutine function, got {func!r}"
+            )
+        retry_decorator = retry(
+            **_retry_options(
+                max_attempts,
+                min_wait,
+                max_wait,
+                multiplier,
+                retryable_exceptions,
+                logger,
+                sleeper,
+            )
+        )
+        if circuit_breaker is not None:
+            func = _guard(func, circuit_breaker)
+        return retry_decorator(func)  # type: ignore[no-any-return]
+
+    return decorator
+
+
+def parse_retry_after(exc: BaseException) -> float | None:
+    """
+    Read the server-requested retry delay from a rate limit error.
+
+    The OpenAI and Anthropic SDKs attach the HTTP response to their
+    status errors; its ``retry-after-ms`` or ``Retry-After`` header
+    (seconds or an HTTP date) gives the delay.
+
+    Returns:
+        Delay in seconds, or None if the error carries no usable header
+    """
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value is not None:
+        try:
+            return max(float(value) / 1000, 0.0)
+        except (TypeError, ValueError):
+            pass
+
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+
+
 def retry_on_rate_limit(
     max_attempts: int = 5,
     min_wait: float = 1.0,
     max_wait: float = 120.0,
+    circuit_breaker: CircuitBreaker | None = None,
+    sleeper: Callable[[float], None] = time.sleep,
 ) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """
     Decorator specifically for rate limit errors.
 
     Uses longer wait times as rate limits often need more time to reset.
+    When the error carries a Retry-After header (see parse_retry_after),
+    that delay is used instead of the exponential backoff, capped at
+    max_wait so a far-off value cannot block the caller indefinitely.
 
     Args:
         max_attempts: Maximum number of retry attempts (default: 5)
         min_wait: Minimum wait time between retries in seconds (default: 1.0)
         max_wait: Maximum wait time between retries in seconds (default: 120.0)
+        circuit_breaker: Optional breaker checked before every attempt
+        sleeper: Called with each backoff delay in seconds (default: time.sleep)
 
     Returns:
         Decorated function with retry logic for rate limits
     """
 
-    def is_rate_limit_error(exc: BaseException) -> bool:
-        """Check if exception is a rate limit error."""
-        error_str = str(exc).lower()
-        return (
-            "rate" in error_str
-            and ("limit" in error_str or "exceeded" in error_str)
-        ) or "429" in error_str or "too many requests" in error_str
-
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        call = func if circuit_breaker is None else _guard(func, circuit_breaker)
+
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             last_exception: Exception | None = None
-            wait_time = min_wait
+            # Upper bound of the first draw; starting above min_wait keeps
+            # the first retry jittered too, where synchronized callers collide
+            wait_time = min_wait * 2
 
             for attempt in range(max_attempts):
                 try:
-                    return func(*args, **kwargs)
+                    return call(*args, **kwargs)
                 except Exception as e:
-                    if is_rate_limit_error(e):
+                    if _is_rate_limit_error(e):
                         last_exception = e
                         if attempt < max_attempts - 1:
-                            import time
-
-                            time.sleep(min(wait_time, max_wait))
+                            delay = parse_retry_after(e)
+                            if delay is None:
+                                # Jittered so concurrent callers spread out
+                                delay = random.uniform(
+                                    min_wait, min(wait_time, max_wait)
+                                )
+                            sleeper(min(delay, max_wait))
                             wait_time *= 2
                     else:
                         raise
@@ -157,6 +500,7 @@ class RetryConfig:
         retry_on_timeout: bool = True,
         retry_on_connection_error: bool = True,
         retry_on_rate_limit: bool = True,
+        circuit_breaker: CircuitBreaker | None = None,
     ) -> None:
         self.max_attempts = max_attempts
         self.min_wait = min_wait
@@ -165,42 +509,68 @@ class RetryConfig:
         self.retry_on_timeout = retry_on_timeout
         self.retry_on_connection_error = retry_on_connection_error
         self.retry_on_rate_limit = retry_on_rate_limit
+        self.circuit_breaker = circuit_breaker
+        # (settings, tenacity options, Retrying) from get_retry_decorator()
+        self._retrying: tuple[tuple[Any, ...], dict[str, Any], Retrying] | None = None
 
     def should_retry(self, exception: Exception) -> bool:
         """Determine if an exception should trigger a retry."""
-        if isinstance(exception, TimeoutError) and self.retry_on_timeout:
+        # Type checks first; the message is only rendered for rate limits
+        if self.retry_on_timeout and isinstance(exception, TimeoutError):
             return True
-        if isinstance(exception, ConnectionError) and self.retry_on_connection_error:
+        if self.retry_on_connection_error and isinstance(exception, ConnectionError):
             return True
-
-        # Check for rate limit in exception message
-        error_str = str(exception).lower()
-        return self.retry_on_rate_limit and (
-            ("rate" in error_str and "limit" in error_str)
-            or "429" in error_str
-            or "too many requests" in error_str
-        )
+        return self.retry_on_rate_limit and _is_rate_limit_error(exception)
 
     def get_retry_decorator(
         self,
         logger: logging.Logger | None = None,
     ) -> Callable[[Callable[P, R]], Callable[P, R]]:
-        """Get a retry decorator configured with these settings."""
-        exceptions: list[type[Exception]] = []
-        if self.retry_on_timeout:
-            exceptions.append(TimeoutError)
-        if self.retry_on_connection_error:
-            exceptions.append(ConnectionError)
-            exceptions.append(OSError)
-
-        return with_retry(
-            max_attempts=self.max_attempts,
-            min_wait=self.min_wait,
-            max_wait=self.max_wait,
-            multiplier=self.multiplier,
-            retryable_exceptions=tuple(exceptions) if exceptions else None,
-            logger=logger,
+        """
+        Get a retry decorator configured with these settings.
+
+        The tenacity controller is built once and shared by every function
+        the decorators wrap (tenacity copies it per call); it is rebuilt
+        only when the settings or the logger change.
+        """
+        settings = (
+            self.max_attempts,
+            self.min_wait,
+            self.max_wait,
+            self.multiplier,
+            self.retry_on_timeout,
+            self.retry_on_connection_error,
+            logger,
         )
+        if self._retrying is None or self._retrying[0] != settings:
+            exceptions: list[type[Exception]] = []
+            if self.retry_on_timeout:
+                exceptions.append(TimeoutError)
+            if self.retry_on_connection_error:
+                exceptions.append(ConnectionError)
+                exceptions.append(OSError)
+
+            options = _retry_options(
+                self.max_attempts,
+                self.min_wait,
+                self.max_wait,
+                self.multiplier,
+                tuple(exceptions) if exceptions else None,
+                logger,
+            )
+            self._retrying = (settings, options, Retrying(**options))
+        _, options, retrying = self._retrying
+        circuit_breaker = self.circuit_breaker
+
+        def decorator(func: Callable[P, R]) -> Callable[P, R]:
+            if circuit_breaker is not None:
+                func = _guard(func, circuit_breaker)
+            if inspect.iscoroutinefunction(func):
+                # Coroutines need tenacity's AsyncRetrying
+                return retry(**options)(func)  # type: ignore[no-any-return]
+            return retrying.wraps(func)
+
+        return decorator
 
 
 # Default retry configuration
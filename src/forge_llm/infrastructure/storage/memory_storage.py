@@ -41,6 +41,10 @@ class MemorySessionStorage:
     Stores sessions in a dictionary. Sessions are lost
     when the process ends.
 
+    Safe to share between threads without a lock: every method is a
+    single dict operation (lookup, set, pop or snapshot copy), each
+    atomic under the GIL, so reads never wait on writers.
+
     Usage:
         storage = MemorySessionStorage()
         storage.save(session)
@@ -63,17 +67,20 @@ class MemorySessionStorage:
         """
         Load session from memory.
 
+        Returns the stored instance itself: nothing is copied or rebuilt,
+        so a load costs a single dict lookup.
+
         Raises:
             SessionNotFoundError: If session doesn't exist
         """
-        if session_id not in self._sessions:
-            raise SessionNotFoundError(session_id)
-        return self._sessions[session_id]
+        try:
+            return self._sessions[session_id]
+        except KeyError:
+            raise SessionNotFoundError(session_id) from None
 
     def delete(self, session_id: str) -> None:
         """Delete session from memory."""
-        if session_id in self._sessions:
-            del self._sessions[session_id]
+        if self._sessions.pop(session_id, None) is not None:
             self._logger.debug(
                 "Session deleted",
                 session_id=session_id,
@@ -85,7 +92,7 @@ class MemorySessionStorage:
 
     def list_sessions(self) -> list[str]:
         """List all session IDs."""
-        return list(self._sessions.keys())
+        return list(self._sessions)
 
     def clear(self) -> None:
         """Clear all sessions (for testing)."""
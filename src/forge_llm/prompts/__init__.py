@@ -17,7 +17,6 @@ Uso:
 """
 import re
 from pathlib import Path
-from typing import Optional
 
 
 def get_prompts_path() -> Path:
@@ -0,0 +1,49 @@
+"""
+Root pytest configuration shared by all test suites.
+"""
+import asyncio
+
+import pytest
+
+from forge_llm.infrastructure.providers.auth import reset_auth_cache
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional
+    uvloop = None
+
+
+def _eager_policy(
+    policy_cls: type[asyncio.AbstractEventLoopPolicy],
+) -> type[asyncio.AbstractEventLoopPolicy]:
+    """Wrap a policy so its loops run tasks eagerly (Python 3.12+)."""
+
+    class EagerTaskPolicy(policy_cls):  # type: ignore[misc, valid-type]
+        def new_event_loop(self) -> asyncio.AbstractEventLoop:
+            loop = super().new_event_loop()
+            loop.set_task_factory(asyncio.eager_task_factory)
+            return loop
+
+    return EagerTaskPolicy
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """
+    Event loop policy for async tests.
+
+    Uses uvloop when installed (faster loop setup and scheduling),
+    otherwise the default asyncio policy. On Python 3.12+ tasks are
+    created with the eager task factory, so coroutines that finish
+    without suspending skip a trip through the ready queue.
+    """
+    policy_cls = uvloop.EventLoopPolicy if uvloop is not None else asyncio.DefaultEventLoopPolicy
+    if hasattr(asyncio, "eager_task_factory"):
+        policy_cls = _eager_policy(policy_cls)
+    return policy_cls()
+
+
+@pytest.fixture(autouse=True)
+def _reset_auth_cache() -> None:
+    """Drop cached API keys so monkeypatched env vars are always seen."""
+    reset_auth_cache()
@@ -0,0 +1,157 @@
+"""
+Shared fixtures for unit tests.
+
+Fixtures here are reused across test modules to avoid rebuilding
+the same mocks in every test.
+"""
+from collections.abc import Callable, Generator, Iterator, Sequence
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from forge_llm.application.agents.chat_agent import ChatAgent
+from forge_llm.infrastructure.providers import (
+    AsyncOpenAIAdapter,
+    reset_provider_registry,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_provider_registry() -> Generator[None, None, None]:
+    """
+    Give every test a fresh global provider registry.
+
+    Registrations made by one test never leak into the next, so results
+    do not depend on test order or on how xdist spreads tests over workers.
+    """
+    reset_provider_registry()
+    yield
+    reset_provider_registry()
+
+
+class FakeProvider:
+    """
+    Lightweight sync provider double.
+
+    Set ``responses`` (returned by send() in order, any sequence - tests
+    use tuples) and ``stream_chunks`` (yielded by stream()); every call is
+    recorded in ``calls`` as ``(messages, config)``.
+    """
+
+    name = "fake"
+
+    def __init__(self) -> None:
+        self.responses: Sequence[dict[str, Any]] = ()
+        self._pending: Iterator[dict[str, Any]] | None = None
+        self.stream_chunks: Sequence[dict[str, Any]] = ()
+        self.calls: list[tuple[list[dict[str, Any]], dict[str, Any] | None]] = []
+
+    def send(
+        self, messages: list[dict[str, Any]], config: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        self.calls.append((messages, config))
+        if self._pending is None:
+            self._pending = iter(self.responses)
+        return next(self._pending)
+
+    def stream(
+        self, messages: list[dict[str, Any]], config: dict[str, Any] | None = None
+    ) -> Iterator[dict[str, Any]]:
+        self.calls.append((messages, config))
+        yield from self.stream_chunks
+
+    def validate(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def fake_provider() -> FakeProvider:
+    """Fresh FakeProvider for a test."""
+    return FakeProvider()
+
+
+def _scripted_responses(*items: Any) -> Callable[..., Any]:
+    """
+    Side effect that returns items in order, raising any that are exceptions.
+
+    Unlike a side_effect list, the script is consumed through one iterator
+    and needs no per-call type dispatch by the mock.
+    """
+    pending = iter(items)
+
+    def side_effect(*args: Any, **kwargs: Any) -> Any:
+        item = next(pending)
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+    return side_effect
+
+
+@pytest.fixture
+def scripted_responses() -> Callable[..., Callable[..., Any]]:
+    """
+    Build mock side effects from a script of results and exceptions.
+
+    Usage:
+        provider.send.side_effect = scripted_responses(ok, ConnectionError(), ok)
+    """
+    return _scripted_responses
+
+
+@pytest.fixture(scope="module")
+def _module_agent() -> tuple[ChatAgent, MagicMock]:
+    """OpenAI ChatAgent and MagicMock provider, built once per module."""
+    provider = MagicMock()
+    agent = ChatAgent(provider="openai", api_key="test-key")
+    agent._provider = provider
+    return agent, provider
+
+
+@pytest.fixture
+def mocked_agent(
+    _module_agent: tuple[ChatAgent, MagicMock],
+) -> tuple[ChatAgent, MagicMock]:
+    """
+    ChatAgent wired to a MagicMock provider, as ``(agent, provider)``.
+
+    The pair is shared across a module; the provider's calls, return
+    values and side effects are reset for each test. The provider is
+    injected on the instance, so no class-level patcher is installed.
+    Build a separate agent when a test needs another provider or key.
+    """
+    agent, provider = _module_agent
+    provider.reset_mock(return_value=True, side_effect=True)
+    return agent, provider
+
+
+@pytest.fixture(scope="module")
+def async_provider_template() -> AsyncMock:
+    """Spec'd async provider mock, built once per module."""
+    return AsyncMock(spec=AsyncOpenAIAdapter)
+
+
+@pytest.fixture
+def mock_provider(async_provider_template: AsyncMock) -> Generator[AsyncMock, None, None]:
+    """
+    Async provider mock with clean call state for each test.
+
+    Reuses the module template instead of building a new spec'd mock,
+    restoring any method a test replaced (e.g. ``stream``) afterwards.
+    """
+    stream = async_provider_template.stream
+    async_provider_template.reset_mock(return_value=True, side_effect=True)
+    yield async_provider_template
+    async_provider_template.stream = stream
+
+
+@pytest.fixture(scope="session")
+def shared_mock_agent() -> MagicMock:
+    """
+    Agent mock shared across tests that never call or inspect it.
+
+    Only use it where the agent is passed through but not exercised
+    (construction, formatting, estimation); call tracking is shared.
+    """
+    return MagicMock()
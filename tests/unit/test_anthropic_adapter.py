@@ -12,6 +12,25 @@ from forge_llm.domain.entities import ProviderConfig
 from forge_llm.infrastructure.providers.anthropic_adapter import AnthropicAdapter
 
 
+def _make_anthropic_response(
+    text: str, model: str, input_tokens: int, output_tokens: int
+) -> MagicMock:
+    """Build a mocked Anthropic messages.create() response."""
+    response = MagicMock()
+    response.content = [MagicMock(text=text)]
+    response.role = "assistant"
+    response.model = model
+    response.usage.input_tokens = input_tokens
+    response.usage.output_tokens = output_tokens
+    return response
+
+
+@pytest.fixture(scope="module")
+def conversion_adapter() -> AnthropicAdapter:
+    """Adapter shared by the pure message-conversion tests (no client is built)."""
+    return AnthropicAdapter(ProviderConfig(provider="anthropic", api_key="test-key"))
+
+
 class TestAnthropicAdapter:
     """Tests for AnthropicAdapter."""
 
@@ -29,34 +48,29 @@ class TestAnthropicAdapter:
 
         assert adapter.config == config
 
-    def test_validate_without_api_key_raises(self):
-        """validate() should raise when API key is missing."""
-        config = ProviderConfig(provider="anthropic")
-        adapter = AnthropicAdapter(config)
-
-        with pytest.raises(ProviderNotConfiguredError):
-            adapter.validate()
-
-    def test_validate_with_api_key_returns_true(self):
-        """validate() should return True with valid config."""
-        config = ProviderConfig(provider="anthropic", api_key="test-key")
+    @pytest.mark.parametrize(
+        "api_key,is_valid",
+        [(None, False), ("test-key", True)],
+        ids=["without_api_key_raises", "with_api_key_returns_true"],
+    )
+    def test_validate(self, api_key, is_valid):
+        """validate() should return True with an API key and raise without one."""
+        config = ProviderConfig(provider="anthropic", api_key=api_key)
         adapter = AnthropicAdapter(config)
 
-        assert adapter.validate() is True
+        if is_valid:
+            assert adapter.validate() is True
+        else:
+            with pytest.raises(ProviderNotConfiguredError):
+                adapter.validate()
 
     def test_send_returns_response_dict(self):
         """send() should return response dict with content."""
         mock_client = MagicMock()
 
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock()]
-        mock_response.content[0].text = "Hello from Claude!"
-        mock_response.role = "assistant"
-        mock_response.model = "claude-3-sonnet-20240229"
-        mock_response.usage.input_tokens = 10
-        mock_response.usage.output_tokens = 5
-
-        mock_client.messages.create.return_value = mock_response
+        mock_client.messages.create.return_value = _make_anthropic_response(
+            "Hello from Claude!", "claude-3-sonnet-20240229", 10, 5
+        )
 
         config = ProviderConfig(
             provider="anthropic",
@@ -78,15 +92,9 @@ class TestAnthropicAdapter:
         """send() should use model from config."""
         mock_client = MagicMock()
 
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock()]
-        mock_response.content[0].text = "Response"
-        mock_response.role = "assistant"
-        mock_response.model = "claude-3-haiku-20240307"
-        mock_response.usage.input_tokens = 5
-        mock_response.usage.output_tokens = 5
-
-        mock_client.messages.create.return_value = mock_response
+        mock_client.messages.create.return_value = _make_anthropic_response(
+            "Response", "claude-3-haiku-20240307", 5, 5
+        )
 
         config = ProviderConfig(
             provider="anthropic",
@@ -137,11 +145,8 @@ class TestAnthropicAdapter:
 class TestAnthropicMessageConversion:
     """Tests for message format conversion."""
 
-    def test_convert_assistant_with_tool_calls(self):
+    def test_convert_assistant_with_tool_calls(self, conversion_adapter):
         """Assistant messages with tool_calls convert to tool_use blocks."""
-        config = ProviderConfig(provider="anthropic", api_key="test-key")
-        adapter = AnthropicAdapter(config)
-
         messages = [
             {"role": "user", "content": "What's the weather?"},
             {
@@ -160,7 +165,7 @@ class TestAnthropicMessageConversion:
             },
         ]
 
-        converted = adapter._convert_messages_to_anthropic(messages)
+        converted = conversion_adapter._convert_messages_to_anthropic(messages)
 
         assert len(converted) == 2
         assert converted[0] == {"role": "user", "content": "What's the weather?"}
@@ -171,16 +176,13 @@ class TestAnthropicMessageConversion:
         assert converted[1]["content"][0]["name"] == "get_weather"
         assert converted[1]["content"][0]["input"] == {"location": "Tokyo"}
 
-    def test_convert_tool_messages_to_user_with_tool_result(self):
+    def test_convert_tool_messages_to_user_with_tool_result(self, conversion_adapter):
         """Tool messages convert to user messages with tool_result blocks."""
-        config = ProviderConfig(provider="anthropic", api_key="test-key")
-        adapter = AnthropicAdapter(config)
-
         messages = [
             {"role": "tool", "tool_call_id": "call_123", "content": "22°C, sunny"},
         ]
 
-        converted = adapter._convert_messages_to_anthropic(messages)
+        converted = conversion_adapter._convert_messages_to_anthropic(messages)
 
         assert len(converted) == 1
         assert converted[0]["role"] == "user"
@@ -189,11 +191,8 @@ class TestAnthropicMessageConversion:
         assert converted[0]["content"][0]["tool_use_id"] == "call_123"
         assert converted[0]["content"][0]["content"] == "22°C, sunny"
 
-    def test_convert_full_tool_conversation(self):
+    def test_convert_full_tool_conversation(self, conversion_adapter):
         """Full tool calling conversation converts correctly."""
-        config = ProviderConfig(provider="anthropic", api_key="test-key")
-        adapter = AnthropicAdapter(config)
-
         messages = [
             {"role": "user", "content": "What's the weather in Tokyo?"},
             {
@@ -213,7 +212,7 @@ class TestAnthropicMessageConversion:
             {"role": "tool", "tool_call_id": "call_abc", "content": "22°C, sunny"},
         ]
 
-        converted = adapter._convert_messages_to_anthropic(messages)
+        converted = conversion_adapter._convert_messages_to_anthropic(messages)
 
         assert len(converted) == 3
         # User message unchanged
@@ -225,16 +224,13 @@ class TestAnthropicMessageConversion:
         assert converted[2]["role"] == "user"
         assert converted[2]["content"][0]["type"] == "tool_result"
 
-    def test_regular_messages_pass_through(self):
+    def test_regular_messages_pass_through(self, conversion_adapter):
         """Regular messages without tools pass through unchanged."""
-        config = ProviderConfig(provider="anthropic", api_key="test-key")
-        adapter = AnthropicAdapter(config)
-
         messages = [
             {"role": "user", "content": "Hello"},
             {"role": "assistant", "content": "Hi there!"},
         ]
 
-        converted = adapter._convert_messages_to_anthropic(messages)
+        converted = conversion_adapter._convert_messages_to_anthropic(messages)
 
         assert converted == messages
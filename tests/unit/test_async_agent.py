@@ -3,15 +3,86 @@ Unit tests for AsyncChatAgent and async adapters.
 
 Tests async chat() and stream_chat() with mocked providers.
 """
-import json
+import copy
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from forge_llm.application.agents import AsyncChatAgent
+from forge_llm.application.ports import IAsyncLLMProviderPort
 from forge_llm.application.tools import ToolRegistry
 from forge_llm.domain import InvalidMessageError, ProviderNotConfiguredError
 from forge_llm.domain.entities import ProviderConfig
+from forge_llm.infrastructure.providers import AsyncAnthropicAdapter, AsyncOpenAIAdapter
+
+
+class CannedAsyncStream:
+    """Async iterator over a prebuilt sequence of stream chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+_TEXT_CHUNKS = (
+    {"content": "Hello", "provider": "openai"},
+    {"content": " World", "provider": "openai"},
+    {"content": "", "finish_reason": "stop", "provider": "openai"},
+)
+
+_TOOL_CALL_DATA = [
+    {
+        "id": "call_123",
+        "type": "function",
+        "function": {"name": "get_value", "arguments": '{"key": "test"}'},
+    }
+]
+
+_VALUE_TOOLS = ToolRegistry()
+
+
+@_VALUE_TOOLS.tool
+def get_value(key: str) -> str:
+    """Get a value."""
+    return "42"
+
+
+_TOOL_CALL_CHUNKS = (
+    {
+        "content": "",
+        "finish_reason": "tool_calls",
+        "tool_calls": _TOOL_CALL_DATA,
+        "provider": "openai",
+    },
+)
+
+_TOOL_ANSWER_CHUNKS = (
+    {"content": "The value is 42", "provider": "openai"},
+    {"content": "", "finish_reason": "stop", "provider": "openai"},
+)
+
+
+@pytest.fixture(scope="module")
+def agent_template():
+    """AsyncChatAgent built once per module and copied into each test."""
+    return AsyncChatAgent(provider="openai", api_key="test-key")
+
+
+@pytest.fixture
+def agent(agent_template, mock_provider):
+    """Fresh shallow copy of the template agent wired to mock_provider."""
+    agent = copy.copy(agent_template)
+    agent._provider = mock_provider
+    return agent
 
 
 class TestAsyncChatAgentInit:
@@ -36,13 +107,12 @@ class TestAsyncChatAgentInit:
         assert agent.provider_name == "openai"
 
 
+@pytest.mark.asyncio
 class TestAsyncChatAgentChat:
     """Tests for AsyncChatAgent.chat()."""
 
-    @pytest.mark.asyncio
-    async def test_chat_returns_response(self):
+    async def test_chat_returns_response(self, agent, mock_provider):
         """chat() should return ChatResponse."""
-        mock_provider = AsyncMock()
         mock_provider.send.return_value = {
             "content": "Hello!",
             "role": "assistant",
@@ -51,18 +121,13 @@ class TestAsyncChatAgentChat:
             "usage": {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8},
         }
 
-        agent = AsyncChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
-
         response = await agent.chat("Hi")
 
         assert response.content == "Hello!"
         assert response.metadata.model == "gpt-4"
 
-    @pytest.mark.asyncio
-    async def test_chat_with_message_string(self):
+    async def test_chat_with_message_string(self, agent, mock_provider):
         """chat() should accept string message."""
-        mock_provider = AsyncMock()
         mock_provider.send.return_value = {
             "content": "Response",
             "role": "assistant",
@@ -71,24 +136,27 @@ class TestAsyncChatAgentChat:
             "usage": {},
         }
 
-        agent = AsyncChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
-
         await agent.chat("Hello world")
 
         call_args = mock_provider.send.call_args[0][0]
         assert call_args[0]["role"] == "user"
         assert call_args[0]["content"] == "Hello world"
 
-    @pytest.mark.asyncio
-    async def test_chat_raises_on_empty_message(self):
+    async def test_chat_raises_on_empty_message(self, agent):
         """chat() should raise InvalidMessageError for empty message."""
-        agent = AsyncChatAgent(provider="openai", api_key="test-key")
-
         with pytest.raises(InvalidMessageError):
             await agent.chat("")
 
-    @pytest.mark.asyncio
+    async def test_chat_rejects_over_long_message(self, mock_provider):
+        """chat() should reject text over max_message_chars before sending."""
+        agent = AsyncChatAgent(provider="openai", api_key="test-key", max_message_chars=10)
+        agent._provider = mock_provider
+
+        with pytest.raises(InvalidMessageError, match="exceeds 10 characters"):
+            await agent.chat("x" * 11)
+
+        mock_provider.send.assert_not_called()
+
     async def test_chat_raises_without_api_key(self):
         """chat() should raise ProviderNotConfiguredError without api_key."""
         agent = AsyncChatAgent(provider="openai")
@@ -97,23 +165,13 @@ class TestAsyncChatAgentChat:
             await agent.chat("Hello")
 
 
+@pytest.mark.asyncio
 class TestAsyncChatAgentStreamChat:
     """Tests for AsyncChatAgent.stream_chat()."""
 
-    @pytest.mark.asyncio
-    async def test_stream_chat_yields_chunks(self):
+    async def test_stream_chat_yields_chunks(self, agent, mock_provider):
         """stream_chat() should yield ChatChunk objects."""
-        mock_provider = AsyncMock()
-
-        async def mock_stream(*args, **kwargs):
-            yield {"content": "Hello", "provider": "openai"}
-            yield {"content": " World", "provider": "openai"}
-            yield {"content": "", "finish_reason": "stop", "provider": "openai"}
-
-        mock_provider.stream = mock_stream
-
-        agent = AsyncChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
+        mock_provider.stream = lambda *args, **kwargs: CannedAsyncStream(_TEXT_CHUNKS)
 
         chunks = []
         async for chunk in agent.stream_chat("Hi"):
@@ -124,49 +182,12 @@ class TestAsyncChatAgentStreamChat:
         assert chunks[1].content == " World"
         assert chunks[2].finish_reason == "stop"
 
-    @pytest.mark.asyncio
-    async def test_stream_chat_with_tools(self):
+    async def test_stream_chat_with_tools(self, mock_provider):
         """stream_chat() should handle tool calls."""
-        mock_provider = AsyncMock()
-
-        tool_call_data = [
-            {
-                "id": "call_123",
-                "type": "function",
-                "function": {"name": "get_value", "arguments": json.dumps({"key": "test"})},
-            }
-        ]
-
-        async def mock_stream_first_call(*args, **kwargs):
-            yield {
-                "content": "",
-                "finish_reason": "tool_calls",
-                "tool_calls": tool_call_data,
-                "provider": "openai",
-            }
-
-        async def mock_stream_second_call(*args, **kwargs):
-            yield {"content": "The value is 42", "provider": "openai"}
-            yield {"content": "", "finish_reason": "stop", "provider": "openai"}
-
-        call_count = [0]
-
-        def mock_stream_side_effect(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_stream_first_call(*args, **kwargs)
-            return mock_stream_second_call(*args, **kwargs)
-
-        mock_provider.stream = mock_stream_side_effect
-
-        registry = ToolRegistry()
-
-        @registry.tool
-        def get_value(key: str) -> str:
-            """Get a value."""
-            return "42"
-
-        agent = AsyncChatAgent(provider="openai", api_key="test-key", tools=registry)
+        streams = iter((_TOOL_CALL_CHUNKS, _TOOL_ANSWER_CHUNKS))
+        mock_provider.stream = lambda *args, **kwargs: CannedAsyncStream(next(streams))
+
+        agent = AsyncChatAgent(provider="openai", api_key="test-key", tools=_VALUE_TOOLS)
         agent._provider = mock_provider
 
         chunks = []
@@ -182,94 +203,67 @@ class TestAsyncChatAgentStreamChat:
         assert "42" in tool_result_chunk.content
 
 
-class TestAsyncOpenAIAdapter:
-    """Tests for AsyncOpenAIAdapter."""
-
-    def test_adapter_name(self):
-        """Should return 'openai' as name."""
-        from forge_llm.infrastructure.providers import AsyncOpenAIAdapter
-
-        config = ProviderConfig(provider="openai", api_key="test-key")
-        adapter = AsyncOpenAIAdapter(config)
-
-        assert adapter.name == "openai"
-
-    def test_validate_without_key_raises(self):
-        """validate() should raise without api_key."""
-        from forge_llm.infrastructure.providers import AsyncOpenAIAdapter
-
-        config = ProviderConfig(provider="openai")
-        adapter = AsyncOpenAIAdapter(config)
+_OPENAI_RESPONSE = SimpleNamespace(
+    choices=[
+        SimpleNamespace(
+            message=SimpleNamespace(content="Hello!", role="assistant", tool_calls=None)
+        )
+    ],
+    model="gpt-4",
+    usage=SimpleNamespace(prompt_tokens=5, completion_tokens=3, total_tokens=8),
+)
 
-        with pytest.raises(ProviderNotConfiguredError):
-            adapter.validate()
+_ANTHROPIC_RESPONSE = SimpleNamespace(
+    content=[SimpleNamespace(text="Hello!")],
+    role="assistant",
+    model="claude-3-sonnet",
+    usage=SimpleNamespace(input_tokens=5, output_tokens=3),
+)
 
-    @pytest.mark.asyncio
-    async def test_send_returns_response(self):
-        """send() should return response dict."""
-        from forge_llm.infrastructure.providers import AsyncOpenAIAdapter
 
-        mock_client = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Hello!"
-        mock_response.choices[0].message.role = "assistant"
-        mock_response.model = "gpt-4"
-        mock_response.usage.prompt_tokens = 5
-        mock_response.usage.completion_tokens = 3
-        mock_response.usage.total_tokens = 8
-        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+def _set_openai_response(mock_client):
+    """Mock an OpenAI chat.completions.create() response on the client."""
+    mock_client.chat.completions.create = AsyncMock(return_value=_OPENAI_RESPONSE)
 
-        config = ProviderConfig(provider="openai", api_key="test-key")
-        adapter = AsyncOpenAIAdapter(config)
-        adapter._client = mock_client
 
-        result = await adapter.send([{"role": "user", "content": "Hi"}])
+def _set_anthropic_response(mock_client):
+    """Mock an Anthropic messages.create() response on the client."""
+    mock_client.messages.create = AsyncMock(return_value=_ANTHROPIC_RESPONSE)
 
-        assert result["content"] == "Hello!"
-        assert result["role"] == "assistant"
-        assert result["usage"]["total_tokens"] == 8
 
+ASYNC_ADAPTERS = [
+    pytest.param(AsyncOpenAIAdapter, _set_openai_response, "openai", id="openai"),
+    pytest.param(AsyncAnthropicAdapter, _set_anthropic_response, "anthropic", id="anthropic"),
+]
 
-class TestAsyncAnthropicAdapter:
-    """Tests for AsyncAnthropicAdapter."""
 
-    def test_adapter_name(self):
-        """Should return 'anthropic' as name."""
-        from forge_llm.infrastructure.providers import AsyncAnthropicAdapter
+@pytest.mark.parametrize("adapter_cls,set_response,name", ASYNC_ADAPTERS)
+class TestAsyncAdapters:
+    """Tests shared by AsyncOpenAIAdapter and AsyncAnthropicAdapter."""
 
-        config = ProviderConfig(provider="anthropic", api_key="test-key")
-        adapter = AsyncAnthropicAdapter(config)
+    def test_adapter_name(self, adapter_cls, set_response, name):
+        """Should return the provider name."""
+        config = ProviderConfig(provider=name, api_key="test-key")
+        adapter = adapter_cls(config)
 
-        assert adapter.name == "anthropic"
+        assert adapter.name == name
 
-    def test_validate_without_key_raises(self):
+    def test_validate_without_key_raises(self, adapter_cls, set_response, name):
         """validate() should raise without api_key."""
-        from forge_llm.infrastructure.providers import AsyncAnthropicAdapter
-
-        config = ProviderConfig(provider="anthropic")
-        adapter = AsyncAnthropicAdapter(config)
+        config = ProviderConfig(provider=name)
+        adapter = adapter_cls(config)
 
         with pytest.raises(ProviderNotConfiguredError):
             adapter.validate()
 
     @pytest.mark.asyncio
-    async def test_send_returns_response(self):
+    async def test_send_returns_response(self, adapter_cls, set_response, name):
         """send() should return response dict."""
-        from forge_llm.infrastructure.providers import AsyncAnthropicAdapter
-
         mock_client = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock()]
-        mock_response.content[0].text = "Hello!"
-        mock_response.role = "assistant"
-        mock_response.model = "claude-3-sonnet"
-        mock_response.usage.input_tokens = 5
-        mock_response.usage.output_tokens = 3
-        mock_client.messages.create = AsyncMock(return_value=mock_response)
+        set_response(mock_client)
 
-        config = ProviderConfig(provider="anthropic", api_key="test-key")
-        adapter = AsyncAnthropicAdapter(config)
+        config = ProviderConfig(provider=name, api_key="test-key")
+        adapter = adapter_cls(config)
         adapter._client = mock_client
 
         result = await adapter.send([{"role": "user", "content": "Hi"}])
@@ -279,14 +273,12 @@ class TestAsyncAnthropicAdapter:
         assert result["usage"]["total_tokens"] == 8
 
 
+@pytest.mark.asyncio
 class TestAsyncOpenAIAdapterStream:
     """Tests for AsyncOpenAIAdapter.stream()."""
 
-    @pytest.mark.asyncio
     async def test_stream_yields_content_chunks(self):
         """stream() should yield content chunks."""
-        from forge_llm.infrastructure.providers import AsyncOpenAIAdapter
-
         mock_client = AsyncMock()
 
         # Create mock chunks
@@ -327,11 +319,8 @@ class TestAsyncOpenAIAdapterStream:
         assert chunks[1]["content"] == " World"
         assert chunks[2]["finish_reason"] == "stop"
 
-    @pytest.mark.asyncio
     async def test_stream_handles_tool_calls(self):
         """stream() should handle tool call chunks."""
-        from forge_llm.infrastructure.providers import AsyncOpenAIAdapter
-
         mock_client = AsyncMock()
 
         # Create mock tool call chunk
@@ -376,14 +365,12 @@ class TestAsyncOpenAIAdapterStream:
         assert "tool_calls" in tool_chunk
 
 
+@pytest.mark.asyncio
 class TestAsyncAnthropicAdapterStream:
     """Tests for AsyncAnthropicAdapter.stream()."""
 
-    @pytest.mark.asyncio
     async def test_stream_yields_content_chunks(self):
         """stream() should yield content chunks."""
-        from forge_llm.infrastructure.providers import AsyncAnthropicAdapter
-
         mock_client = AsyncMock()
 
         # Create mock events
@@ -430,11 +417,8 @@ class TestAsyncAnthropicAdapterStream:
         content_chunks = [c for c in chunks if c.get("content")]
         assert any("Hello" in c["content"] for c in content_chunks)
 
-    @pytest.mark.asyncio
     async def test_stream_handles_tool_use(self):
         """stream() should handle tool use events."""
-        from forge_llm.infrastructure.providers import AsyncAnthropicAdapter
-
         mock_client = AsyncMock()
 
         # Create mock events for tool use
@@ -496,16 +480,12 @@ class TestAsyncProviderPort:
 
     def test_protocol_is_runtime_checkable(self):
         """IAsyncLLMProviderPort should be runtime checkable."""
-        from forge_llm.application.ports import IAsyncLLMProviderPort
-
         # Check that it can be used with isinstance
         # Runtime checkable protocols have _is_runtime_protocol attribute
         assert getattr(IAsyncLLMProviderPort, "_is_runtime_protocol", False)
 
     def test_async_openai_adapter_implements_protocol(self):
         """AsyncOpenAIAdapter should implement IAsyncLLMProviderPort."""
-        from forge_llm.infrastructure.providers import AsyncOpenAIAdapter
-
         config = ProviderConfig(provider="openai", api_key="test-key")
         adapter = AsyncOpenAIAdapter(config)
 
@@ -518,8 +498,6 @@ class TestAsyncProviderPort:
 
     def test_async_anthropic_adapter_implements_protocol(self):
         """AsyncAnthropicAdapter should implement IAsyncLLMProviderPort."""
-        from forge_llm.infrastructure.providers import AsyncAnthropicAdapter
-
         config = ProviderConfig(provider="anthropic", api_key="test-key")
         adapter = AsyncAnthropicAdapter(config)
 
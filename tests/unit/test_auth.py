@@ -1,7 +1,6 @@
 """
 Unit tests for auth helpers.
 """
-import os
 
 import pytest
 
@@ -10,8 +9,18 @@ from forge_llm.infrastructure.providers.auth import (
     create_config,
     get_api_key,
     require_api_key,
+    reset_auth_cache,
 )
 
+_AUTH_ENV_VARS = ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "CUSTOM_KEY")
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    """Start every test with no API keys set (cache reset in tests/conftest.py)."""
+    for name in _AUTH_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+
 
 class TestAuth:
     """Tests for auth helpers."""
@@ -32,10 +41,8 @@ class TestAuth:
 
         assert key == "custom-value"
 
-    def test_get_api_key_returns_none_if_missing(self, monkeypatch):
+    def test_get_api_key_returns_none_if_missing(self):
         """get_api_key returns None if not set."""
-        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
-
         key = get_api_key("openai")
 
         assert key is None
@@ -64,9 +71,25 @@ class TestAuth:
 
         assert key == "required-key"
 
-    def test_require_api_key_raises_if_missing(self, monkeypatch):
+    def test_require_api_key_raises_if_missing(self):
         """require_api_key raises if key not found."""
-        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
-
         with pytest.raises(ProviderNotConfiguredError):
             require_api_key("openai")
+
+    def test_get_api_key_is_cached_until_reset(self, monkeypatch):
+        """get_api_key caches found keys until reset_auth_cache()."""
+        monkeypatch.setenv("OPENAI_API_KEY", "first-key")
+        assert get_api_key("openai") == "first-key"
+
+        monkeypatch.setenv("OPENAI_API_KEY", "rotated-key")
+        assert get_api_key("openai") == "first-key"
+
+        reset_auth_cache()
+        assert get_api_key("openai") == "rotated-key"
+
+    def test_get_api_key_does_not_cache_missing_key(self, monkeypatch):
+        """A key exported after a failed lookup is still found."""
+        assert get_api_key("openai") is None
+
+        monkeypatch.setenv("OPENAI_API_KEY", "late-key")
+        assert get_api_key("openai") == "late-key"
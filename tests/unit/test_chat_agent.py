@@ -3,15 +3,36 @@ Unit tests for ChatAgent.
 
 TDD tests for chat() and stream_chat() methods.
 """
-from unittest.mock import MagicMock, patch
 
 import pytest
 
 from forge_llm.application.agents.chat_agent import ChatAgent
+from forge_llm.application.session import ChatSession
 from forge_llm.domain import ProviderNotConfiguredError
-from forge_llm.domain.entities import ChatConfig, ChatMessage, ProviderConfig
-from forge_llm.domain.value_objects import ChatResponse, ResponseMetadata, TokenUsage
-
+from forge_llm.domain.entities import ChatConfig, ChatMessage
+from forge_llm.domain.value_objects import ChatResponse
+
+# Shared provider results; ChatAgent only reads them, so tests reuse them as-is
+_HELLO_RESPONSE = {
+    "content": "Hello!",
+    "role": "assistant",
+    "model": "gpt-4",
+    "provider": "openai",
+    "usage": {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8},
+}
+_RESPONSE = {
+    "content": "Response",
+    "role": "assistant",
+    "model": "gpt-4",
+    "provider": "openai",
+    "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+}
+
+# Prior conversation turns; ChatMessage is frozen, so sessions can share them
+_PRIMED_HISTORY = (
+    ChatMessage.user("First message"),
+    ChatMessage.assistant("First response"),
+)
 
 class TestChatAgent:
     """Tests for ChatAgent."""
@@ -28,38 +49,24 @@ class TestChatAgent:
             agent = ChatAgent(provider="openai")
             agent.chat([ChatMessage.user("Hi")])
 
-    def test_chat_with_string_message(self):
+    def test_chat_with_string_message(self, fake_provider):
         """chat() accepts string shorthand."""
-        mock_provider = MagicMock()
-        mock_provider.send.return_value = {
-            "content": "Hello!",
-            "role": "assistant",
-            "model": "gpt-4",
-            "provider": "openai",
-            "usage": {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8},
-        }
+        fake_provider.responses = (_HELLO_RESPONSE,)
 
         agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
+        agent._provider = fake_provider
 
         response = agent.chat("Hi")
 
         assert isinstance(response, ChatResponse)
         assert response.content == "Hello!"
 
-    def test_chat_with_message_list(self):
+    def test_chat_with_message_list(self, fake_provider):
         """chat() accepts list of ChatMessage."""
-        mock_provider = MagicMock()
-        mock_provider.send.return_value = {
-            "content": "Response",
-            "role": "assistant",
-            "model": "gpt-4",
-            "provider": "openai",
-            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
-        }
+        fake_provider.responses = (_RESPONSE,)
 
         agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
+        agent._provider = fake_provider
 
         messages = [
             ChatMessage.system("Be helpful"),
@@ -68,59 +75,44 @@ class TestChatAgent:
         response = agent.chat(messages)
 
         assert response.content == "Response"
-        mock_provider.send.assert_called_once()
+        assert len(fake_provider.calls) == 1
 
-    def test_chat_returns_chat_response(self):
+    def test_chat_returns_chat_response(self, fake_provider):
         """chat() returns ChatResponse with metadata."""
-        mock_provider = MagicMock()
-        mock_provider.send.return_value = {
-            "content": "Hi",
-            "role": "assistant",
-            "model": "gpt-4",
-            "provider": "openai",
-            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
-        }
+        fake_provider.responses = (_HELLO_RESPONSE,)
 
         agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
+        agent._provider = fake_provider
 
         response = agent.chat("Test")
 
         assert isinstance(response, ChatResponse)
         assert response.model == "gpt-4"
         assert response.provider == "openai"
-        assert response.token_usage.total_tokens == 2
+        assert response.token_usage.total_tokens == 8
 
-    def test_chat_with_config(self):
+    def test_chat_with_config(self, fake_provider):
         """chat() accepts ChatConfig for parameters."""
-        mock_provider = MagicMock()
-        mock_provider.send.return_value = {
-            "content": "Creative response",
-            "role": "assistant",
-            "model": "gpt-4",
-            "provider": "openai",
-            "usage": {"prompt_tokens": 5, "completion_tokens": 10, "total_tokens": 15},
-        }
+        fake_provider.responses = (_RESPONSE,)
 
         agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
+        agent._provider = fake_provider
 
         config = ChatConfig(temperature=0.9, max_tokens=100)
         _ = agent.chat("Be creative", config=config)
 
-        call_args = mock_provider.send.call_args
-        assert call_args.kwargs.get("config") is not None
+        _, sent_config = fake_provider.calls[0]
+        assert sent_config is not None
 
-    def test_stream_chat_yields_chunks(self):
+    def test_stream_chat_yields_chunks(self, fake_provider):
         """stream_chat() yields ChatChunk objects."""
-        mock_provider = MagicMock()
-        mock_provider.stream.return_value = iter([
+        fake_provider.stream_chunks = (
             {"content": "Hello", "provider": "openai"},
             {"content": " World", "provider": "openai"},
-        ])
+        )
 
         agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
+        agent._provider = fake_provider
 
         chunks = list(agent.stream_chat("Hi"))
 
@@ -128,19 +120,12 @@ class TestChatAgent:
         assert chunks[0].content == "Hello"
         assert chunks[1].content == " World"
 
-    def test_agent_with_model_override(self):
+    def test_agent_with_model_override(self, fake_provider):
         """Agent can use different model."""
-        mock_provider = MagicMock()
-        mock_provider.send.return_value = {
-            "content": "Response",
-            "role": "assistant",
-            "model": "gpt-3.5-turbo",
-            "provider": "openai",
-            "usage": {"prompt_tokens": 5, "completion_tokens": 5, "total_tokens": 10},
-        }
+        fake_provider.responses = ({**_RESPONSE, "model": "gpt-3.5-turbo"},)
 
         agent = ChatAgent(provider="openai", api_key="test-key", model="gpt-3.5-turbo")
-        agent._provider = mock_provider
+        agent._provider = fake_provider
 
         response = agent.chat("Test")
 
@@ -150,94 +135,69 @@ class TestChatAgent:
 class TestChatAgentSessionIntegration:
     """Tests for ChatAgent session integration."""
 
-    def test_chat_with_session(self):
-        """chat() can use a ChatSession."""
-        from forge_llm.application.session import ChatSession
-
-        mock_provider = MagicMock()
-        mock_provider.send.return_value = {
-            "content": "Hello there!",
-            "role": "assistant",
-            "model": "gpt-4",
-            "provider": "openai",
-            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
-        }
+    @pytest.mark.parametrize(
+        ("system_prompt", "history", "user_input", "expected_sent", "expected_len"),
+        [
+            # system + user, then the assistant response
+            pytest.param("Be helpful", (), "Hello", 2, 3, id="system-prompt"),
+            pytest.param(None, (), "Test message", 1, 2, id="empty-session"),
+            # Provider receives messages BEFORE the response is added
+            pytest.param(
+                "Be helpful",
+                _PRIMED_HISTORY,
+                "Second message",
+                4,
+                5,
+                id="existing-history",
+            ),
+            # No messages arg: session only
+            pytest.param(
+                None,
+                _PRIMED_HISTORY[:1],
+                None,
+                1,
+                2,
+                id="session-only",
+            ),
+        ],
+    )
+    def test_chat_with_session(
+        self,
+        fake_provider,
+        system_prompt,
+        history,
+        user_input,
+        expected_sent,
+        expected_len,
+    ):
+        """chat() sends session history and adds the response to the session."""
+        fake_provider.responses = (_RESPONSE,)
 
         agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
-
-        session = ChatSession(system_prompt="Be helpful")
-        response = agent.chat("Hello", session=session)
-
-        assert response.content == "Hello there!"
-        # Session should have 3 messages: system, user, assistant
-        assert len(session.messages) == 3
+        agent._provider = fake_provider
 
-    def test_chat_adds_response_to_session(self):
-        """chat() adds response to session automatically."""
-        from forge_llm.application.session import ChatSession
-
-        mock_provider = MagicMock()
-        mock_provider.send.return_value = {
-            "content": "Response content",
-            "role": "assistant",
-            "model": "gpt-4",
-            "provider": "openai",
-            "usage": {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8},
-        }
-
-        agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
+        session = ChatSession(system_prompt=system_prompt)
+        for message in history:
+            session.add_message(message)
 
-        session = ChatSession()
-        agent.chat("Test message", session=session)
+        response = agent.chat(user_input, session=session)
 
-        # Last message should be assistant response
+        assert response.content == "Response"
+        messages_sent, _ = fake_provider.calls[0]
+        assert len(messages_sent) == expected_sent
+        assert len(session.messages) == expected_len
         assert session.last_message.role == "assistant"
-        assert session.last_message.content == "Response content"
-
-    def test_chat_uses_session_messages(self):
-        """chat() uses existing session messages."""
-        from forge_llm.application.session import ChatSession
-
-        mock_provider = MagicMock()
-        mock_provider.send.return_value = {
-            "content": "OK",
-            "role": "assistant",
-            "model": "gpt-4",
-            "provider": "openai",
-            "usage": {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
-        }
-
-        agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
-
-        session = ChatSession(system_prompt="Be helpful")
-        session.add_message(ChatMessage.user("First message"))
-        session.add_message(ChatMessage.assistant("First response"))
+        assert session.last_message.content == "Response"
 
-        agent.chat("Second message", session=session)
-
-        # Provider receives messages BEFORE response is added
-        call_args = mock_provider.send.call_args
-        messages_sent = call_args[0][0]
-        assert len(messages_sent) == 4  # system + first user + first assistant + second user
-
-        # After call, session has 5 messages (includes new response)
-        assert len(session.messages) == 5
-
-    def test_stream_chat_with_session(self):
+    def test_stream_chat_with_session(self, fake_provider):
         """stream_chat() can use a ChatSession."""
-        from forge_llm.application.session import ChatSession
-
-        mock_provider = MagicMock()
-        mock_provider.stream.return_value = iter([
+        fake_provider.stream_chunks = (
             {"content": "Hello"},
             {"content": " there!"},
-        ])
+        )
 
         agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
+        agent._provider = fake_provider
 
         session = ChatSession()
         chunks = list(agent.stream_chat("Hi", session=session))
@@ -247,28 +207,3 @@ class TestChatAgentSessionIntegration:
         assert len(session.messages) == 2
         assert session.last_message.role == "assistant"
         assert session.last_message.content == "Hello there!"
-
-    def test_chat_session_only(self):
-        """chat() can be called with session only (no messages arg)."""
-        from forge_llm.application.session import ChatSession
-
-        mock_provider = MagicMock()
-        mock_provider.send.return_value = {
-            "content": "Response",
-            "role": "assistant",
-            "model": "gpt-4",
-            "provider": "openai",
-            "usage": {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8},
-        }
-
-        agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
-
-        session = ChatSession()
-        session.add_message(ChatMessage.user("Existing message"))
-
-        response = agent.chat(session=session)
-
-        assert response.content == "Response"
-        # Session should have user + assistant
-        assert len(session.messages) == 2
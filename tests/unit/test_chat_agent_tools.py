@@ -3,13 +3,11 @@ Unit tests for ChatAgent tool calling (VT-02).
 
 TDD tests for tool registration and execution in ChatAgent.
 """
-from unittest.mock import MagicMock
-
 import pytest
 
 from forge_llm.application.agents.chat_agent import ChatAgent
 from forge_llm.application.tools import ToolRegistry
-from forge_llm.domain.entities import ChatMessage, ToolCall, ToolDefinition, ToolResult
+from forge_llm.domain.entities import ChatConfig, ToolCall, ToolDefinition
 
 
 class TestChatAgentWithTools:
@@ -59,16 +57,17 @@ class TestChatAgentWithTools:
         assert len(definitions) == 1
         assert definitions[0].name == "my_tool"
 
-    def test_chat_sends_tools_to_provider(self):
+    def test_chat_sends_tools_to_provider(self, fake_provider):
         """chat() sends tool definitions to provider."""
-        mock_provider = MagicMock()
-        mock_provider.send.return_value = {
-            "content": "Response",
-            "role": "assistant",
-            "model": "gpt-4",
-            "provider": "openai",
-            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
-        }
+        fake_provider.responses = (
+            {
+                "content": "Response",
+                "role": "assistant",
+                "model": "gpt-4",
+                "provider": "openai",
+                "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+            },
+        )
 
         tools = [
             ToolDefinition(name="get_weather", description="Get weather"),
@@ -79,18 +78,17 @@ class TestChatAgentWithTools:
             api_key="test-key",
             tools=tools,
         )
-        agent._provider = mock_provider
+        agent._provider = fake_provider
 
         agent.chat("What's the weather?")
 
-        call_args = mock_provider.send.call_args
-        assert "tools" in call_args.kwargs or call_args.kwargs.get("config", {}).get("tools")
+        _, sent_config = fake_provider.calls[0]
+        assert sent_config.get("tools")
 
-    def test_chat_handles_tool_call_response(self):
+    def test_chat_handles_tool_call_response(self, fake_provider):
         """chat() can handle tool call in response."""
-        mock_provider = MagicMock()
         # First response requests tool call
-        mock_provider.send.side_effect = [
+        fake_provider.responses = (
             {
                 "content": None,
                 "role": "assistant",
@@ -116,7 +114,7 @@ class TestChatAgentWithTools:
                 "provider": "openai",
                 "usage": {"prompt_tokens": 20, "completion_tokens": 10, "total_tokens": 30},
             },
-        ]
+        )
 
         registry = ToolRegistry()
 
@@ -131,18 +129,57 @@ class TestChatAgentWithTools:
             api_key="test-key",
             tools=registry,
         )
-        agent._provider = mock_provider
+        agent._provider = fake_provider
 
         response = agent.chat("What's the weather in London?")
 
         # Should have made two calls - initial and after tool execution
-        assert mock_provider.send.call_count == 2
+        assert len(fake_provider.calls) == 2
         assert response.content == "It's sunny in London!"
 
-    def test_chat_executes_tool_automatically(self):
+        # Second payload extends the first with the assistant and tool messages
+        first_sent, _ = fake_provider.calls[0]
+        second_sent, _ = fake_provider.calls[1]
+        assert [m["role"] for m in first_sent] == ["user"]
+        assert [m["role"] for m in second_sent] == ["user", "assistant", "tool"]
+        assert second_sent[2]["tool_call_id"] == "call_123"
+
+    def test_tool_follow_up_gets_its_own_idempotency_key(self, fake_provider):
+        """The request after tool execution is not deduplicated to the first."""
+        fake_provider.responses = (
+            {
+                "content": None,
+                "role": "assistant",
+                "tool_calls": [
+                    {
+                        "id": "call_1",
+                        "type": "function",
+                        "function": {"name": "ping", "arguments": "{}"},
+                    },
+                ],
+            },
+            {"content": "pong", "role": "assistant"},
+        )
+
+        registry = ToolRegistry()
+
+        def ping() -> str:
+            """Reply to a ping."""
+            return "pong"
+
+        registry.register_callable(ping)
+
+        agent = ChatAgent(provider="openai", api_key="test-key", tools=registry)
+        agent._provider = fake_provider
+
+        agent.chat("Ping", config=ChatConfig(idempotency_key="req-1"))
+
+        keys = [sent_config["idempotency_key"] for _, sent_config in fake_provider.calls]
+        assert keys == ["req-1", "req-1-tool-results"]
+
+    def test_chat_executes_tool_automatically(self, fake_provider):
         """chat() executes tools automatically when auto_execute=True."""
-        mock_provider = MagicMock()
-        mock_provider.send.side_effect = [
+        fake_provider.responses = (
             {
                 "content": None,
                 "role": "assistant",
@@ -167,7 +204,7 @@ class TestChatAgentWithTools:
                 "provider": "openai",
                 "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
             },
-        ]
+        )
 
         registry = ToolRegistry()
 
@@ -182,32 +219,33 @@ class TestChatAgentWithTools:
             api_key="test-key",
             tools=registry,
         )
-        agent._provider = mock_provider
+        agent._provider = fake_provider
 
         response = agent.chat("What's 5 + 3?", auto_execute_tools=True)
 
         assert "8" in response.content or "sum" in response.content.lower()
 
-    def test_chat_returns_tool_calls_when_not_auto_execute(self):
+    def test_chat_returns_tool_calls_when_not_auto_execute(self, fake_provider):
         """chat() returns tool calls when auto_execute=False."""
-        mock_provider = MagicMock()
-        mock_provider.send.return_value = {
-            "content": None,
-            "role": "assistant",
-            "model": "gpt-4",
-            "provider": "openai",
-            "tool_calls": [
-                {
-                    "id": "call_xyz",
-                    "type": "function",
-                    "function": {
-                        "name": "get_weather",
-                        "arguments": '{"location": "Paris"}',
+        fake_provider.responses = (
+            {
+                "content": None,
+                "role": "assistant",
+                "model": "gpt-4",
+                "provider": "openai",
+                "tool_calls": [
+                    {
+                        "id": "call_xyz",
+                        "type": "function",
+                        "function": {
+                            "name": "get_weather",
+                            "arguments": '{"location": "Paris"}',
+                        },
                     },
-                },
-            ],
-            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
-        }
+                ],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+            },
+        )
 
         tools = [
             ToolDefinition(name="get_weather", description="Get weather"),
@@ -218,13 +256,13 @@ class TestChatAgentWithTools:
             api_key="test-key",
             tools=tools,
         )
-        agent._provider = mock_provider
+        agent._provider = fake_provider
 
         response = agent.chat("What's the weather in Paris?", auto_execute_tools=False)
 
         assert response.message.tool_calls is not None
         assert len(response.message.tool_calls) == 1
-        assert mock_provider.send.call_count == 1  # Only one call, no auto-execution
+        assert len(fake_provider.calls) == 1  # Only one call, no auto-execution
 
     def test_execute_tool_calls(self):
         """Can manually execute tool calls from response."""
@@ -250,3 +288,27 @@ class TestChatAgentWithTools:
 
         assert len(results) == 1
         assert "28" in results[0].content
+
+    @pytest.mark.parametrize(
+        ("tools", "error"),
+        [
+            (None, "No tools registered"),
+            (
+                [ToolDefinition(name="multiply", description="Multiply")],
+                "Cannot execute: tools is a list of definitions only",
+            ),
+        ],
+    )
+    def test_execute_tool_calls_without_registry(self, tools, error):
+        """Every call gets an error result when there is no registry to run it."""
+        agent = ChatAgent(provider="openai", api_key="test-key", tools=tools)
+
+        tool_calls = [
+            ToolCall(id="call_1", name="multiply", arguments={"a": 1, "b": 2}),
+            ToolCall(id="call_2", name="multiply", arguments={"a": 3, "b": 4}),
+        ]
+
+        results = agent.execute_tool_calls(tool_calls)
+
+        assert [r.tool_call_id for r in results] == ["call_1", "call_2"]
+        assert all(r.is_error and r.content == error for r in results)
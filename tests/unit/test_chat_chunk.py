@@ -5,8 +5,6 @@ Tests for streaming chunk representation and factory methods.
 """
 from unittest.mock import MagicMock
 
-import pytest
-
 from forge_llm.domain.entities import ChatChunk
 
 
@@ -3,36 +3,59 @@ Unit tests for ChatMessage entity.
 
 TDD RED phase: Tests define ChatMessage behavior per ADR-005.
 """
-from typing import Literal
+import pickle
+from dataclasses import FrozenInstanceError
+from enum import StrEnum
 
 import pytest
 
 from forge_llm.domain.entities.chat_message import ChatMessage
+from forge_llm.domain.value_objects.content import (
+    AudioContent,
+    ImageContent,
+    TextContent,
+)
 
+_IMAGE_URL = "https://example.com/img.png"
+_TOOL_CALL = {"id": "call_1", "type": "function", "function": {}}
 
-class TestChatMessage:
-    """Tests for ChatMessage entity."""
 
-    def test_create_user_message(self):
-        """Can create a user message."""
-        msg = ChatMessage(role="user", content="Hello")
+# Content value objects are frozen, so one instance serves the whole module
+@pytest.fixture(scope="module")
+def sample_image_url() -> ImageContent:
+    """URL image content."""
+    return ImageContent.from_url(_IMAGE_URL)
 
-        assert msg.role == "user"
-        assert msg.content == "Hello"
 
-    def test_create_assistant_message(self):
-        """Can create an assistant message."""
-        msg = ChatMessage(role="assistant", content="Hi there!")
+@pytest.fixture(scope="module")
+def sample_image_b64() -> ImageContent:
+    """Base64 JPEG image content."""
+    return ImageContent.from_base64(data="abc123", media_type="image/jpeg")
 
-        assert msg.role == "assistant"
-        assert msg.content == "Hi there!"
 
-    def test_create_system_message(self):
-        """Can create a system message."""
-        msg = ChatMessage(role="system", content="You are helpful.")
+@pytest.fixture(scope="module")
+def sample_audio_wav() -> AudioContent:
+    """Base64 WAV audio content."""
+    return AudioContent.from_base64(data="abc123", format="wav")
 
-        assert msg.role == "system"
-        assert msg.content == "You are helpful."
+
+class TestChatMessage:
+    """Tests for ChatMessage entity."""
+
+    @pytest.mark.parametrize(
+        "role,content",
+        [
+            ("user", "Hello"),
+            ("assistant", "Hi there!"),
+            ("system", "You are helpful."),
+        ],
+    )
+    def test_create_role_message(self, role, content):
+        """Can create user, assistant and system messages."""
+        msg = ChatMessage(role=role, content=content)
+
+        assert msg.role == role
+        assert msg.content == content
 
     def test_create_tool_message(self):
         """Can create a tool result message."""
@@ -76,43 +99,96 @@ class TestChatMessage:
         assert msg.tool_calls is None
         assert msg.tool_call_id is None
 
-    def test_message_to_dict(self):
-        """Message can be converted to dict for API calls."""
-        msg = ChatMessage(role="user", content="Hello")
-
-        d = msg.to_dict()
-
-        assert d["role"] == "user"
-        assert d["content"] == "Hello"
-
-    def test_message_to_dict_omits_none(self):
-        """to_dict() omits None fields."""
-        msg = ChatMessage(role="user", content="Hello")
-
-        d = msg.to_dict()
-
-        assert "name" not in d
-        assert "tool_calls" not in d
-        assert "tool_call_id" not in d
-
-    def test_message_to_dict_includes_tool_calls(self):
-        """to_dict() includes tool_calls when present."""
-        tool_call = {"id": "call_1", "type": "function", "function": {}}
-        msg = ChatMessage(role="assistant", content=None, tool_calls=[tool_call])
-
-        d = msg.to_dict()
-
-        assert "tool_calls" in d
-        assert d["tool_calls"] == [tool_call]
-
-    def test_message_from_dict(self):
-        """Can create message from dict."""
-        data = {"role": "user", "content": "Hello"}
-
-        msg = ChatMessage.from_dict(data)
-
-        assert msg.role == "user"
-        assert msg.content == "Hello"
+    @pytest.mark.parametrize(
+        ("msg", "expected"),
+        [
+            # None fields are omitted
+            pytest.param(
+                ChatMessage(role="user", content="Hello"),
+                {"role": "user", "content": "Hello"},
+                id="text",
+            ),
+            pytest.param(
+                ChatMessage(role="assistant", content=None, tool_calls=[_TOOL_CALL]),
+                {"role": "assistant", "tool_calls": [_TOOL_CALL]},
+                id="tool-calls",
+            ),
+            pytest.param(
+                ChatMessage.user("Hi", name="alice"),
+                {"role": "user", "content": "Hi", "name": "alice"},
+                id="named",
+            ),
+            pytest.param(
+                ChatMessage.tool("42", tool_call_id="call_1"),
+                {"role": "tool", "content": "42", "tool_call_id": "call_1"},
+                id="tool-result",
+            ),
+            pytest.param(
+                ChatMessage.user_with_image("What's this?", ImageContent.from_url(_IMAGE_URL)),
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": "What's this?"},
+                        {"type": "image", "source_type": "url", "url": _IMAGE_URL},
+                    ],
+                },
+                id="multimodal",
+            ),
+        ],
+    )
+    def test_to_dict(self, msg, expected):
+        """to_dict() serializes messages for API calls."""
+        assert msg.to_dict() == expected
+
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            pytest.param(
+                {"role": "user", "content": "Hello"},
+                ChatMessage(role="user", content="Hello"),
+                id="text",
+            ),
+            pytest.param(
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": "Hello"},
+                        {"type": "image", "source_type": "url", "url": _IMAGE_URL},
+                    ],
+                },
+                ChatMessage(
+                    role="user",
+                    content=[TextContent(text="Hello"), ImageContent.from_url(_IMAGE_URL)],
+                ),
+                id="image-url",
+            ),
+            pytest.param(
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": "Describe"},
+                        {
+                            "type": "image",
+                            "source_type": "base64",
+                            "data": "abc123",
+                            "media_type": "image/jpeg",
+                        },
+                    ],
+                },
+                ChatMessage(
+                    role="user",
+                    content=[
+                        TextContent(text="Describe"),
+                        ImageContent.from_base64(data="abc123", media_type="image/jpeg"),
+                    ],
+                ),
+                id="image-base64",
+            ),
+        ],
+    )
+    def test_from_dict(self, data, expected):
+        """from_dict() parses text and multimodal content."""
+        assert ChatMessage.from_dict(data) == expected
 
     def test_message_equality(self):
         """Two messages with same values are equal."""
@@ -121,16 +197,82 @@ class TestChatMessage:
 
         assert msg1 == msg2
 
+    def test_role_is_interned(self):
+        """Roles from parsed dicts share the interned role string."""
+        role = "".join(["assis", "tant"])
+        msg = ChatMessage.from_dict({"role": role, "content": "Hi"})
+
+        assert msg.role is ChatMessage.assistant("Hi").role
+
+    def test_str_enum_role_is_stored_as_plain_str(self):
+        """A StrEnum role is accepted and stored as its interned value."""
+
+        class Role(StrEnum):
+            USER = "user"
+
+        msg = ChatMessage(role=Role.USER, content="Hi")
+
+        assert type(msg.role) is str
+        assert msg.role is ChatMessage.user("Hi").role
+
+    def test_missing_role_is_kept(self):
+        """A None role (e.g. from a provider response) is not interned."""
+        msg = ChatMessage(role=None, content="Hi")  # type: ignore[arg-type]
+
+        assert msg.role is None
+
+    def test_message_is_immutable(self):
+        """Messages cannot be modified after creation."""
+        msg = ChatMessage.user("Hi")
+
+        with pytest.raises(FrozenInstanceError):
+            msg.content = "Changed"  # type: ignore[misc]
+
+    @pytest.mark.parametrize(
+        ("factory_msg", "expected"),
+        [
+            pytest.param(
+                ChatMessage.user("Hi", name="alice"),
+                ChatMessage(role="user", content="Hi", name="alice"),
+                id="user",
+            ),
+            pytest.param(
+                ChatMessage.assistant(None, tool_calls=[_TOOL_CALL]),
+                ChatMessage(role="assistant", content=None, tool_calls=[_TOOL_CALL]),
+                id="assistant",
+            ),
+            pytest.param(
+                ChatMessage.system("Be helpful"),
+                ChatMessage(role="system", content="Be helpful"),
+                id="system",
+            ),
+            pytest.param(
+                ChatMessage.tool("42", tool_call_id="call_1"),
+                ChatMessage(role="tool", content="42", tool_call_id="call_1"),
+                id="tool",
+            ),
+        ],
+    )
+    def test_role_factories_match_constructor(self, factory_msg, expected):
+        """Role factories build the same message as the constructor."""
+        assert factory_msg == expected
+        assert factory_msg.role is expected.role
+        assert factory_msg.to_dict() == expected.to_dict()
+
+    def test_message_is_slotted(self):
+        """Messages carry no per-instance __dict__ and survive pickling."""
+        msg = ChatMessage.assistant("Hi", tool_calls=[_TOOL_CALL])
+
+        assert not hasattr(msg, "__dict__")
+        assert pickle.loads(pickle.dumps(msg)) == msg
+
 
 class TestChatMessageMultimodal:
     """Tests for multimodal message support."""
 
-    def test_user_with_image_url(self):
+    def test_user_with_image_url(self, sample_image_url):
         """Can create user message with image from URL."""
-        from forge_llm.domain.value_objects.content import ImageContent, TextContent
-
-        img = ImageContent.from_url("https://example.com/img.png")
-        msg = ChatMessage.user_with_image("What's this?", img)
+        msg = ChatMessage.user_with_image("What's this?", sample_image_url)
 
         assert msg.role == "user"
         assert isinstance(msg.content, list)
@@ -138,20 +280,15 @@ class TestChatMessageMultimodal:
         assert isinstance(msg.content[0], TextContent)
         assert isinstance(msg.content[1], ImageContent)
 
-    def test_user_with_image_base64(self):
+    def test_user_with_image_base64(self, sample_image_b64):
         """Can create user message with base64 image."""
-        from forge_llm.domain.value_objects.content import ImageContent
-
-        img = ImageContent.from_base64(data="abc123", media_type="image/jpeg")
-        msg = ChatMessage.user_with_image("Describe this", img)
+        msg = ChatMessage.user_with_image("Describe this", sample_image_b64)
 
         assert msg.role == "user"
         assert msg.has_images is True
 
     def test_user_with_multiple_images(self):
         """Can create user message with multiple images."""
-        from forge_llm.domain.value_objects.content import ImageContent
-
         images = [
             ImageContent.from_url("https://example.com/1.png"),
             ImageContent.from_url("https://example.com/2.png"),
@@ -161,64 +298,6 @@ class TestChatMessageMultimodal:
         assert len(msg.content) == 3  # 1 text + 2 images
         assert msg.has_images is True
 
-    def test_to_dict_with_multimodal_content(self):
-        """to_dict() correctly serializes multimodal content."""
-        from forge_llm.domain.value_objects.content import ImageContent
-
-        img = ImageContent.from_url("https://example.com/img.png")
-        msg = ChatMessage.user_with_image("What's this?", img)
-
-        d = msg.to_dict()
-
-        assert d["role"] == "user"
-        assert isinstance(d["content"], list)
-        assert d["content"][0]["type"] == "text"
-        assert d["content"][0]["text"] == "What's this?"
-        assert d["content"][1]["type"] == "image"
-        assert d["content"][1]["source_type"] == "url"
-
-    def test_from_dict_with_multimodal_content(self):
-        """from_dict() correctly parses multimodal content."""
-        from forge_llm.domain.value_objects.content import ImageContent, TextContent
-
-        data = {
-            "role": "user",
-            "content": [
-                {"type": "text", "text": "Hello"},
-                {"type": "image", "source_type": "url", "url": "https://example.com/img.png"},
-            ],
-        }
-
-        msg = ChatMessage.from_dict(data)
-
-        assert msg.role == "user"
-        assert isinstance(msg.content, list)
-        assert isinstance(msg.content[0], TextContent)
-        assert isinstance(msg.content[1], ImageContent)
-
-    def test_from_dict_with_base64_image(self):
-        """from_dict() correctly parses base64 image content."""
-        from forge_llm.domain.value_objects.content import ImageContent
-
-        data = {
-            "role": "user",
-            "content": [
-                {"type": "text", "text": "Describe"},
-                {
-                    "type": "image",
-                    "source_type": "base64",
-                    "data": "abc123",
-                    "media_type": "image/jpeg",
-                },
-            ],
-        }
-
-        msg = ChatMessage.from_dict(data)
-
-        assert isinstance(msg.content[1], ImageContent)
-        assert msg.content[1].source_type == "base64"
-        assert msg.content[1].data == "abc123"
-
     def test_backward_compatible_string_content(self):
         """String content still works (backward compatibility)."""
         msg = ChatMessage.user("Hello")
@@ -227,12 +306,9 @@ class TestChatMessageMultimodal:
         d = msg.to_dict()
         assert d["content"] == "Hello"
 
-    def test_text_content_property(self):
+    def test_text_content_property(self, sample_image_url):
         """text_content property extracts text from multimodal."""
-        from forge_llm.domain.value_objects.content import ImageContent
-
-        img = ImageContent.from_url("https://example.com/img.png")
-        msg = ChatMessage.user_with_image("What's this?", img)
+        msg = ChatMessage.user_with_image("What's this?", sample_image_url)
 
         assert msg.text_content == "What's this?"
 
@@ -247,24 +323,50 @@ class TestChatMessageMultimodal:
         msg = ChatMessage.user("Hello")
         assert msg.has_images is False
 
-    def test_has_images_true_for_multimodal(self):
+    def test_has_images_true_for_multimodal(self, sample_image_url):
         """has_images is True for messages with images."""
-        from forge_llm.domain.value_objects.content import ImageContent
-
-        img = ImageContent.from_url("https://example.com/img.png")
-        msg = ChatMessage.user_with_image("Test", img)
+        msg = ChatMessage.user_with_image("Test", sample_image_url)
         assert msg.has_images is True
 
+    def test_to_dict_converts_content_blocks_once(self, sample_image_url, monkeypatch):
+        """Repeated to_dict() calls reuse the converted content blocks."""
+        msg = ChatMessage.user_with_image("What's this?", sample_image_url)
+        converted = []
+        image_to_dict = ImageContent.to_dict
+
+        def counting_to_dict(block):
+            converted.append(block)
+            return image_to_dict(block)
+
+        monkeypatch.setattr(ImageContent, "to_dict", counting_to_dict)
+
+        first, second = msg.to_dict(), msg.to_dict()
+
+        assert converted == [sample_image_url]
+        assert first == second
+        assert first is not second
+        assert msg == ChatMessage.user_with_image("What's this?", sample_image_url)
+
+    def test_to_dict_content_mutation_does_not_leak(self, sample_image_url):
+        """Mutating a returned payload leaves later to_dict() calls intact."""
+        msg = ChatMessage.user_with_image("What's this?", sample_image_url)
+
+        mutated = msg.to_dict()
+        mutated["content"][0]["text"] = "Changed"
+        mutated["content"].append({"type": "text", "text": "Extra"})
+
+        assert msg.to_dict()["content"] == [
+            {"type": "text", "text": "What's this?"},
+            sample_image_url.to_dict(),
+        ]
+
 
 class TestChatMessageAudio:
     """Tests for audio message support."""
 
-    def test_user_with_audio(self):
+    def test_user_with_audio(self, sample_audio_wav):
         """Can create user message with audio."""
-        from forge_llm.domain.value_objects.content import AudioContent, TextContent
-
-        audio = AudioContent.from_base64(data="abc123", format="wav")
-        msg = ChatMessage.user_with_audio("Transcribe this", audio)
+        msg = ChatMessage.user_with_audio("Transcribe this", sample_audio_wav)
 
         assert msg.role == "user"
         assert isinstance(msg.content, list)
@@ -272,12 +374,10 @@ class TestChatMessageAudio:
         assert isinstance(msg.content[0], TextContent)
         assert isinstance(msg.content[1], AudioContent)
 
-    def test_user_with_multiple_audios(self):
+    def test_user_with_multiple_audios(self, sample_audio_wav):
         """Can create user message with multiple audio files."""
-        from forge_llm.domain.value_objects.content import AudioContent
-
         audios = [
-            AudioContent.from_base64(data="abc123", format="wav"),
+            sample_audio_wav,
             AudioContent.from_base64(data="xyz789", format="mp3"),
         ]
         msg = ChatMessage.user_with_audios("Compare these", audios)
@@ -285,12 +385,9 @@ class TestChatMessageAudio:
         assert len(msg.content) == 3  # 1 text + 2 audios
         assert msg.has_audio is True
 
-    def test_has_audio_true(self):
+    def test_has_audio_true(self, sample_audio_wav):
         """has_audio is True for messages with audio."""
-        from forge_llm.domain.value_objects.content import AudioContent
-
-        audio = AudioContent.from_base64(data="abc123", format="wav")
-        msg = ChatMessage.user_with_audio("Test", audio)
+        msg = ChatMessage.user_with_audio("Test", sample_audio_wav)
         assert msg.has_audio is True
 
     def test_has_audio_false_for_text_only(self):
@@ -298,20 +395,14 @@ class TestChatMessageAudio:
         msg = ChatMessage.user("Hello")
         assert msg.has_audio is False
 
-    def test_has_audio_false_for_image_only(self):
+    def test_has_audio_false_for_image_only(self, sample_image_url):
         """has_audio is False for image-only messages."""
-        from forge_llm.domain.value_objects.content import ImageContent
-
-        img = ImageContent.from_url("https://example.com/img.png")
-        msg = ChatMessage.user_with_image("Test", img)
+        msg = ChatMessage.user_with_image("Test", sample_image_url)
         assert msg.has_audio is False
 
-    def test_to_dict_with_audio_content(self):
+    def test_to_dict_with_audio_content(self, sample_audio_wav):
         """to_dict() correctly serializes audio content."""
-        from forge_llm.domain.value_objects.content import AudioContent
-
-        audio = AudioContent.from_base64(data="abc123", format="wav")
-        msg = ChatMessage.user_with_audio("Transcribe", audio)
+        msg = ChatMessage.user_with_audio("Transcribe", sample_audio_wav)
 
         d = msg.to_dict()
 
@@ -325,8 +416,6 @@ class TestChatMessageAudio:
 
     def test_from_dict_with_audio_content(self):
         """from_dict() correctly parses audio content."""
-        from forge_llm.domain.value_objects.content import AudioContent, TextContent
-
         data = {
             "role": "user",
             "content": [
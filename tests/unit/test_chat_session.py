@@ -5,10 +5,16 @@ TDD tests for session management and context handling.
 """
 import pytest
 
+from forge_llm.application.session import TruncateCompactor
 from forge_llm.application.session.chat_session import ChatSession
 from forge_llm.domain import ContextOverflowError
 from forge_llm.domain.entities import ChatMessage
 
+# Message bodies sized to overflow small limits, built once per module
+_LONG_CONTENT = "word " * 100
+# ~85 tokens = 340 chars / 4
+_CONTENT_340 = "a" * 340
+
 
 class TestChatSession:
     """Tests for ChatSession."""
@@ -26,25 +32,50 @@ class TestChatSession:
 
         assert session.session_id == "my-session"
 
-    def test_add_message(self):
-        """Can add message to session."""
-        session = ChatSession()
-        msg = ChatMessage.user("Hello")
-
-        session.add_message(msg)
-
-        assert len(session.messages) == 1
-        assert session.messages[0].content == "Hello"
-
-    def test_add_multiple_messages(self):
-        """Can add multiple messages."""
-        session = ChatSession()
-
-        session.add_message(ChatMessage.system("Be helpful"))
-        session.add_message(ChatMessage.user("Hi"))
-        session.add_message(ChatMessage.assistant("Hello!"))
-
-        assert len(session.messages) == 3
+    @pytest.mark.parametrize(
+        ("system_prompt", "messages", "clear", "expected_contents"),
+        [
+            pytest.param(None, (ChatMessage.user("Hello"),), False, ["Hello"], id="single"),
+            pytest.param(
+                None,
+                (
+                    ChatMessage.system("Be helpful"),
+                    ChatMessage.user("Hi"),
+                    ChatMessage.assistant("Hello!"),
+                ),
+                False,
+                ["Be helpful", "Hi", "Hello!"],
+                id="multiple",
+            ),
+            pytest.param(
+                None,
+                (ChatMessage.user("Hi"), ChatMessage.assistant("Hello")),
+                True,
+                [],
+                id="clear",
+            ),
+            # clear() keeps the system prompt
+            pytest.param(
+                "Be helpful",
+                (ChatMessage.user("Hi"),),
+                True,
+                ["Be helpful"],
+                id="clear-preserves-system",
+            ),
+        ],
+    )
+    def test_add_messages(self, system_prompt, messages, clear, expected_contents):
+        """Added messages are kept in order, and clear() drops all but the system prompt."""
+        session = ChatSession(system_prompt=system_prompt)
+        for message in messages:
+            session.add_message(message)
+        if clear:
+            session.clear()
+
+        assert [m.content for m in session.messages] == expected_contents
+        expected_last = expected_contents[-1] if expected_contents else None
+        last = session.last_message
+        assert (last.content if last else None) == expected_last
 
     def test_get_messages_returns_copy(self):
         """messages property returns a copy."""
@@ -64,26 +95,6 @@ class TestChatSession:
         assert session.messages[0].role == "system"
         assert session.messages[0].content == "You are helpful"
 
-    def test_clear_messages(self):
-        """Can clear all messages."""
-        session = ChatSession()
-        session.add_message(ChatMessage.user("Hi"))
-        session.add_message(ChatMessage.assistant("Hello"))
-
-        session.clear()
-
-        assert len(session.messages) == 0
-
-    def test_clear_preserves_system_prompt(self):
-        """clear() preserves system prompt."""
-        session = ChatSession(system_prompt="Be helpful")
-        session.add_message(ChatMessage.user("Hi"))
-
-        session.clear()
-
-        assert len(session.messages) == 1
-        assert session.messages[0].role == "system"
-
     def test_token_count_estimation(self):
         """Can estimate token count."""
         session = ChatSession()
@@ -98,10 +109,8 @@ class TestChatSession:
         session = ChatSession(max_tokens=10)
 
         # Add a very long message that exceeds limit
-        long_content = "word " * 100
-
         with pytest.raises(ContextOverflowError):
-            session.add_message(ChatMessage.user(long_content))
+            session.add_message(ChatMessage.user(_LONG_CONTENT))
 
     def test_add_response(self):
         """Can add ChatResponse message to session."""
@@ -123,20 +132,22 @@ class TestChatSession:
         assert len(session.messages) == 1
         assert session.messages[0].content == "Hello!"
 
-    def test_last_message(self):
-        """Can get last message."""
-        session = ChatSession()
-        session.add_message(ChatMessage.user("First"))
-        session.add_message(ChatMessage.assistant("Second"))
-
-        assert session.last_message.content == "Second"
-
     def test_last_message_empty_session(self):
         """last_message returns None for empty session."""
         session = ChatSession()
 
         assert session.last_message is None
 
+    def test_logger_created_on_first_use(self):
+        """Sessions that never log do not build a logger."""
+        session = ChatSession(session_id="quiet", system_prompt="Be helpful")
+
+        assert "_logger" not in vars(session)
+
+        session.add_message(ChatMessage.user("Hello"))
+
+        assert "_logger" in vars(session)
+
 
 class TestTokenEstimation:
     """Tests for improved token estimation."""
@@ -166,11 +177,8 @@ class TestTokenEstimation:
         session = ChatSession(max_tokens=100, safety_margin=0.8)
 
         # Message that would fit in 100 but not in 80
-        # ~85 tokens = 340 chars / 4
-        content = "a" * 340
-
         with pytest.raises(ContextOverflowError):
-            session.add_message(ChatMessage.user(content))
+            session.add_message(ChatMessage.user(_CONTENT_340))
 
     def test_non_ascii_chars_counted_conservatively(self):
         """Non-ASCII characters are counted more conservatively."""
@@ -187,6 +195,15 @@ class TestTokenEstimation:
         # because non-ASCII may tokenize differently
         assert unicode_tokens >= ascii_tokens - 1  # Allow small variance
 
+    def test_non_ascii_text_estimates_higher(self):
+        """Multi-byte text estimates more tokens than ASCII of the same length."""
+        session = ChatSession()
+
+        ascii_tokens = session._estimate_message_tokens(ChatMessage.user("ab" * 400))
+        cjk_tokens = session._estimate_message_tokens(ChatMessage.user("你好" * 400))
+
+        assert cjk_tokens > ascii_tokens
+
     def test_estimate_tokens_includes_overhead(self):
         """Token estimation includes message overhead."""
         session = ChatSession()
@@ -197,6 +214,96 @@ class TestTokenEstimation:
 
         assert tokens >= 4  # Base overhead
 
+    def test_estimate_tokens_is_incremental(self, monkeypatch):
+        """Each message is estimated once on add; estimate_tokens() does not re-scan."""
+        session = ChatSession()
+        estimated = []
+        estimate = session._estimate_message_tokens
+
+        def counting_estimate(message):
+            tokens = estimate(message)
+            estimated.append(tokens)
+            return tokens
+
+        monkeypatch.setattr(session, "_estimate_message_tokens", counting_estimate)
+
+        for i in range(1000):
+            session.add_message(ChatMessage.user(f"message {i}"))
+        calls_after_adding = len(estimated)
+
+        assert session.estimate_tokens() == sum(estimated)
+        assert calls_after_adding == 1000
+        assert len(estimated) == calls_after_adding
+
+    def test_compaction_reuses_cached_estimates(self, monkeypatch):
+        """Messages kept by the compactor are not re-estimated."""
+        session = ChatSession(system_prompt="Be helpful", compactor=TruncateCompactor())
+        for i in range(20):
+            session.add_message(ChatMessage.user(f"Message number {i} " * 5))
+        before = session.estimate_tokens()
+
+        estimated = []
+        estimate = session._estimate_message_tokens
+
+        def counting_estimate(message):
+            estimated.append(message)
+            return estimate(message)
+
+        monkeypatch.setattr(session, "_estimate_message_tokens", counting_estimate)
+        session.compact(target_tokens=100)
+
+        assert estimated == []
+        assert session.estimate_tokens() < before
+        assert session.estimate_tokens() == sum(
+            estimate(m) for m in session.messages
+        )
+
+    def test_auto_compaction_checks_running_total(self, monkeypatch):
+        """Adding to a compacting session estimates only the new message."""
+        session = ChatSession(max_tokens=200, compactor=TruncateCompactor())
+        estimated = []
+        estimate = session._estimate_message_tokens
+
+        def counting_estimate(message):
+            estimated.append(message)
+            return estimate(message)
+
+        monkeypatch.setattr(session, "_estimate_message_tokens", counting_estimate)
+
+        for i in range(100):
+            session.add_message(ChatMessage.user(f"Turn {i} " * 5))
+
+        # Compaction ran repeatedly, but no kept message was re-estimated
+        assert len(session.messages) < 100
+        assert len(estimated) == 100
+
+    def test_auto_compaction_fits_non_ascii_history(self):
+        """Compaction brings CJK history under the session's own limit."""
+        session = ChatSession(max_tokens=200, compactor=TruncateCompactor())
+        for _ in range(10):
+            session.add_message(ChatMessage.user("日本語のテキスト" * 5))
+
+        # Effective limit is max_tokens * safety_margin
+        assert session.estimate_tokens() <= 160
+        assert len(session.messages) < 10
+
+    def test_estimate_tokens_tracks_compaction_and_clear(self):
+        """Running estimate matches a full recount after compact() and clear()."""
+        session = ChatSession(system_prompt="Be helpful", compactor=TruncateCompactor())
+        for i in range(10):
+            session.add_message(ChatMessage.user(f"Message number {i} " * 5))
+
+        def recount() -> int:
+            return sum(session._estimate_message_tokens(m) for m in session.messages)
+
+        assert session.estimate_tokens() == recount()
+
+        session.compact(target_tokens=60)
+        assert session.estimate_tokens() == recount()
+
+        session.clear()
+        assert session.estimate_tokens() == recount()
+
     def test_safety_margin_one_means_no_margin(self):
         """Safety margin of 1.0 means no safety buffer."""
         session = ChatSession(max_tokens=100, safety_margin=1.0)
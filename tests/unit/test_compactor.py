@@ -59,6 +59,21 @@ class TestTruncateCompactor:
 
         assert len(result) >= 1
 
+    def test_compact_keeps_newest_tail_in_order(self):
+        """Keeps the longest newest tail that fits, in original order."""
+        compactor = TruncateCompactor()
+        messages = [
+            ChatMessage.system("S"),
+            ChatMessage.user("a" * 40),
+            ChatMessage.user("b" * 40),
+            ChatMessage.user("c" * 40),
+        ]
+
+        # 4 (system) + 14 + 14 fits exactly; a third message would not
+        result = compactor.compact(messages, 32)
+
+        assert [m.content for m in result] == ["S", "b" * 40, "c" * 40]
+
 
 class TestMemorySessionStorage:
     """Tests for MemorySessionStorage."""
@@ -78,6 +93,17 @@ class TestMemorySessionStorage:
         assert loaded.session_id == "test-1"
         assert len(loaded.messages) == 1
 
+    def test_load_returns_saved_instance(self):
+        """load() hands back the saved session, not a copy."""
+        from forge_llm.application.session import ChatSession
+        from forge_llm.infrastructure.storage.memory_storage import MemorySessionStorage
+
+        storage = MemorySessionStorage()
+        session = ChatSession(session_id="same")
+        storage.save(session)
+
+        assert storage.load("same") is session
+
     def test_load_nonexistent_raises(self):
         """Loading nonexistent session raises error."""
         from forge_llm.domain import SessionNotFoundError
@@ -115,6 +141,16 @@ class TestMemorySessionStorage:
 
         assert storage.exists("delete-test") is False
 
+    def test_delete_nonexistent_is_noop(self):
+        """Deleting an unknown session ID does nothing."""
+        from forge_llm.infrastructure.storage.memory_storage import MemorySessionStorage
+
+        storage = MemorySessionStorage()
+
+        storage.delete("missing")
+
+        assert storage.list_sessions() == []
+
     def test_list_sessions(self):
         """Can list all session IDs."""
         from forge_llm.application.session import ChatSession
@@ -128,3 +164,39 @@ class TestMemorySessionStorage:
 
         assert "a" in sessions
         assert "b" in sessions
+
+    def test_list_sessions_is_a_snapshot(self):
+        """list_sessions() can be iterated while deleting sessions."""
+        from forge_llm.application.session import ChatSession
+        from forge_llm.infrastructure.storage.memory_storage import MemorySessionStorage
+
+        storage = MemorySessionStorage()
+        storage.save(ChatSession(session_id="a"))
+        storage.save(ChatSession(session_id="b"))
+
+        for session_id in storage.list_sessions():
+            storage.delete(session_id)
+
+        assert storage.list_sessions() == []
+
+    def test_concurrent_access(self):
+        """Threads can save, list, load and delete without a lock."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from forge_llm.application.session import ChatSession
+        from forge_llm.infrastructure.storage.memory_storage import MemorySessionStorage
+
+        storage = MemorySessionStorage()
+
+        def churn(worker: int) -> None:
+            for i in range(200):
+                session_id = f"{worker}-{i}"
+                storage.save(ChatSession(session_id=session_id))
+                assert storage.load(session_id).session_id == session_id
+                storage.list_sessions()
+                storage.delete(session_id)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(churn, range(4)))
+
+        assert storage.list_sessions() == []
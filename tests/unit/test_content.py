@@ -1,4 +1,6 @@
 """Unit tests for content value objects."""
+import base64
+import pickle
 import tempfile
 
 import pytest
@@ -36,6 +38,15 @@ class TestTextContent:
         with pytest.raises(AttributeError):
             text.text = "World"  # type: ignore
 
+    def test_formats_return_fresh_dicts(self) -> None:
+        # Callers (adapters, JSON persistence) may mutate or serialize the
+        # result, so it must be a new plain dict on every call
+        text = TextContent(text="Hello")
+        for convert in (text.to_openai_format, text.to_anthropic_format, text.to_dict):
+            first = convert()
+            assert type(first) is dict
+            assert first is not convert()
+
 
 class TestImageContentFromUrl:
     """Tests for ImageContent created from URL."""
@@ -126,6 +137,34 @@ class TestImageContentValidation:
         with pytest.raises(AttributeError):
             img.url = "https://other.com/img.png"  # type: ignore
 
+    @pytest.mark.parametrize(
+        ("factory", "match"),
+        [
+            pytest.param(lambda: ImageContent.from_url(""), "url is required", id="url"),
+            pytest.param(
+                lambda: ImageContent.from_base64(data="", media_type="image/jpeg"),
+                "data is required",
+                id="base64-data",
+            ),
+            pytest.param(
+                lambda: ImageContent.from_base64(data="abc123", media_type=""),
+                "media_type is required",
+                id="base64-media-type",
+            ),
+        ],
+    )
+    def test_factories_validate(self, factory, match) -> None:
+        with pytest.raises(ValueError, match=match):
+            factory()
+
+    def test_factories_match_constructor(self) -> None:
+        assert ImageContent.from_url("https://x.com/a.png", detail="low") == ImageContent(
+            source_type="url", url="https://x.com/a.png", detail="low"
+        )
+        assert ImageContent.from_base64(data="abc", media_type="image/png") == ImageContent(
+            source_type="base64", data="abc", media_type="image/png"
+        )
+
 
 class TestContentBlockTypeAlias:
     """Tests for ContentBlock type alias."""
@@ -142,6 +181,18 @@ class TestContentBlockTypeAlias:
         audio: ContentBlock = AudioContent.from_base64(data="abc123", format="wav")
         assert isinstance(audio, AudioContent)
 
+    @pytest.mark.parametrize(
+        "block",
+        [
+            pytest.param(TextContent(text="Hello"), id="text"),
+            pytest.param(ImageContent.from_url("https://example.com/img.png"), id="image"),
+            pytest.param(AudioContent.from_base64(data="abc123", format="wav"), id="audio"),
+        ],
+    )
+    def test_blocks_are_slotted_and_picklable(self, block: ContentBlock) -> None:
+        assert not hasattr(block, "__dict__")
+        assert pickle.loads(pickle.dumps(block)) == block
+
 
 class TestAudioContent:
     """Tests for AudioContent."""
@@ -201,6 +252,17 @@ class TestAudioContentValidation:
         with pytest.raises(ValueError, match="format must be 'wav' or 'mp3'"):
             AudioContent(data="abc123", format="ogg")  # type: ignore
 
+    def test_from_base64_validates(self) -> None:
+        with pytest.raises(ValueError, match="data is required"):
+            AudioContent.from_base64(data="", format="wav")
+        with pytest.raises(ValueError, match="format must be 'wav' or 'mp3'"):
+            AudioContent.from_base64(data="abc123", format="ogg")  # type: ignore
+
+    def test_from_base64_matches_constructor(self) -> None:
+        assert AudioContent.from_base64(data="abc123", format="mp3") == AudioContent(
+            data="abc123", format="mp3"
+        )
+
 
 class TestAudioContentFromFile:
     """Tests for AudioContent.from_file()."""
@@ -227,3 +289,18 @@ class TestAudioContentFromFile:
             f.flush()
             with pytest.raises(ValueError, match="Audio file must be .wav or .mp3"):
                 AudioContent.from_file(f.name)
+
+    def test_from_file_encodes_contents(self) -> None:
+        payload = bytes(range(256)) * 3
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+            f.write(payload)
+            f.flush()
+            audio = AudioContent.from_file(f.name)
+            assert base64.b64decode(audio.data) == payload
+
+    def test_from_empty_file(self) -> None:
+        with (
+            tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f,
+            pytest.raises(ValueError, match="data is required"),
+        ):
+            AudioContent.from_file(f.name)
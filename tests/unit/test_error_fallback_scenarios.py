@@ -3,8 +3,7 @@ Tests for error handling and fallback scenarios.
 
 Tests retry behavior, provider failures, graceful degradation, and recovery.
 """
-import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -22,126 +21,151 @@ from forge_llm.infrastructure.resilience import (
 )
 
 
+def _make_agent(
+    provider_mock: MagicMock, provider: str = "openai", api_key: str = "test-key"
+) -> ChatAgent:
+    """Build a ChatAgent wired to a mocked provider."""
+    agent = ChatAgent(provider=provider, api_key=api_key)
+    agent._provider = provider_mock
+    return agent
+
+
+@pytest.fixture
+def fast_sleeper() -> MagicMock:
+    """Sleeper that records backoff delays instead of sleeping."""
+    return MagicMock()
+
+
 class TestRetryMechanism:
     """Tests for retry decorator behavior."""
 
-    def test_retry_succeeds_on_second_attempt(self):
+    def test_retry_succeeds_on_second_attempt(self, fast_sleeper):
         """Function should succeed after transient failure."""
-        call_count = [0]
+        call_count = 0
 
-        @with_retry(max_attempts=3, min_wait=0.01, max_wait=0.1)
+        @with_retry(max_attempts=3, sleeper=fast_sleeper)
         def flaky_function():
-            call_count[0] += 1
-            if call_count[0] < 2:
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
                 raise ConnectionError("Temporary failure")
             return "success"
 
         result = flaky_function()
 
         assert result == "success"
-        assert call_count[0] == 2
+        assert call_count == 2
 
-    def test_retry_exhausts_all_attempts(self):
+    def test_retry_exhausts_all_attempts(self, fast_sleeper):
         """Function should raise after exhausting all retry attempts."""
-        call_count = [0]
+        call_count = 0
 
-        @with_retry(max_attempts=3, min_wait=0.01, max_wait=0.1)
+        @with_retry(max_attempts=3, sleeper=fast_sleeper)
         def always_fails():
-            call_count[0] += 1
+            nonlocal call_count
+            call_count += 1
             raise ConnectionError("Persistent failure")
 
         with pytest.raises(ConnectionError):
             always_fails()
 
-        assert call_count[0] == 3
+        assert call_count == 3
+        assert fast_sleeper.call_count == 2  # Backoff between attempts only
 
-    def test_retry_does_not_retry_non_retryable_errors(self):
+    def test_retry_does_not_retry_non_retryable_errors(self, fast_sleeper):
         """Non-retryable errors should not trigger retry."""
-        call_count = [0]
+        call_count = 0
 
-        @with_retry(max_attempts=3, min_wait=0.01, max_wait=0.1)
+        @with_retry(max_attempts=3, sleeper=fast_sleeper)
         def raises_value_error():
-            call_count[0] += 1
+            nonlocal call_count
+            call_count += 1
             raise ValueError("Not retryable")
 
         with pytest.raises(ValueError):
             raises_value_error()
 
-        assert call_count[0] == 1  # Only called once
+        assert call_count == 1  # Only called once
 
-    def test_retry_with_custom_exceptions(self):
+    def test_retry_with_custom_exceptions(self, fast_sleeper):
         """Retry should work with custom exception types."""
-        call_count = [0]
+        call_count = 0
 
         class CustomError(Exception):
             pass
 
         @with_retry(
             max_attempts=3,
-            min_wait=0.01,
-            max_wait=0.1,
             retryable_exceptions=(CustomError,),
+            sleeper=fast_sleeper,
         )
         def custom_failure():
-            call_count[0] += 1
-            if call_count[0] < 3:
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
                 raise CustomError("Custom error")
             return "success"
 
         result = custom_failure()
 
         assert result == "success"
-        assert call_count[0] == 3
+        assert call_count == 3
 
 
 class TestRateLimitRetry:
     """Tests for rate limit specific retry behavior."""
 
-    def test_rate_limit_retry_on_429_error(self):
+    def test_rate_limit_retry_on_429_error(self, fast_sleeper):
         """Should retry on 429 rate limit error."""
-        call_count = [0]
+        call_count = 0
 
-        @retry_on_rate_limit(max_attempts=3, min_wait=0.01, max_wait=0.1)
+        @retry_on_rate_limit(max_attempts=3, sleeper=fast_sleeper)
         def rate_limited():
-            call_count[0] += 1
-            if call_count[0] < 2:
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
                 raise Exception("Error 429: Too many requests")
             return "success"
 
         result = rate_limited()
 
         assert result == "success"
-        assert call_count[0] == 2
+        assert call_count == 2
+        fast_sleeper.assert_called_once()
+        (delay,), _ = fast_sleeper.call_args
+        assert 1.0 <= delay <= 2.0  # jittered in [min_wait, 2 * min_wait]
 
-    def test_rate_limit_retry_on_rate_exceeded(self):
+    def test_rate_limit_retry_on_rate_exceeded(self, fast_sleeper):
         """Should retry on 'rate limit exceeded' message."""
-        call_count = [0]
+        call_count = 0
 
-        @retry_on_rate_limit(max_attempts=3, min_wait=0.01, max_wait=0.1)
+        @retry_on_rate_limit(max_attempts=3, sleeper=fast_sleeper)
         def rate_limited():
-            call_count[0] += 1
-            if call_count[0] < 2:
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
                 raise Exception("Rate limit exceeded. Please slow down.")
             return "success"
 
         result = rate_limited()
 
         assert result == "success"
-        assert call_count[0] == 2
+        assert call_count == 2
 
-    def test_rate_limit_no_retry_on_other_errors(self):
+    def test_rate_limit_no_retry_on_other_errors(self, fast_sleeper):
         """Should not retry on non-rate-limit errors."""
-        call_count = [0]
+        call_count = 0
 
-        @retry_on_rate_limit(max_attempts=3, min_wait=0.01, max_wait=0.1)
+        @retry_on_rate_limit(max_attempts=3, sleeper=fast_sleeper)
         def other_error():
-            call_count[0] += 1
+            nonlocal call_count
+            call_count += 1
             raise Exception("Some other error")
 
         with pytest.raises(Exception, match="Some other error"):
             other_error()
 
-        assert call_count[0] == 1
+        assert call_count == 1
 
 
 class TestRetryConfig:
@@ -187,31 +211,29 @@ class TestRetryConfig:
         config = RetryConfig(max_attempts=2, min_wait=0.01, max_wait=0.1)
         decorator = config.get_retry_decorator()
 
-        call_count = [0]
+        call_count = 0
 
         @decorator
         def flaky():
-            call_count[0] += 1
-            if call_count[0] < 2:
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
                 raise ConnectionError("fail")
             return "ok"
 
         result = flaky()
         assert result == "ok"
-        assert call_count[0] == 2
+        assert call_count == 2
 
 
 class TestProviderErrorHandling:
     """Tests for provider-specific error handling."""
 
-    def test_openai_api_error_converted_to_provider_error(self):
+    def test_openai_api_error_converted_to_provider_error(self, mocked_agent):
         """OpenAI API errors should be converted to ProviderError."""
-        mock_provider = MagicMock()
+        agent, mock_provider = mocked_agent
         mock_provider.send.side_effect = Exception("OpenAI API Error: Service unavailable")
 
-        agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
-
         with pytest.raises((ProviderError, Exception)):
             agent.chat("Hello")
 
@@ -220,8 +242,7 @@ class TestProviderErrorHandling:
         mock_provider = MagicMock()
         mock_provider.send.side_effect = Exception("Anthropic API is currently overloaded")
 
-        agent = ChatAgent(provider="anthropic", api_key="test-key")
-        agent._provider = mock_provider
+        agent = _make_agent(mock_provider, provider="anthropic")
 
         with pytest.raises(Exception, match="overloaded"):
             agent.chat("Hello")
@@ -231,20 +252,16 @@ class TestProviderErrorHandling:
         mock_provider = MagicMock()
         mock_provider.send.side_effect = Exception("Invalid API key provided")
 
-        agent = ChatAgent(provider="openai", api_key="invalid-key")
-        agent._provider = mock_provider
+        agent = _make_agent(mock_provider, api_key="invalid-key")
 
         with pytest.raises(AuthenticationError):
             agent.chat("Hello")
 
-    def test_quota_exceeded_error(self):
+    def test_quota_exceeded_error(self, mocked_agent):
         """Quota exceeded should be handled appropriately."""
-        mock_provider = MagicMock()
+        agent, mock_provider = mocked_agent
         mock_provider.send.side_effect = Exception("You have exceeded your quota")
 
-        agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
-
         with pytest.raises(Exception, match="exceeded"):
             agent.chat("Hello")
 
@@ -252,9 +269,9 @@ class TestProviderErrorHandling:
 class TestGracefulDegradation:
     """Tests for graceful degradation scenarios."""
 
-    def test_partial_response_handling(self):
+    def test_partial_response_handling(self, mocked_agent):
         """Agent should handle partial/incomplete responses."""
-        mock_provider = MagicMock()
+        agent, mock_provider = mocked_agent
         mock_provider.send.return_value = {
             "content": "Partial response...",
             "role": "assistant",
@@ -264,17 +281,14 @@ class TestGracefulDegradation:
             "finish_reason": "length",  # Truncated
         }
 
-        agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
-
         response = agent.chat("Hello")
 
         assert response.content == "Partial response..."
         # Response should indicate truncation
 
-    def test_missing_usage_data(self):
+    def test_missing_usage_data(self, mocked_agent):
         """Agent should handle missing usage data gracefully."""
-        mock_provider = MagicMock()
+        agent, mock_provider = mocked_agent
         mock_provider.send.return_value = {
             "content": "Response",
             "role": "assistant",
@@ -283,17 +297,14 @@ class TestGracefulDegradation:
             # No usage field
         }
 
-        agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
-
         response = agent.chat("Hello")
 
         assert response.content == "Response"
         # Should not crash on missing usage
 
-    def test_malformed_tool_call_response(self):
+    def test_malformed_tool_call_response(self, mocked_agent):
         """Agent should handle malformed tool call responses."""
-        mock_provider = MagicMock()
+        agent, mock_provider = mocked_agent
         mock_provider.send.return_value = {
             "content": None,
             "role": "assistant",
@@ -308,9 +319,6 @@ class TestGracefulDegradation:
             "usage": {},
         }
 
-        agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
-
         # Should handle gracefully without crashing
         response = agent.chat("Hello", auto_execute_tools=False)
         assert response is not None
@@ -319,10 +327,10 @@ class TestGracefulDegradation:
 class TestSessionErrorRecovery:
     """Tests for session-level error recovery."""
 
-    def test_session_continues_after_error(self):
+    def test_session_continues_after_error(self, mocked_agent, scripted_responses):
         """Session should continue working after an error."""
-        mock_provider = MagicMock()
-        mock_provider.send.side_effect = [
+        agent, mock_provider = mocked_agent
+        mock_provider.send.side_effect = scripted_responses(
             # First call succeeds
             {
                 "content": "Hello!",
@@ -341,10 +349,8 @@ class TestSessionErrorRecovery:
                 "provider": "openai",
                 "usage": {},
             },
-        ]
+        )
 
-        agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
         session = ChatSession()
 
         # First call works
@@ -359,10 +365,12 @@ class TestSessionErrorRecovery:
         agent.chat("Once more", session=session)
         assert len(session.messages) >= 4
 
-    def test_session_preserves_context_after_error(self):
+    def test_session_preserves_context_after_error(
+        self, mocked_agent, scripted_responses
+    ):
         """Session context should be preserved after errors."""
-        mock_provider = MagicMock()
-        mock_provider.send.side_effect = [
+        agent, mock_provider = mocked_agent
+        mock_provider.send.side_effect = scripted_responses(
             {
                 "content": "Your name is Bob",
                 "role": "assistant",
@@ -378,10 +386,8 @@ class TestSessionErrorRecovery:
                 "provider": "openai",
                 "usage": {},
             },
-        ]
+        )
 
-        agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
         session = ChatSession(system_prompt="Remember user details")
 
         # Set context
@@ -399,18 +405,16 @@ class TestSessionErrorRecovery:
 class TestInputValidation:
     """Tests for input validation edge cases."""
 
-    def test_rejects_empty_string_message(self):
+    def test_rejects_empty_string_message(self, mocked_agent):
         """Should reject empty string message."""
-        mock_provider = MagicMock()
-        agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
+        agent, _ = mocked_agent
 
         with pytest.raises(InvalidMessageError):
             agent.chat("")  # Empty string should be rejected
 
-    def test_accepts_message_with_whitespace_around_content(self):
+    def test_accepts_message_with_whitespace_around_content(self, mocked_agent):
         """Should accept messages with whitespace padding around content."""
-        mock_provider = MagicMock()
+        agent, mock_provider = mocked_agent
         mock_provider.send.return_value = {
             "content": "Response",
             "role": "assistant",
@@ -419,16 +423,55 @@ class TestInputValidation:
             "usage": {},
         }
 
-        agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
-
         # Should not raise - has non-whitespace content
         response = agent.chat("  Hello  ")
         assert response.content == "Response"
+        # Sent as given, not stripped
+        sent = mock_provider.send.call_args[0][0]
+        assert sent[-1]["content"] == "  Hello  "
+
+    def test_rejects_whitespace_only_message(self, mocked_agent):
+        """Should reject whitespace-only text without calling the provider."""
+        agent, mock_provider = mocked_agent
+
+        with pytest.raises(InvalidMessageError, match="cannot be empty"):
+            agent.chat(" \n\t ")
+
+        mock_provider.send.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("length", "rejected"),
+        [
+            pytest.param(10, False, id="at-cap"),
+            pytest.param(11, True, id="over-cap"),
+        ],
+    )
+    def test_max_message_chars(self, length, rejected):
+        """Should reject text over max_message_chars before sending."""
+        agent = ChatAgent(provider="openai", api_key="test-key", max_message_chars=10)
+        agent._provider = MagicMock()
+        agent._provider.send.return_value = {"content": "Response", "role": "assistant"}
+
+        if rejected:
+            with pytest.raises(InvalidMessageError, match="exceeds 10 characters"):
+                agent.chat("x" * length)
+            agent._provider.send.assert_not_called()
+        else:
+            assert agent.chat("x" * length).content == "Response"
+
+    def test_no_length_cap_by_default(self, mocked_agent):
+        """Should send long text when no max_message_chars is configured."""
+        agent, mock_provider = mocked_agent
+        mock_provider.send.return_value = {"content": "Response", "role": "assistant"}
+
+        # ~200k tokens, e.g. a full Anthropic context window
+        response = agent.chat("x" * (4 * 200_000))
+
+        assert response.content == "Response"
 
-    def test_rejects_none_message(self):
+    def test_rejects_none_message(self, mocked_agent):
         """Should reject None as message input."""
-        agent = ChatAgent(provider="openai", api_key="test-key")
+        agent, _ = mocked_agent
 
         with pytest.raises((InvalidMessageError, TypeError)):
             agent.chat(None)
@@ -437,25 +480,19 @@ class TestInputValidation:
 class TestTimeoutScenarios:
     """Tests for timeout-related scenarios."""
 
-    def test_configurable_timeout(self):
+    def test_configurable_timeout(self, mocked_agent):
         """Agent should support configurable timeout."""
-        mock_provider = MagicMock()
+        agent, mock_provider = mocked_agent
         mock_provider.send.side_effect = TimeoutError("Request timed out")
 
-        agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
-
         with pytest.raises(RequestTimeoutError):
             agent.chat("Hello")
 
-    def test_timeout_includes_provider_info(self):
+    def test_timeout_includes_provider_info(self, mocked_agent):
         """Timeout error should include provider information."""
-        mock_provider = MagicMock()
+        agent, mock_provider = mocked_agent
         mock_provider.send.side_effect = TimeoutError("Timed out")
 
-        agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
-
         with pytest.raises(RequestTimeoutError) as exc_info:
             agent.chat("Hello")
 
@@ -471,8 +508,7 @@ class TestErrorMessageSafety:
         secret_key = "sk-super-secret-key-12345"
         mock_provider.send.side_effect = Exception(f"Invalid API key: {secret_key}")
 
-        agent = ChatAgent(provider="openai", api_key=secret_key)
-        agent._provider = mock_provider
+        agent = _make_agent(mock_provider, api_key=secret_key)
 
         with pytest.raises(AuthenticationError) as exc_info:
             agent.chat("Hello")
@@ -480,15 +516,12 @@ class TestErrorMessageSafety:
         error_str = str(exc_info.value)
         assert secret_key not in error_str
 
-    def test_error_does_not_expose_message_content(self):
+    def test_error_does_not_expose_message_content(self, mocked_agent):
         """Errors should not expose user message content in logs."""
-        mock_provider = MagicMock()
+        agent, mock_provider = mocked_agent
         sensitive_message = "My password is hunter2"
         mock_provider.send.side_effect = Exception("Generic error")
 
-        agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
-
         try:
             agent.chat(sensitive_message)
         except Exception as e:
@@ -500,17 +533,18 @@ class TestErrorMessageSafety:
 class TestConcurrentErrorHandling:
     """Tests for error handling in concurrent scenarios."""
 
-    def test_independent_errors_per_request(self):
+    def test_independent_errors_per_request(self, mocked_agent):
         """Errors in one request should not affect others."""
-        mock_provider = MagicMock()
-        call_count = [0]
+        agent, mock_provider = mocked_agent
+        call_count = 0
 
         def alternating_responses(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] % 2 == 1:
+            nonlocal call_count
+            call_count += 1
+            if call_count % 2 == 1:
                 raise ConnectionError("Odd request fails")
             return {
-                "content": f"Response {call_count[0]}",
+                "content": f"Response {call_count}",
                 "role": "assistant",
                 "model": "gpt-4",
                 "provider": "openai",
@@ -519,9 +553,6 @@ class TestConcurrentErrorHandling:
 
         mock_provider.send.side_effect = alternating_responses
 
-        agent = ChatAgent(provider="openai", api_key="test-key")
-        agent._provider = mock_provider
-
         # First request fails
         with pytest.raises(ConnectionError):
             agent.chat("Hello 1")
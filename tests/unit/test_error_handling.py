@@ -3,7 +3,7 @@ Unit tests for error handling (chat.feature errors).
 
 TDD tests for InvalidMessageError, RequestTimeoutError, AuthenticationError.
 """
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -13,7 +13,6 @@ from forge_llm.domain import (
     InvalidMessageError,
     RequestTimeoutError,
 )
-from forge_llm.domain.entities import ChatMessage
 
 
 class TestInvalidMessageError:
@@ -54,6 +53,24 @@ class TestInvalidMessageError:
 
         mock_provider.send.assert_not_called()
 
+    @pytest.mark.parametrize(
+        "messages",
+        [
+            pytest.param("", id="empty-string"),
+            pytest.param([], id="empty-list"),
+            pytest.param(None, id="none"),
+        ],
+    )
+    def test_invalid_input_rejected_before_provider_resolution(self, messages):
+        """Input is validated before the provider is resolved or configured."""
+        # No API key: resolving the provider would raise ProviderNotConfiguredError
+        agent = ChatAgent(provider="openai")
+
+        with pytest.raises(InvalidMessageError):
+            agent.chat(messages)
+
+        assert agent._provider is None
+
     def test_chat_allows_valid_message(self):
         """chat() allows valid non-empty message."""
         mock_provider = MagicMock()
@@ -138,6 +155,33 @@ class TestAuthenticationError:
             agent.chat("Hello")
 
 
+    @pytest.mark.parametrize(
+        ("details", "api_key", "secret"),
+        [
+            pytest.param(
+                "Invalid key sk-proj-abc123DEF456",
+                None,
+                "sk-proj-abc123DEF456",
+                id="sk",
+            ),
+            pytest.param(
+                "Header Authorization: Bearer eyJhbGciOi.payload",
+                None,
+                "eyJhbGciOi.payload",
+                id="bearer",
+            ),
+            pytest.param("Key test-key rejected", "test-key", "test-key", id="api-key"),
+        ],
+    )
+    def test_auth_error_redacts_details(self, details, api_key, secret):
+        """Credentials in details are redacted when the error is built."""
+        error = AuthenticationError("openai", details, api_key=api_key)
+
+        assert secret not in str(error)
+        assert secret not in error.message
+        assert "[REDACTED]" in str(error)
+
+
 class TestEmptyResponseWarning:
     """Tests for empty response handling."""
 
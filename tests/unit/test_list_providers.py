@@ -6,22 +6,16 @@ TDD tests for listing available providers with models.
 import pytest
 
 from forge_llm.domain import UnsupportedProviderError
-from forge_llm.domain.entities import ProviderConfig
 from forge_llm.infrastructure.providers import (
     AnthropicAdapter,
     OpenAIAdapter,
     get_provider_registry,
-    reset_provider_registry,
 )
 
 
 class TestListProviders:
     """Tests for listing available providers."""
 
-    def setup_method(self):
-        """Reset registry before each test."""
-        reset_provider_registry()
-
     def test_list_registered_providers(self):
         """Can list registered providers."""
         registry = get_provider_registry()
@@ -83,3 +77,42 @@ class TestListProviders:
 
         with pytest.raises(UnsupportedProviderError):
             registry.get_provider_info("nonexistent")
+
+    def test_providers_with_models_is_reused_until_register(self):
+        """The read-only listing is cached and rebuilt after register()."""
+        registry = get_provider_registry()
+        registry.register("openai", OpenAIAdapter)
+
+        first = registry.list_providers_with_models()
+
+        assert registry.list_providers_with_models() is first
+        with pytest.raises(TypeError):
+            first["openai"]["models"] = ()  # type: ignore[index]
+
+        registry.register("anthropic", AnthropicAdapter)
+
+        assert "anthropic" in registry.list_providers_with_models()
+        assert "anthropic" not in first
+
+    def test_providers_with_models_cleared(self):
+        """clear() drops the cached listing."""
+        registry = get_provider_registry()
+        registry.register("openai", OpenAIAdapter)
+        registry.list_providers_with_models()
+
+        registry.clear()
+
+        assert registry.list_providers_with_models() == {}
+
+    def test_provider_info_returns_independent_lists(self):
+        """Each get_provider_info() call returns its own models list."""
+        registry = get_provider_registry()
+        registry.register("openai", OpenAIAdapter)
+
+        info = registry.get_provider_info("openai")
+        info["models"].clear()
+
+        assert registry.get_provider_info("openai")["models"] == list(
+            OpenAIAdapter.SUPPORTED_MODELS
+        )
+        assert len(registry.list_providers_with_models()["openai"]["models"]) > 0
@@ -175,6 +175,7 @@ class TestOllamaSend:
 class TestOllamaStream:
     """Tests for Ollama streaming."""
 
+    @pytest.mark.slow
     @patch("httpx.Client")
     def test_stream_yields_chunks(self, mock_client_class):
         """stream() yields dictionaries with content."""
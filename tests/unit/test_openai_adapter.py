@@ -8,7 +8,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from forge_llm import ChatAgent, ChatMessage, ToolDefinition
-from forge_llm.domain import AuthenticationError, ProviderNotConfiguredError
+from forge_llm.domain import ProviderNotConfiguredError
 from forge_llm.domain.entities import ProviderConfig
 from forge_llm.infrastructure.providers.openai_adapter import OpenAIAdapter
 
@@ -98,6 +98,34 @@ class TestOpenAIAdapter:
         call_kwargs = mock_client.chat.completions.create.call_args.kwargs
         assert call_kwargs["model"] == "gpt-3.5-turbo"
 
+    @pytest.mark.parametrize(
+        ("config", "expected_headers"),
+        [
+            pytest.param(
+                {"idempotency_key": "req-123"},
+                {"Idempotency-Key": "req-123"},
+                id="with-key",
+            ),
+            pytest.param(None, None, id="without-key"),
+        ],
+    )
+    def test_send_forwards_idempotency_key(self, config, expected_headers):
+        """send() sends the config's idempotency key as a request header."""
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Response"
+        mock_response.choices[0].message.role = "assistant"
+        mock_client.chat.completions.create.return_value = mock_response
+
+        adapter = OpenAIAdapter(ProviderConfig(provider="openai", api_key="test-key"))
+        adapter._client = mock_client  # Inject mock client
+
+        adapter.send([{"role": "user", "content": "test"}], config=config)
+
+        call_kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert call_kwargs.get("extra_headers") == expected_headers
+
     def test_stream_yields_chunks(self):
         """stream() should yield response chunks."""
         mock_client = MagicMock()
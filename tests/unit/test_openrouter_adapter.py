@@ -3,8 +3,7 @@ Unit tests for OpenRouterAdapter.
 
 Tests OpenRouter API adapter with mocked HTTP responses.
 """
-import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -47,6 +47,12 @@ class TestProviderConfig:
 
         assert config.max_retries == 3
 
+    def test_provider_config_default_max_message_chars(self):
+        """ProviderConfig has no message length limit by default."""
+        config = ProviderConfig(provider="anthropic")
+
+        assert config.max_message_chars is None
+
     def test_provider_config_immutable(self):
         """ProviderConfig should be immutable (frozen dataclass)."""
         config = ProviderConfig(provider="openai")
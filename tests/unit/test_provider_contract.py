@@ -5,7 +5,7 @@ These tests ensure that OpenAI and Anthropic adapters have
 identical behavior and return consistent response formats.
 """
 from abc import ABC, abstractmethod
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
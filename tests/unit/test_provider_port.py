@@ -3,11 +3,9 @@ Unit tests for ILLMProviderPort interface.
 
 TDD RED phase: Tests define the expected interface contract.
 """
-from typing import Protocol, runtime_checkable
+from typing import Protocol
 from unittest.mock import MagicMock
 
-import pytest
-
 from forge_llm.application.ports.provider_port import ILLMProviderPort
 from forge_llm.domain.entities import ProviderConfig
 
@@ -3,6 +3,8 @@ Unit tests for ProviderRegistry.
 
 TDD RED phase: Tests for specialized provider registration.
 """
+import subprocess
+import sys
 from unittest.mock import MagicMock
 
 import pytest
@@ -10,7 +12,6 @@ import pytest
 from forge_llm.domain import UnsupportedProviderError
 from forge_llm.domain.entities import ProviderConfig
 from forge_llm.infrastructure.providers.registry import (
-    ProviderRegistry,
     get_provider_registry,
     reset_provider_registry,
 )
@@ -19,10 +20,6 @@ from forge_llm.infrastructure.providers.registry import (
 class TestProviderRegistry:
     """Tests for ProviderRegistry."""
 
-    def setup_method(self):
-        """Reset registry before each test."""
-        reset_provider_registry()
-
     def test_register_provider(self):
         """Can register a provider adapter."""
         registry = get_provider_registry()
@@ -92,3 +89,19 @@ class TestProviderRegistry:
         registry = get_provider_registry()
 
         assert registry.has_provider("openai") is False
+
+
+class TestProviderImports:
+    """Tests for provider package import cost."""
+
+    def test_import_does_not_load_http_sdks(self):
+        """Importing the providers package defers httpx and the provider SDKs."""
+        code = (
+            "import sys, forge_llm.infrastructure.providers; "
+            "print(sorted({'httpx', 'openai', 'anthropic'} & set(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
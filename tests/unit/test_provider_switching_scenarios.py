@@ -13,7 +13,6 @@ from forge_llm.domain.entities import ProviderConfig
 from forge_llm.infrastructure.providers.registry import (
     ProviderRegistry,
     get_provider_registry,
-    reset_provider_registry,
 )
 
 
@@ -80,14 +79,6 @@ class TestProviderConfig:
 class TestProviderRegistry:
     """Tests for ProviderRegistry."""
 
-    def setup_method(self):
-        """Reset registry before each test."""
-        reset_provider_registry()
-
-    def teardown_method(self):
-        """Reset registry after each test."""
-        reset_provider_registry()
-
     def test_registry_register_provider(self):
         """Registry should register provider factories."""
         registry = ProviderRegistry()
@@ -358,20 +349,18 @@ class TestProviderTimeout:
 class TestProviderRetryConfig:
     """Tests for provider retry configuration."""
 
-    def test_default_max_retries(self):
-        """Default max retries should be set."""
-        config = ProviderConfig(provider="openai")
-        assert config.max_retries == 3
-
-    def test_custom_max_retries(self):
-        """Should accept custom max retries."""
-        config = ProviderConfig(provider="openai", max_retries=5)
-        assert config.max_retries == 5
-
-    def test_no_retries(self):
-        """Should accept zero retries."""
-        config = ProviderConfig(provider="openai", max_retries=0)
-        assert config.max_retries == 0
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            pytest.param({}, 3, id="default"),
+            pytest.param({"max_retries": 5}, 5, id="custom"),
+            pytest.param({"max_retries": 0}, 0, id="no-retries"),
+        ],
+    )
+    def test_max_retries(self, kwargs, expected):
+        """max_retries defaults to 3 and accepts custom values, including zero."""
+        config = ProviderConfig(provider="openai", **kwargs)
+        assert config.max_retries == expected
 
 
 class TestMultiProviderWorkflow:
@@ -3,18 +3,39 @@ Unit tests for resilience utilities.
 
 TDD tests for retry with backoff functionality.
 """
-import time
-from unittest.mock import MagicMock, patch
+
+import asyncio
+import contextlib
+import random
+import statistics
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
+from forge_llm.domain import CircuitOpenError
 from forge_llm.infrastructure.resilience import (
     DEFAULT_RETRY_CONFIG,
+    CircuitBreaker,
     RetryConfig,
+    parse_retry_after,
     retry_on_rate_limit,
     with_retry,
+    with_retry_async,
 )
 
+_CUSTOM_RETRY = {
+    "max_attempts": 5,
+    "min_wait": 2.0,
+    "max_wait": 120.0,
+    "multiplier": 3.0,
+    "retry_on_timeout": False,
+    "retry_on_connection_error": True,
+    "retry_on_rate_limit": False,
+}
+
 
 class TestWithRetry:
     """Tests for with_retry decorator."""
@@ -124,6 +145,90 @@ class TestWithRetry:
         assert call_count == 2
 
 
+class TestBackoffJitter:
+    """Tests for jittered backoff delays."""
+
+    @pytest.mark.parametrize(
+        "decorate",
+        [
+            pytest.param(
+                lambda sleeper: with_retry(
+                    max_attempts=3, min_wait=0, max_wait=8, sleeper=sleeper
+                ),
+                id="with_retry",
+            ),
+            pytest.param(
+                lambda sleeper: retry_on_rate_limit(
+                    max_attempts=3, min_wait=1, max_wait=8, sleeper=sleeper
+                ),
+                id="retry_on_rate_limit",
+            ),
+        ],
+    )
+    def test_first_retry_delays_vary_between_callers(self, decorate):
+        """Callers failing together don't all wait the same before retrying."""
+        random.seed(0)
+        delays = []
+
+        for _ in range(100):
+            send = MagicMock(side_effect=[TimeoutError("429"), "ok"])
+            decorate(delays.append)(send)()
+
+        assert len(delays) == 100
+        assert statistics.pvariance(delays) > 0
+        assert all(0 <= delay <= 8 for delay in delays)
+
+
+class TestWithRetryAsync:
+    """Tests for with_retry_async decorator."""
+
+    @pytest.mark.asyncio
+    async def test_awaits_sleeper_between_attempts(self):
+        """Backoff delays are awaited through the sleeper."""
+        delays = []
+        call_count = 0
+
+        async def record(delay):
+            delays.append(delay)
+
+        @with_retry_async(max_attempts=3, multiplier=1.0, sleeper=record)
+        async def fails_twice():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
+                raise TimeoutError()
+            return "success"
+
+        result = await fails_twice()
+
+        assert result == "success"
+        assert len(delays) == 2
+        assert delays[0] == 1.0  # [min_wait, 1.0]
+        assert 1.0 <= delays[1] <= 2.0
+
+    @pytest.mark.asyncio
+    async def test_raises_after_max_attempts(self):
+        """Last error is re-raised once attempts run out."""
+
+        async def no_sleep(delay):
+            pass
+
+        @with_retry_async(max_attempts=2, sleeper=no_sleep)
+        async def always_fails():
+            raise ConnectionError()
+
+        with pytest.raises(ConnectionError):
+            await always_fails()
+
+    def test_rejects_sync_function(self):
+        """Only coroutine functions can be decorated."""
+        with pytest.raises(TypeError, match="coroutine function"):
+
+            @with_retry_async()
+            def not_async():
+                return None
+
+
 class TestRetryOnRateLimit:
     """Tests for retry_on_rate_limit decorator."""
 
@@ -176,41 +281,103 @@ class TestRetryOnRateLimit:
 
         assert call_count == 1
 
+    def test_retry_honors_retry_after_header(self):
+        """Sleeps for the server's Retry-After instead of the backoff."""
+        error = Exception("Error 429: Too Many Requests")
+        error.response = SimpleNamespace(headers={"Retry-After": "7"})
+        sleeper = MagicMock()
+        send = MagicMock(side_effect=[error, "success"])
 
-class TestRetryConfig:
-    """Tests for RetryConfig class."""
+        result = retry_on_rate_limit(min_wait=1.0, sleeper=sleeper)(send)()
 
-    def test_default_values(self):
-        """RetryConfig has sensible defaults."""
-        config = RetryConfig()
+        assert result == "success"
+        sleeper.assert_called_once_with(7.0)
+
+    @pytest.mark.parametrize(
+        "retry_after",
+        [
+            pytest.param("86400", id="seconds"),
+            pytest.param("Fri, 31 Dec 9999 23:59:59 GMT", id="far-future-date"),
+        ],
+    )
+    def test_retry_after_is_capped_at_max_wait(self, retry_after):
+        """An oversized Retry-After never sleeps past max_wait."""
+        error = Exception("Error 429: Too Many Requests")
+        error.response = SimpleNamespace(headers={"Retry-After": retry_after})
+        sleeper = MagicMock()
+        send = MagicMock(side_effect=[error, "success"])
+
+        result = retry_on_rate_limit(max_wait=30.0, sleeper=sleeper)(send)()
+
+        assert result == "success"
+        sleeper.assert_called_once_with(30.0)
 
-        assert config.max_attempts == 3
-        assert config.min_wait == 1.0
-        assert config.max_wait == 60.0
-        assert config.multiplier == 2.0
-        assert config.retry_on_timeout is True
-        assert config.retry_on_connection_error is True
-        assert config.retry_on_rate_limit is True
-
-    def test_custom_values(self):
-        """Can customize RetryConfig values."""
-        config = RetryConfig(
-            max_attempts=5,
-            min_wait=2.0,
-            max_wait=120.0,
-            multiplier=3.0,
-            retry_on_timeout=False,
-            retry_on_connection_error=True,
-            retry_on_rate_limit=False,
-        )
 
-        assert config.max_attempts == 5
-        assert config.min_wait == 2.0
-        assert config.max_wait == 120.0
-        assert config.multiplier == 3.0
-        assert config.retry_on_timeout is False
-        assert config.retry_on_connection_error is True
-        assert config.retry_on_rate_limit is False
+class TestParseRetryAfter:
+    """Tests for parse_retry_after."""
+
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        [
+            pytest.param({"Retry-After": "3"}, 3.0, id="seconds"),
+            pytest.param({"retry-after": "0.5"}, 0.5, id="lowercase"),
+            pytest.param(
+                {"retry-after-ms": "1500", "Retry-After": "2"}, 1.5, id="milliseconds"
+            ),
+            pytest.param({"Retry-After": "-4"}, 0.0, id="negative"),
+            pytest.param({"Retry-After": "soon"}, None, id="unparseable"),
+            pytest.param({}, None, id="missing"),
+        ],
+    )
+    def test_header_values(self, headers, expected):
+        """Reads seconds and milliseconds headers."""
+        error = Exception("429")
+        error.response = SimpleNamespace(headers=headers)
+
+        assert parse_retry_after(error) == expected
+
+    def test_http_date(self):
+        """An HTTP date becomes the seconds remaining until then."""
+        retry_at = datetime.now(UTC) + timedelta(seconds=30)
+        error = Exception("429")
+        error.response = SimpleNamespace(headers={"Retry-After": format_datetime(retry_at)})
+
+        assert 25 <= parse_retry_after(error) <= 30
+
+    def test_no_response(self):
+        """Errors without a response have no Retry-After."""
+        assert parse_retry_after(Exception("429")) is None
+
+
+class TestRetryConfig:
+    """Tests for RetryConfig class."""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            # Sensible defaults
+            pytest.param(
+                {},
+                {
+                    "max_attempts": 3,
+                    "min_wait": 1.0,
+                    "max_wait": 60.0,
+                    "multiplier": 2.0,
+                    "retry_on_timeout": True,
+                    "retry_on_connection_error": True,
+                    "retry_on_rate_limit": True,
+                },
+                id="defaults",
+            ),
+            pytest.param(_CUSTOM_RETRY, _CUSTOM_RETRY, id="custom"),
+        ],
+    )
+    def test_config_values(self, kwargs, expected):
+        """RetryConfig has sensible defaults and accepts custom values."""
+        config = RetryConfig(**kwargs)
+
+        for name, value in expected.items():
+            assert getattr(config, name) == value, name
 
     def test_should_retry_timeout(self):
         """should_retry returns True for TimeoutError when enabled."""
@@ -239,6 +406,48 @@ class TestRetryConfig:
         config_disabled = RetryConfig(retry_on_rate_limit=False)
         assert config_disabled.should_retry(Exception("Rate limit exceeded")) is False
 
+    @pytest.mark.parametrize(
+        ("message", "expected"),
+        [
+            pytest.param("rate_limit_exceeded", True, id="error-code"),
+            pytest.param("Rate exceeded", True, id="rate-exceeded"),
+            pytest.param("status_code=429", True, id="status-code"),
+            pytest.param("TOO MANY REQUESTS", True, id="uppercase"),
+            pytest.param("You have exceeded your quota", False, id="quota"),
+            pytest.param("Request id 14290 failed", False, id="429-in-number"),
+        ],
+    )
+    def test_rate_limit_classifier(self, message, expected):
+        """Rate limit wording is matched case-insensitively, 429 as a whole number."""
+        config = RetryConfig(retry_on_rate_limit=True)
+
+        assert config.should_retry(Exception(message)) is expected
+
+    def test_should_retry_uses_status_code_before_message(self):
+        """SDK errors with status_code 429 match without reading the message."""
+
+        class StatusError(Exception):
+            status_code = 429
+
+            def __str__(self):
+                raise AssertionError("message should not be rendered")
+
+        config = RetryConfig(retry_on_rate_limit=True)
+
+        assert config.should_retry(StatusError()) is True
+
+    def test_should_retry_does_not_render_disabled_checks(self):
+        """The message is not rendered when rate-limit retries are off."""
+
+        class UnrenderableError(Exception):
+            def __str__(self):
+                raise AssertionError("message should not be rendered")
+
+        config = RetryConfig(retry_on_rate_limit=False)
+
+        assert config.should_retry(TimeoutError()) is True
+        assert config.should_retry(UnrenderableError()) is False
+
     def test_should_retry_non_retryable(self):
         """should_retry returns False for non-retryable exceptions."""
         config = RetryConfig()
@@ -266,6 +475,39 @@ class TestRetryConfig:
         assert result == "success"
         assert call_count == 2
 
+    def test_get_retry_decorator_reuses_controller(self):
+        """Decorated functions share one tenacity controller until settings change."""
+        config = RetryConfig(max_attempts=2)
+
+        first = config.get_retry_decorator()(lambda: "a")
+        second = config.get_retry_decorator()(lambda: "b")
+
+        assert first.retry is second.retry
+        assert (first(), second()) == ("a", "b")
+
+        config.max_attempts = 4
+        third = config.get_retry_decorator()(lambda: "c")
+
+        assert third.retry is not first.retry
+        assert third.retry.stop.max_attempt_number == 4
+
+    @pytest.mark.asyncio
+    async def test_get_retry_decorator_wraps_coroutines(self):
+        """Coroutine functions are retried with tenacity's async controller."""
+        config = RetryConfig(max_attempts=2, min_wait=0, max_wait=0)
+        call_count = 0
+
+        @config.get_retry_decorator()
+        async def fails_once():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise TimeoutError()
+            return "success"
+
+        assert await fails_once() == "success"
+        assert call_count == 2
+
 
 class TestDefaultRetryConfig:
     """Tests for DEFAULT_RETRY_CONFIG."""
@@ -274,3 +516,164 @@ class TestDefaultRetryConfig:
         """DEFAULT_RETRY_CONFIG is a valid RetryConfig."""
         assert isinstance(DEFAULT_RETRY_CONFIG, RetryConfig)
         assert DEFAULT_RETRY_CONFIG.max_attempts == 3
+
+
+class _FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _failing():
+    raise TimeoutError()
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_threshold_and_fails_fast(self):
+        """After the threshold, calls raise CircuitOpenError without running."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=5.0, clock=_FakeClock())
+        for _ in range(2):
+            with pytest.raises(TimeoutError):
+                breaker.call(_failing)
+
+        calls = []
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.call(calls.append, 1)
+
+        assert calls == []
+        assert breaker.state == "open"
+        assert exc_info.value.retry_after == 5.0
+
+    def test_success_resets_failure_count(self):
+        """A success clears consecutive failures."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=_FakeClock())
+        with pytest.raises(TimeoutError):
+            breaker.call(_failing)
+
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.failure_count == 0
+        assert breaker.state == "closed"
+
+    @pytest.mark.parametrize(
+        ("trial", "expected_state"),
+        [
+            pytest.param(lambda: "ok", "closed", id="trial-succeeds"),
+            pytest.param(_failing, "open", id="trial-fails"),
+        ],
+    )
+    def test_half_open_trial(self, trial, expected_state):
+        """After reset_timeout one trial call decides the next state."""
+        clock = _FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5.0, clock=clock)
+        with pytest.raises(TimeoutError):
+            breaker.call(_failing)
+
+        clock.now = 5.0
+        assert breaker.state == "half_open"
+        with contextlib.suppress(TimeoutError):
+            breaker.call(trial)
+
+        assert breaker.state == expected_state
+
+    def test_rejects_calls_while_trial_in_flight(self):
+        """Extra half-open calls are rejected without a made-up resume time."""
+        clock = _FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5.0, clock=clock)
+        with pytest.raises(TimeoutError):
+            breaker.call(_failing)
+        clock.now = 5.0
+
+        def trial():
+            with pytest.raises(CircuitOpenError) as exc_info:
+                breaker.call(lambda: "second")
+            return exc_info.value
+
+        error = breaker.call(trial)
+
+        assert error.retry_after is None
+        assert "half-open" in str(error)
+        assert breaker.state == "closed"
+
+    def test_interrupted_trial_releases_slot(self):
+        """A trial that never finishes does not leave the breaker stuck."""
+        clock = _FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5.0, clock=clock)
+        with pytest.raises(TimeoutError):
+            breaker.call(_failing)
+        clock.now = 5.0
+
+        def interrupted():
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            breaker.call(interrupted)
+
+        assert breaker.state == "half_open"
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_async_trial_releases_slot(self):
+        """A half-open trial cancelled by wait_for lets the next trial run."""
+        clock = _FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5.0, clock=clock)
+        attempts = 0
+
+        async def no_sleep(delay):
+            pass
+
+        @with_retry_async(max_attempts=1, circuit_breaker=breaker, sleeper=no_sleep)
+        async def call_api(hang):
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise TimeoutError()
+            if hang:
+                await asyncio.Event().wait()
+            return "ok"
+
+        with pytest.raises(TimeoutError):
+            await call_api(hang=False)
+        clock.now = 5.0
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(call_api(hang=True), timeout=0.01)
+
+        assert await call_api(hang=False) == "ok"
+        assert breaker.state == "closed"
+
+    def test_with_retry_stops_once_open(self):
+        """with_retry fails fast once the breaker opens mid-retry."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=_FakeClock())
+        call_count = 0
+
+        @with_retry(max_attempts=5, min_wait=0, max_wait=0, circuit_breaker=breaker)
+        def always_times_out():
+            nonlocal call_count
+            call_count += 1
+            raise TimeoutError()
+
+        with pytest.raises(CircuitOpenError):
+            always_times_out()
+
+        assert call_count == 2
+
+    def test_retry_config_passes_breaker(self):
+        """RetryConfig threads its breaker into the decorator."""
+        breaker = CircuitBreaker(failure_threshold=1, clock=_FakeClock())
+        config = RetryConfig(max_attempts=3, min_wait=0, max_wait=0, circuit_breaker=breaker)
+
+        @config.get_retry_decorator()
+        def always_times_out():
+            raise TimeoutError()
+
+        with pytest.raises(CircuitOpenError):
+            always_times_out()
+
+        assert breaker.state == "open"
@@ -7,8 +7,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from forge_llm.domain.entities import ChatMessage
-from forge_llm.domain.value_objects import ChatResponse, ResponseMetadata, TokenUsage
+from forge_llm.domain.value_objects import ChatResponse, TokenUsage
 
 
 class TestChatResponseFromOpenAI:
@@ -175,6 +174,12 @@ class TestTokenUsage:
         assert usage.completion_tokens == 40
         assert usage.total_tokens == 120
 
+    def test_from_dict(self):
+        """Creates TokenUsage from a provider usage dict, defaulting missing counts."""
+        usage = TokenUsage.from_dict({"prompt_tokens": 7, "completion_tokens": 3})
+
+        assert usage == TokenUsage(7, 3, 0)
+
     def test_zero_usage(self):
         """Creates zero TokenUsage."""
         usage = TokenUsage.zero()
@@ -3,13 +3,13 @@ Tests for streaming edge cases and unusual scenarios.
 
 Tests error handling, interrupted streams, empty chunks, and boundary conditions.
 """
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
 from forge_llm import ChatAgent, ChatSession
 from forge_llm.application.tools import ToolRegistry
-from forge_llm.domain.entities import ChatChunk, ProviderConfig
+from forge_llm.domain.entities import ChatChunk
 
 
 class TestStreamInterruption:
@@ -5,10 +5,7 @@ TDD tests for getting token usage after streaming.
 """
 from unittest.mock import MagicMock
 
-import pytest
-
 from forge_llm.application.agents.chat_agent import ChatAgent
-from forge_llm.domain.entities import ChatMessage
 
 
 class TestStreamingTokens:
@@ -5,13 +5,11 @@ Tests tool call handling during streaming for OpenAI and Anthropic adapters,
 and auto-execution in ChatAgent.stream_chat().
 """
 import json
-from unittest.mock import MagicMock, patch
-
-import pytest
+from unittest.mock import MagicMock
 
 from forge_llm.application.agents import ChatAgent
 from forge_llm.application.tools import ToolRegistry
-from forge_llm.domain.entities import ProviderConfig, ToolDefinition
+from forge_llm.domain.entities import ProviderConfig
 
 
 class TestOpenAIAdapterStreamWithTools:
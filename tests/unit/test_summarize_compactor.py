@@ -371,6 +371,15 @@ My custom prompt: {messages}
         assert "Summarize the following conversation" in compactor._summary_prompt
 
 
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make the compactor's retry backoff return immediately."""
+    monkeypatch.setattr(
+        "forge_llm.application.session.summarize_compactor.time.sleep",
+        lambda _delay: None,
+    )
+
+
 class TestSummarizeCompactorRetryLogic:
     """Tests for retry logic and error handling."""
 
@@ -384,7 +393,7 @@ class TestSummarizeCompactorRetryLogic:
         assert compactor._max_retries == 5
         assert compactor._retry_delay == 2.0
 
-    def test_retry_on_llm_failure(self):
+    def test_retry_on_llm_failure(self, no_sleep):
         """Should retry on LLM call failure."""
         mock_agent = MagicMock()
         mock_agent.chat.side_effect = [
@@ -394,7 +403,7 @@ class TestSummarizeCompactorRetryLogic:
         ]
 
         compactor = SummarizeCompactor(
-            mock_agent, keep_recent=2, max_retries=3, retry_delay=0.01
+            mock_agent, keep_recent=2, max_retries=3, retry_delay=0
         )
 
         messages = [
@@ -414,13 +423,13 @@ class TestSummarizeCompactorRetryLogic:
         ]
         assert len(summary_msgs) == 1
 
-    def test_fallback_truncate_after_all_retries_fail(self):
+    def test_fallback_truncate_after_all_retries_fail(self, no_sleep):
         """Should fallback to truncation when all retries fail."""
         mock_agent = MagicMock()
         mock_agent.chat.side_effect = Exception("API always fails")
 
         compactor = SummarizeCompactor(
-            mock_agent, keep_recent=2, max_retries=2, retry_delay=0.01
+            mock_agent, keep_recent=2, max_retries=2, retry_delay=0
         )
 
         messages = [
@@ -441,7 +450,7 @@ class TestSummarizeCompactorRetryLogic:
         ]
         assert len(summary_msgs) == 0
 
-    def test_retry_on_empty_response(self):
+    def test_retry_on_empty_response(self, no_sleep):
         """Should retry when LLM returns empty response."""
         mock_agent = MagicMock()
         mock_agent.chat.side_effect = [
@@ -451,7 +460,7 @@ class TestSummarizeCompactorRetryLogic:
         ]
 
         compactor = SummarizeCompactor(
-            mock_agent, keep_recent=2, max_retries=3, retry_delay=0.01
+            mock_agent, keep_recent=2, max_retries=3, retry_delay=0
         )
 
         messages = [
@@ -514,3 +523,31 @@ class TestSummarizeCompactorFallbackTruncate:
 
         system_msgs = [m for m in result if m.role == "system"]
         assert len(system_msgs) == 2
+
+    @pytest.mark.parametrize(
+        ("messages", "expected"),
+        [
+            pytest.param(
+                [
+                    ChatMessage.user("a" * 40),
+                    ChatMessage.system("Mid"),
+                    ChatMessage.user("b" * 40),
+                    ChatMessage.assistant("c" * 40),
+                ],
+                ["Mid", "c" * 40],
+                id="system-kept-in-place",
+            ),
+            pytest.param(
+                [ChatMessage.user("a" * 80), ChatMessage.user("b" * 80)],
+                ["b" * 80],
+                id="last-message-kept",
+            ),
+        ],
+    )
+    def test_fallback_truncate_drops_oldest_in_order(self, messages, expected):
+        """Oldest non-system messages go first; survivors keep their order."""
+        compactor = SummarizeCompactor(MagicMock())
+
+        result = compactor._fallback_truncate(messages, target_tokens=30)
+
+        assert [m.content for m in result] == expected
@@ -5,11 +5,9 @@ Tests multiple tool calls, sequential dependencies, and complex workflows.
 """
 from unittest.mock import MagicMock, patch
 
-import pytest
-
 from forge_llm import ChatAgent, ChatSession
 from forge_llm.application.tools import ToolRegistry
-from forge_llm.domain.entities import ToolCall, ToolDefinition
+from forge_llm.domain.entities import ToolCall
 
 
 class TestMultipleToolCalls:
@@ -3,7 +3,6 @@ Unit tests for Tool entities (VT-02).
 
 TDD tests for ToolDefinition, ToolCall, and ToolResult.
 """
-import pytest
 
 from forge_llm.domain.entities import ToolCall, ToolDefinition, ToolResult
 
@@ -129,6 +128,18 @@ class TestToolCall:
         assert call.name == "get_weather"
         assert call.arguments["location"] == "Paris"
 
+    def test_tool_call_from_openai_invalid_arguments(self):
+        """Malformed JSON arguments parse as an empty dict."""
+        openai_tool_call = {
+            "id": "call_bad",
+            "type": "function",
+            "function": {"name": "get_weather", "arguments": '{"location": '},
+        }
+
+        call = ToolCall.from_openai(openai_tool_call)
+
+        assert call.arguments == {}
+
     def test_tool_call_from_anthropic(self):
         """Can parse from Anthropic response format."""
         anthropic_tool_use = {
@@ -3,9 +3,11 @@ Unit tests for Tool Registry (VT-02).
 
 TDD tests for IToolPort and ToolRegistry.
 """
-from typing import Protocol, runtime_checkable
-
-import pytest
+import functools
+import gc
+import inspect
+import weakref
+from typing import Protocol
 
 from forge_llm.application.ports import IToolPort
 from forge_llm.application.tools import ToolRegistry
@@ -82,6 +84,86 @@ class TestToolRegistry:
         registry.register_callable(get_weather)
         assert registry.has("get_weather")
 
+    def test_register_callable_reuses_introspection(self, monkeypatch):
+        """Registering a function again skips introspection but not the copy."""
+        built = []
+        from_callable = ToolDefinition.from_callable
+
+        def counting_from_callable(func):
+            built.append(func)
+            return from_callable(func)
+
+        monkeypatch.setattr(ToolDefinition, "from_callable", counting_from_callable)
+        first, second = ToolRegistry(), ToolRegistry()
+
+        def get_weather(location: str) -> str:
+            """Get weather for a location."""
+            return f"Weather in {location}: sunny"
+
+        first.register_callable(get_weather)
+        second.register_callable(get_weather)
+
+        assert built == [get_weather]
+        first_def = first.get_definitions()[0]
+        second_def = second.get_definitions()[0]
+        assert first_def == second_def
+        assert first_def is not second_def
+        first_def.parameters["required"].clear()
+        assert second_def.parameters["required"] == ["location"]
+
+    def test_registered_function_is_not_kept_alive(self):
+        """The introspection cache does not outlive the function."""
+        registry = ToolRegistry()
+        captured = [1, 2, 3]
+
+        def count_items() -> int:
+            """Count captured items."""
+            return len(captured)
+
+        registry.register_callable(count_items)
+        func_ref = weakref.ref(count_items)
+        registry.clear()
+        del count_items
+        gc.collect()
+
+        assert func_ref() is None
+
+    def test_register_unhashable_callable(self):
+        """Callables that cannot be hashed still register."""
+
+        class Echo:
+            """Echo the text back."""
+
+            __name__ = "echo"
+            __hash__ = None
+
+            def __call__(self, text: str) -> str:
+                return text
+
+        registry = ToolRegistry()
+        registry.register_callable(Echo())
+
+        result = registry.execute(ToolCall(id="c1", name="echo", arguments={"text": "hi"}))
+        assert result.content == "hi"
+
+    def test_wrapper_does_not_reuse_wrapped_definition(self):
+        """functools.wraps copies attributes, not the wrapped function's cache."""
+        registry = ToolRegistry()
+
+        def shout(text: str) -> str:
+            """Shout the text."""
+            return text.upper()
+
+        registry.register_callable(shout)
+
+        @functools.wraps(shout, assigned=())
+        def whisper(text: str) -> str:
+            return text.lower()
+
+        registry.register_callable(whisper)
+
+        assert registry.list_tools() == ["shout", "whisper"]
+
     def test_get_tool(self):
         """Can get registered tool."""
         registry = ToolRegistry()
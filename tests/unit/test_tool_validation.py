@@ -3,10 +3,9 @@ Unit tests for tool argument validation (tools.feature).
 
 TDD tests for validating tool call arguments.
 """
-import pytest
 
 from forge_llm.application.tools import ToolRegistry
-from forge_llm.domain.entities import ToolCall, ToolDefinition, ToolResult
+from forge_llm.domain.entities import ToolCall
 
 
 class TestToolArgumentValidation: